@@ -5,9 +5,10 @@ This module provides the Click-based command-line interface for sqlitch,
 including global options, command discovery, and command execution.
 """
 
+import importlib
 import sys
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import click
 
@@ -37,7 +38,73 @@ class CliContext:
         return self.sqitch
 
 
-@click.group(invoke_without_command=True)
+class LazyGroup(click.Group):
+    """
+    Click group that imports command modules on first use.
+
+    Command modules pull in engines, templates and other heavy
+    dependencies, so they are only imported when the command is invoked
+    (or listed, e.g. for ``--help``). Commands whose modules cannot be
+    imported are treated as unavailable.
+    """
+
+    def __init__(
+        self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs
+    ) -> None:
+        """
+        Initialize group.
+
+        Args:
+            lazy_commands: Mapping of command name to 'module:attribute'
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, str] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eagerly registered and lazy command names."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a command, importing its module if needed."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load_command(cmd_name)
+        return command
+
+    def _load_command(self, cmd_name: str) -> Optional[click.Command]:
+        """Import a lazy command and register it on the group."""
+        module_name, attr_name = self.lazy_commands[cmd_name].split(":", 1)
+        try:
+            module = importlib.import_module(module_name, package=__package__)
+        except ImportError:
+            return None  # Command not available
+
+        command = getattr(module, attr_name)
+        self.add_command(command, name=cmd_name)
+        return command
+
+
+# Command name to 'module:attribute', imported on first use
+LAZY_COMMANDS: Dict[str, str] = {
+    "init": ".commands.init:init_command",
+    "deploy": ".commands.deploy:deploy_command",
+    "revert": ".commands.revert:revert_command",
+    "verify": ".commands.verify:verify_command",
+    "status": ".commands.status:status_command",
+    "add": ".commands.add:add_command",
+    "log": ".commands.log:log_command",
+    "tag": ".commands.tag:tag_command",
+    "bundle": ".commands.bundle:bundle_command",
+    "checkout": ".commands.checkout:checkout_command",
+    "rebase": ".commands.rebase:rebase_command",
+    "show": ".commands.show:show_command",
+    "config": ".commands.config:config_command",
+    "serve": ".commands.serve:serve_command",
+    "registry": ".commands.registry:registry_command",
+}
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS, invoke_without_command=True)
 @click.option(
     "--config",
     "-c",
@@ -54,9 +121,26 @@ class CliContext:
 @click.option(
     "--quiet", "-q", count=True, help="Decrease verbosity (can be used multiple times)"
 )
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile the command and print the slowest functions to stderr",
+)
+@click.option(
+    "--profile-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write pstats profile data to FILE (implies --profile)",
+)
 @click.version_option(version="1.0.0", prog_name="sqlitch")
 @click.pass_context
-def cli(ctx: click.Context, config: Tuple[Path, ...], verbose: int, quiet: int) -> None:
+def cli(
+    ctx: click.Context,
+    config: Tuple[Path, ...],
+    verbose: int,
+    quiet: int,
+    profile: bool,
+    profile_file: Optional[str],
+) -> None:
     """
     Sqlitch database change management.
 
@@ -72,107 +156,19 @@ def cli(ctx: click.Context, config: Tuple[Path, ...], verbose: int, quiet: int)
     ctx.ensure_object(dict)
     ctx.obj = cli_ctx
 
+    # Profile the subcommand; the profiler reports when the context closes
+    if (profile or profile_file) and ctx.invoked_subcommand is not None:
+        from .utils.profiling import CommandProfiler
+
+        profiler = CommandProfiler(output=Path(profile_file) if profile_file else None)
+        profiler.start()
+        ctx.call_on_close(profiler.stop)
+
     # If no command specified, show help
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help())
 
 
-# Register commands immediately
-try:
-    from .commands.init import init_command
-
-    cli.add_command(init_command, name="init")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.deploy import deploy_command
-
-    cli.add_command(deploy_command, name="deploy")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.revert import revert_command
-
-    cli.add_command(revert_command, name="revert")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.verify import verify_command
-
-    cli.add_command(verify_command, name="verify")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.status import status_command
-
-    cli.add_command(status_command, name="status")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.add import add_command
-
-    cli.add_command(add_command, name="add")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.log import log_command
-
-    cli.add_command(log_command, name="log")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.tag import tag_command
-
-    cli.add_command(tag_command, name="tag")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.bundle import bundle_command
-
-    cli.add_command(bundle_command, name="bundle")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.checkout import checkout_command
-
-    cli.add_command(checkout_command, name="checkout")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.rebase import rebase_command
-
-    cli.add_command(rebase_command, name="rebase")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.show import show_command
-
-    cli.add_command(show_command, name="show")
-except ImportError:
-    pass  # Command not available
-
-try:
-    from .commands.config import config_command
-
-    cli.add_command(config_command, name="config")
-except ImportError:
-    pass  # Command not available
-
-
-# Commands will be registered when CLI is invoked
-
-
 # Error handling
 def handle_sqlitch_error(e: SqlitchError, sqitch: Optional[Sqitch] = None) -> int:
     """Handle SqlitchError and return appropriate exit code."""
@@ -251,7 +247,7 @@ def main() -> int:
     """Main entry point for the CLI."""
     sqitch = None
     try:
-        # Run CLI (commands are already registered at module level)
+        # Run CLI (command modules are imported on demand)
         cli(standalone_mode=False)
         return 0
 
@@ -3,11 +3,15 @@ Add command implementation for sqlitch.
 
 This module implements the 'add' command which adds a new change to the sqlitch plan,
 creating the necessary deploy, revert, and verify script files from templates.
+Many changes can be added in one run from a CSV or JSON manifest.
 """
 
+import csv
+import json
 import re
 import shlex
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -21,6 +25,9 @@ from ..core.types import validate_change_name
 from ..utils.template import TemplateContext, create_template_engine
 from .base import BaseCommand
 
+# Manifest fields describing the change; other fields are template variables
+MANIFEST_FIELDS = ("name", "requires", "conflicts", "note")
+
 
 class AddCommand(BaseCommand):
     """Add a new change to sqlitch plans."""
@@ -45,6 +52,11 @@ class AddCommand(BaseCommand):
             # Parse arguments
             change_name, options = self._parse_args(args)
 
+            if options["from_file"]:
+                if change_name:
+                    raise SqlitchError("Cannot specify a change name with --from-file")
+                return self._add_from_manifest(options)
+
             if not change_name:
                 raise SqlitchError("Change name is required")
 
@@ -94,6 +106,150 @@ class AddCommand(BaseCommand):
             self.error(f"Failed to add change: {e}")
             return 1
 
+    def _add_from_manifest(self, options: Dict[str, Any]) -> int:
+        """
+        Add every change listed in a manifest file.
+
+        Each plan is read and written once, and the script files of all
+        changes are rendered concurrently with a single template engine.
+
+        Args:
+            options: Command options
+
+        Returns:
+            Exit code (0 for success)
+        """
+        entries = self._load_manifest(options["from_file"])
+        targets = self._get_targets(options)
+
+        files_created = []
+        for target in targets:
+            plan = Plan.from_file(target.plan_file)
+
+            added = []
+            for entry in entries:
+                if entry["name"] in plan._change_index:
+                    self.warn(f"Change '{entry['name']}' already exists in {plan.file}")
+                    continue
+
+                change_options = self._entry_options(entry, options)
+                change = self._create_change(entry["name"], change_options)
+                plan.add_change(change)
+                added.append((change, change_options))
+
+            if not added:
+                continue
+
+            files_created.extend(self._create_scripts(added, target, options))
+            plan.save()
+
+            for change, _ in added:
+                self.logger.emit(
+                    f"Added '{change.format_name_with_tags()}' to {plan.file}"
+                )
+
+        if options.get("open_editor", False) and files_created:
+            self._open_editor(files_created)
+
+        return 0
+
+    def _load_manifest(self, path: Path) -> List[Dict[str, Any]]:
+        """
+        Load change entries from a CSV or JSON manifest.
+
+        CSV manifests have a header row; JSON manifests hold a list of
+        objects. Each entry needs a ``name``; ``requires`` and ``conflicts``
+        are lists (or whitespace-separated strings), ``note`` is a string,
+        and any other field is passed to the templates as a variable.
+
+        Args:
+            path: Manifest file path
+
+        Returns:
+            List of entries with name, requires, conflicts, note and variables
+
+        Raises:
+            SqlitchError: If the manifest cannot be read or is invalid
+        """
+        suffix = path.suffix.lower()
+        try:
+            with open(path, encoding="utf-8", newline="") as f:
+                if suffix == ".csv":
+                    records: Any = list(csv.DictReader(f))
+                elif suffix == ".json":
+                    records = json.load(f)
+                else:
+                    raise SqlitchError(
+                        f"Unsupported manifest format: {path} (expected .csv or .json)"
+                    )
+        except (OSError, ValueError, csv.Error) as e:
+            raise SqlitchError(f"Cannot read manifest {path}: {e}")
+
+        if not isinstance(records, list):
+            raise SqlitchError(f"Manifest {path} must contain a list of changes")
+
+        entries = []
+        seen = set()
+        for number, record in enumerate(records, 1):
+            if not isinstance(record, dict) or not record.get("name"):
+                raise SqlitchError(f"Manifest {path}: entry {number} has no name")
+
+            name = str(record["name"]).strip()
+            validate_change_name(name)
+            if name in seen:
+                raise SqlitchError(
+                    f"Manifest {path}: change '{name}' is listed more than once"
+                )
+            seen.add(name)
+
+            entries.append(
+                {
+                    "name": name,
+                    "requires": self._manifest_list(record.get("requires")),
+                    "conflicts": self._manifest_list(record.get("conflicts")),
+                    "note": str(record.get("note") or ""),
+                    "variables": {
+                        key: "" if value is None else str(value)
+                        for key, value in record.items()
+                        if key not in MANIFEST_FIELDS
+                    },
+                }
+            )
+
+        return entries
+
+    def _manifest_list(self, value: Any) -> List[str]:
+        """Normalize a manifest list field."""
+        if not value:
+            return []
+        if isinstance(value, str):
+            return value.split()
+        return [str(item) for item in value]
+
+    def _entry_options(
+        self, entry: Dict[str, Any], options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Combine command options with a manifest entry.
+
+        Dependencies from the command line apply to every entry, and entry
+        variables override those set with --set.
+
+        Args:
+            entry: Manifest entry
+            options: Command options
+
+        Returns:
+            Options for the entry's change
+        """
+        return {
+            **options,
+            "requires": options["requires"] + entry["requires"],
+            "conflicts": options["conflicts"] + entry["conflicts"],
+            "note": [entry["note"]] if entry["note"] else options["note"],
+            "variables": {**options["variables"], **entry["variables"]},
+        }
+
     def _parse_args(
         self, args: List[str]
     ) -> Tuple[Optional[str], Dict[str, Any]]:  # noqa: C901
@@ -116,6 +272,7 @@ class AddCommand(BaseCommand):
             "with_scripts": {"deploy": True, "revert": True, "verify": True},
             "variables": {},
             "open_editor": False,
+            "from_file": None,
         }
 
         change_name = None
@@ -188,6 +345,11 @@ class AddCommand(BaseCommand):
                 key, value = var_assignment.split("=", 1)
                 options["variables"][key] = value
                 i += 1
+            elif arg == "--from-file":
+                if i + 1 >= len(args):
+                    raise SqlitchError(f"Option {arg} requires a value")
+                options["from_file"] = Path(args[i + 1])
+                i += 2
             elif arg in ("-e", "--edit", "--open-editor"):
                 options["open_editor"] = True
                 i += 1
@@ -301,7 +463,28 @@ class AddCommand(BaseCommand):
         Returns:
             List of created file paths
         """
-        created_files = []
+        return self._create_scripts([(change, options)], target, options)
+
+    def _create_scripts(
+        self,
+        changes: List[Tuple[Change, Dict[str, Any]]],
+        target: Any,
+        options: Dict[str, Any],
+    ) -> List[Path]:
+        """
+        Create script files for several changes.
+
+        All scripts are rendered with one template engine; when there is
+        more than one change they are rendered and written concurrently.
+
+        Args:
+            changes: Pairs of (change, change options with its variables)
+            target: Target configuration
+            options: Command options (templates and script types)
+
+        Returns:
+            List of created file paths
+        """
         with_scripts = options.get("with_scripts", {})
 
         # Get template engine
@@ -314,66 +497,90 @@ class AddCommand(BaseCommand):
         # Get template name (engine type or custom)
         template_name = options.get("template_name") or target.engine
 
-        # Create template context
-        context = TemplateContext(
-            project=target.plan.project,
-            change=change.name,
-            engine=target.engine,
-            requires=[
-                dep.change for dep in change.dependencies if dep.type == "require"
-            ],
-            conflicts=[
-                dep.change for dep in change.dependencies if dep.type == "conflict"
-            ],
-        )
-
-        # Add custom variables
-        context_dict = context.to_dict()
-        context_dict.update(options.get("variables", {}))
+        # Collect the scripts to render
+        jobs = []
+        for change, change_options in changes:
+            context = TemplateContext(
+                project=target.plan.project,
+                change=change.name,
+                engine=target.engine,
+                requires=[
+                    dep.change for dep in change.dependencies if dep.type == "require"
+                ],
+                conflicts=[
+                    dep.change for dep in change.dependencies if dep.type == "conflict"
+                ],
+                variables=change_options.get("variables", {}),
+            )
+
+            for script_type in ["deploy", "revert", "verify"]:
+                if not with_scripts.get(script_type, True):
+                    continue
 
-        # Create each script type
-        for script_type in ["deploy", "revert", "verify"]:
-            if not with_scripts.get(script_type, True):
-                continue
+                # Get file path
+                if script_type == "deploy":
+                    file_path = change.deploy_file(target)
+                elif script_type == "revert":
+                    file_path = change.revert_file(target)
+                else:  # verify
+                    file_path = change.verify_file(target)
+
+                # Skip if file already exists
+                if file_path.exists():
+                    self.logger.emit(f"Skipped {file_path}: already exists")
+                    continue
 
-            # Get file path
-            if script_type == "deploy":
-                file_path = change.deploy_file(target)
-            elif script_type == "revert":
-                file_path = change.revert_file(target)
-            else:  # verify
-                file_path = change.verify_file(target)
-
-            # Skip if file already exists
-            if file_path.exists():
-                self.logger.emit(f"Skipped {file_path}: already exists")
-                continue
+                template_path = f"{script_type}/{template_name}.tmpl"
+                jobs.append((template_engine, template_path, context, file_path))
 
-            # Create directory if needed
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        if len(changes) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(jobs) or 1)) as executor:
+                futures = [executor.submit(self._write_script, *job) for job in jobs]
+                for future in futures:
+                    future.result()
+        else:
+            for job in jobs:
+                self._write_script(*job)
 
-            # Get template path
-            template_path = f"{script_type}/{template_name}.tmpl"
+        created_files = []
+        for _, _, _, file_path in jobs:
+            # Check for double extension warning
+            if self._has_double_extension(file_path):
+                ext = file_path.suffix[1:]  # Remove the dot
+                self.warn(f"File {file_path} has a double extension of {ext}")
 
-            try:
-                # Render template
-                content = template_engine.render_template(template_path, context)
+            self.logger.emit(f"Created {file_path}")
+            created_files.append(file_path)
 
-                # Write file
-                file_path.write_text(content, encoding="utf-8")
+        return created_files
 
-                # Check for double extension warning
-                if self._has_double_extension(file_path):
-                    ext = file_path.suffix[1:]  # Remove the dot
-                    self.warn(f"File {file_path} has a double extension of {ext}")
+    def _write_script(
+        self,
+        template_engine: Any,
+        template_path: str,
+        context: TemplateContext,
+        file_path: Path,
+    ) -> None:
+        """
+        Render a template and write it to a script file.
 
-                self.logger.emit(f"Created {file_path}")
-                created_files.append(file_path)
+        Args:
+            template_engine: Template engine
+            template_path: Template to render
+            context: Template context
+            file_path: Script file to write
 
-            except Exception as e:
-                raise SqlitchError(f"Failed to create {file_path}: {e}")
+        Raises:
+            SqlitchError: If the script cannot be created
+        """
+        try:
+            # Create directory if needed
+            file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        return created_files
+            content = template_engine.render_template(template_path, context)
+            file_path.write_text(content, encoding="utf-8")
+        except Exception as e:
+            raise SqlitchError(f"Failed to create {file_path}: {e}")
 
     def _has_double_extension(self, file_path: Path) -> bool:
         """
@@ -453,6 +660,11 @@ class AddCommand(BaseCommand):
 @click.option(
     "-e", "--edit", "--open-editor", is_flag=True, help="Open files in editor"
 )
+@click.option(
+    "--from-file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Add the changes listed in a CSV or JSON manifest",
+)
 @click.pass_context
 def add_command(
     ctx: click.Context, change_name: Optional[str], **kwargs
@@ -508,6 +720,9 @@ def add_command(
     if kwargs.get("edit"):
         args.append("--open-editor")
 
+    if kwargs.get("from_file"):
+        args.extend(["--from-file", str(kwargs["from_file"])])
+
     exit_code = command.execute(args)
     if exit_code != 0:
         raise click.ClickException(f"Add command failed with exit code {exit_code}")
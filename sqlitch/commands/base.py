@@ -91,6 +91,43 @@ class BaseCommand(ABC):
         target = self.get_target(target_name)
         return self.sqitch.engine_for_target(target)
 
+    def configure_slow_statement_log(self, engine) -> None:
+        """
+        Apply the ``core.slow_statement_ms`` threshold to an engine.
+
+        Args:
+            engine: Engine that will execute change scripts
+        """
+        threshold = self.config.get("core.slow_statement_ms", expected_type=float)
+        if isinstance(threshold, (int, float)) and not isinstance(threshold, bool):
+            engine.set_slow_statement_threshold(float(threshold))
+
+    def report_slow_statements(self, engine) -> None:
+        """
+        Print a summary table of slow statements recorded by an engine.
+
+        Args:
+            engine: Engine that executed change scripts
+        """
+        slow_statements = getattr(engine, "slow_statements", None)
+        if not isinstance(slow_statements, list) or not slow_statements:
+            return
+
+        count = len(slow_statements)
+        self.warn(f"{count} slow statement{'s' if count != 1 else ''}:")
+        rows = [
+            (f"{slow.elapsed_ms:.0f} ms", slow.location, slow.excerpt)
+            for slow in sorted(
+                slow_statements, key=lambda slow: slow.elapsed_ms, reverse=True
+            )
+        ]
+        elapsed_width = max(len(row[0]) for row in rows)
+        location_width = max(len(row[1]) for row in rows)
+        for elapsed, location, excerpt in rows:
+            self.warn(
+                f"  {elapsed:>{elapsed_width}}  {location:<{location_width}}  {excerpt}"
+            )
+
     def info(self, message: str) -> None:
         """Log info message."""
         self.sqitch.info(message)
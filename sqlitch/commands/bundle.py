@@ -3,24 +3,34 @@ Bundle command implementation for sqlitch.
 
 This module implements the 'bundle' command which bundles a sqlitch project
 for distribution by copying configuration, plan files, and change scripts
-to a destination directory.
+to a destination directory, or by streaming them into a compressed archive.
+Files are compared by content hash and only changed files are copied.
 """
 
-import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import click
 
 from ..core.exceptions import SqlitchError
 from ..core.plan import Plan
 from ..core.target import Target
+from ..utils.bundle import (
+    BundleArchiveWriter,
+    BundleDirectory,
+    archive_format,
+    copy_file,
+    file_digest,
+)
 from .base import BaseCommand
 
 
 class BundleCommand(BaseCommand):
     """Bundle sqlitch projects for distribution."""
 
+    # Bundle being written by _bundle_project (None copies files immediately)
+    _writer: Optional[Union[BundleDirectory, BundleArchiveWriter]] = None
+
     def execute(self, args: List[str]) -> int:
         """
         Execute the bundle command.
@@ -67,6 +77,7 @@ class BundleCommand(BaseCommand):
             "all": False,
             "from": None,
             "to": None,
+            "archive": None,
         }
 
         targets = []
@@ -81,6 +92,12 @@ class BundleCommand(BaseCommand):
                     raise SqlitchError(f"Option {arg} requires a value")
                 options["dest_dir"] = Path(args[i + 1])
                 i += 2
+            elif arg == "--archive":
+                if i + 1 >= len(args):
+                    raise SqlitchError(f"Option {arg} requires a value")
+                options["archive"] = Path(args[i + 1])
+                archive_format(options["archive"])
+                i += 2
             elif arg in ("-a", "--all"):
                 options["all"] = True
                 i += 1
@@ -221,10 +238,68 @@ class BundleCommand(BaseCommand):
         Returns:
             Exit code
         """
+        if options.get("archive"):
+            return self._bundle_archive(targets, changes, options)
+
         dest_dir = options["dest_dir"]
 
         self.info(f"Bundling into {dest_dir}")
 
+        self._writer = BundleDirectory(dest_dir)
+        try:
+            self._bundle_targets(targets, changes, options)
+            self._writer.close()
+            self.debug(f"Copied {len(self._writer.copied)} changed files")
+        finally:
+            self._writer = None
+
+        return 0
+
+    def _bundle_archive(
+        self, targets: List[Target], changes: List[str], options: Dict[str, Any]
+    ) -> int:
+        """
+        Bundle the project straight into a compressed archive.
+
+        Args:
+            targets: List of targets to bundle
+            changes: List of change specifications
+            options: Command options
+
+        Returns:
+            Exit code
+        """
+        archive = options["archive"]
+
+        self.info(f"Bundling into {archive}")
+
+        writer = BundleArchiveWriter(archive)
+        self._writer = writer
+        try:
+            self._bundle_targets(targets, changes, {**options, "dest_dir": Path(".")})
+            writer.close()
+        except BaseException:
+            writer.abort()
+            raise
+        finally:
+            self._writer = None
+
+        self.debug(f"Wrote {len(writer.digests)} files to {archive}")
+        return 0
+
+    def _bundle_targets(
+        self, targets: List[Target], changes: List[str], options: Dict[str, Any]
+    ) -> None:
+        """
+        Bundle configuration, plans and scripts for targets.
+
+        Args:
+            targets: List of targets to bundle
+            changes: List of change specifications
+            options: Command options
+        """
+        dest_dir = options["dest_dir"]
+
         # Bundle configuration
         self._bundle_config(dest_dir)
 
@@ -251,8 +326,6 @@ class BundleCommand(BaseCommand):
                 self._bundle_plan(target, dest_dir, from_change, to_change)
                 self._bundle_scripts(target, dest_dir, from_change, to_change)
 
-        return 0
-
     def _bundle_config(self, dest_dir: Path) -> None:
         """
         Bundle configuration file.
@@ -304,9 +377,6 @@ class BundleCommand(BaseCommand):
             to_display = to_change or "@HEAD"
             self.info(f"Writing plan from {from_display} to {to_display}")
 
-            # Create destination directory
-            target_dest_dir.mkdir(parents=True, exist_ok=True)
-
             # Write partial plan
             plan = target.plan
             dest_plan = target_dest_dir / target.plan_file.name
@@ -417,7 +487,11 @@ class BundleCommand(BaseCommand):
 
     def _copy_if_modified(self, src: Path, dest: Path) -> None:
         """
-        Copy file if source is newer than destination.
+        Copy file if its content differs from the destination.
+
+        While a bundle is being written the file is handed to the bundle
+        writer instead, which copies it concurrently when the bundle is
+        closed or streams it into the archive.
 
         Args:
             src: Source file
@@ -426,10 +500,16 @@ class BundleCommand(BaseCommand):
         if not src.exists():
             raise SqlitchError(f"Cannot copy {src}: does not exist")
 
+        if self._writer is not None:
+            self._writer.copy(src, dest)
+            return
+
         # Check if we need to copy
         if dest.exists():
-            # Skip if destination is newer
-            if dest.stat().st_mtime >= src.stat().st_mtime:
+            # Skip if destination already has the same content
+            if dest.stat().st_size == src.stat().st_size and file_digest(
+                dest
+            ) == file_digest(src):
                 return
         else:
             # Create destination directory
@@ -438,7 +518,7 @@ class BundleCommand(BaseCommand):
         self.debug(f"    Copying {src} -> {dest}")
 
         try:
-            shutil.copy2(src, dest)
+            copy_file(src, dest)
         except Exception as e:
             raise SqlitchError(f'Cannot copy "{src}" to "{dest}": {e}')
 
@@ -491,7 +571,10 @@ class BundleCommand(BaseCommand):
 
         # Write to file
         content = "\n".join(lines) + "\n"
-        dest_file.write_text(content, encoding="utf-8")
+        if self._writer is not None:
+            self._writer.write_text(dest_file, content)
+        else:
+            dest_file.write_text(content, encoding="utf-8")
 
     def _find_change_index(
         self, plan: Plan, change_spec: str
@@ -540,6 +623,11 @@ class BundleCommand(BaseCommand):
 @click.option("-a", "--all", is_flag=True, help="Bundle all plans")
 @click.option("--from", "from_change", help="Starting change")
 @click.option("--to", "to_change", help="Ending change")
+@click.option(
+    "--archive",
+    type=click.Path(dir_okay=False),
+    help="Write the bundle to a .tar.gz, .tar.zst or .zip archive",
+)
 @click.argument("targets", nargs=-1)
 @click.pass_context
 def bundle_command(
@@ -548,6 +636,7 @@ def bundle_command(
     all: bool,
     from_change: Optional[str],
     to_change: Optional[str],
+    archive: Optional[str],
     targets: Tuple[str, ...],
 ) -> None:
     """Bundle sqlitch project for distribution."""
@@ -571,6 +660,9 @@ def bundle_command(
     if to_change:
         args.extend(["--to", to_change])
 
+    if archive:
+        args.extend(["--archive", archive])
+
     # Add target arguments
     args.extend(targets)
 
@@ -6,6 +6,7 @@ checks out a VCS branch, and redeploys changes from the new branch.
 """
 
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -14,7 +15,7 @@ import click
 from ..core.change import Change
 from ..core.exceptions import PlanError, SqlitchError
 from ..core.plan import Plan
-from ..utils.git import VCSError
+from ..utils.git import GitRepository, VCSError
 from .base import BaseCommand
 
 
@@ -25,6 +26,7 @@ class CheckoutCommand(BaseCommand):
         """Initialize checkout command."""
         super().__init__(sqitch)
         self.git_client = self._get_git_client()
+        self._repository: Optional[GitRepository] = None
 
     def _get_git_client(self) -> str:
         """Get git client command."""
@@ -82,9 +84,9 @@ class CheckoutCommand(BaseCommand):
             # Load target branch plan
             target_plan = self._load_branch_plan(branch, target)
 
-            # Find last common change
+            # Find last common change, comparing scripts in git history
             last_common_change = self._find_last_common_change(
-                current_plan, target_plan
+                current_plan, target_plan, branch
             )
 
             if not last_common_change:
@@ -98,7 +100,7 @@ class CheckoutCommand(BaseCommand):
             )
 
             # Create engine with current plan
-            from ..engines.base import EngineRegistry
+            from ..engines.base import EngineRegistry, snapshot_key
 
             engine = EngineRegistry.create_engine(target, current_plan)
 
@@ -109,24 +111,61 @@ class CheckoutCommand(BaseCommand):
             if not options.get("log_only"):
                 engine.ensure_registry()
 
-            # Revert to last common change
-            self._revert_to_common_change(engine, last_common_change, options)
-
-            # Checkout the new branch
-            self._checkout_branch(branch)
-
-            # Create engine with target plan
-            engine = EngineRegistry.create_engine(target, target_plan)
-            self._configure_engine(engine, options)
+            use_snapshots = (
+                options.get("snapshot")
+                and not options.get("log_only")
+                and engine.supports_snapshots
+            )
 
-            # Deploy changes from target branch
-            self._deploy_target_changes(engine, options)
+            # Hold the target's lock from the first snapshot through the
+            # deploy, so no other run changes the database in between
+            lock = (
+                nullcontext() if options.get("log_only") else engine.lock_destination()
+            )
+            with lock:
+                if use_snapshots:
+                    # Keep the current state, so switching back is a restore
+                    self._save_snapshot(engine)
+
+                    target_key = snapshot_key(
+                        change.id for change in target_plan.changes
+                    )
+                    if engine.has_snapshot(target_key):
+                        self._checkout_branch(branch)
+                        engine.restore_snapshot(target_key)
+                        self.info(f"Restored database snapshot for branch {branch}")
+                        return 0
+
+                # Revert to last common change
+                self._revert_to_common_change(engine, last_common_change, options)
+
+                # Checkout the new branch
+                self._checkout_branch(branch)
+
+                # Deploy changes from target branch with the same engine, so
+                # that they run under the lock it holds
+                engine.plan = target_plan
+                self._deploy_target_changes(engine, options)
+
+                if use_snapshots:
+                    self._save_snapshot(engine)
 
             return 0
 
         except Exception as e:
             return self.handle_error(e, "checkout")
 
+        finally:
+            if self._repository is not None:
+                self._repository.close()
+                self._repository = None
+
+    def _get_repository(self) -> GitRepository:
+        """Get the Git repository, reusing its batch processes."""
+        if self._repository is None:
+            self._repository = GitRepository(git_executable=self.git_client)
+        return self._repository
+
     def _parse_args(self, args: List[str]) -> Dict[str, Any]:  # noqa: C901
         """
         Parse command arguments.
@@ -149,6 +188,7 @@ class CheckoutCommand(BaseCommand):
             "lock_timeout": None,
             "deploy_variables": {},
             "revert_variables": {},
+            "snapshot": False,
         }
 
         # Apply configuration defaults
@@ -199,6 +239,10 @@ class CheckoutCommand(BaseCommand):
                 i += 1
             elif arg == "--log-only":
                 options["log_only"] = True
+            elif arg == "--snapshot":
+                options["snapshot"] = True
+            elif arg == "--no-snapshot":
+                options["snapshot"] = False
             elif arg == "--lock-timeout":
                 if i + 1 >= len(args):
                     raise SqlitchError(f"Option {arg} requires a value")
@@ -248,6 +292,9 @@ class CheckoutCommand(BaseCommand):
         elif self.config.get("deploy.mode"):
             defaults["mode"] = self.config.get("deploy.mode")
 
+        if self.config.get("checkout.snapshot") is not None:
+            defaults["snapshot"] = self.config.get("checkout.snapshot", as_bool=True)
+
         if self.config.get("checkout.no_prompt") is not None:
             defaults["no_prompt"] = self.config.get("checkout.no_prompt", as_bool=True)
         elif self.config.get("revert.no_prompt") is not None:
@@ -310,50 +357,97 @@ class CheckoutCommand(BaseCommand):
 
     def _load_branch_plan(self, branch: str, target) -> Plan:
         """Load plan file from specified branch."""
-        import subprocess
-
         # Get plan file path - use just the filename, not absolute path
         plan_file = target.plan_file or Path(
             self.config.get("core.plan_file", "sqitch.plan")
         )
 
-        # For git show, we need just the filename relative to repo root
+        # Object names need a path relative to the repo root
         # If plan_file is absolute, get just the name
         if plan_file.is_absolute():
             relative_path = plan_file.name
         else:
-            relative_path = str(plan_file)
+            relative_path = plan_file.as_posix()
 
         try:
-            result = subprocess.run(
-                [self.git_client, "show", f"{branch}:{relative_path}"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            content = self._get_repository().read_file(branch, relative_path)
+        except VCSError as e:
+            raise VCSError(f"Failed to load plan from branch {branch}: {e}")
 
-            # Parse plan content directly
-            return Plan.from_string(result.stdout, plan_file)
+        if content is None:
+            raise VCSError(
+                f"Failed to load plan from branch {branch}: "
+                f"{relative_path} not found"
+            )
 
-        except subprocess.CalledProcessError as e:
-            raise VCSError(f"Failed to load plan from branch {branch}: {e}")
+        # Parse plan content directly
+        return Plan.from_string(content.decode("utf-8"), plan_file)
 
     def _find_last_common_change(
-        self, current_plan: Plan, target_plan: Plan
+        self, current_plan: Plan, target_plan: Plan, branch: Optional[str] = None
     ) -> Optional[Change]:
-        """Find the last change common to both plans."""
+        """
+        Find the last change common to both plans.
+
+        When a branch is given, a change only counts as common if its deploy
+        script is the same git blob in HEAD and on the branch, so that deploy
+        scripts edited without a plan change are redeployed. Revert and verify
+        scripts do not change what was deployed and are not compared.
+
+        Args:
+            current_plan: Plan of the current branch
+            target_plan: Plan of the branch to check out
+            branch: Branch to compare scripts against
+
+        Returns:
+            Last common change or None
+        """
         last_common = None
 
         for change in target_plan.changes:
             # Check if this change exists in current plan
             current_change = current_plan.get_change(change.id)
-            if current_change:
-                last_common = change
-            else:
+            if not current_change:
                 break
 
+            if branch is not None and self._get_deploy_script_id(
+                current_plan, current_change, "HEAD"
+            ) != self._get_deploy_script_id(target_plan, change, branch):
+                self.info(f"Deploy script for {change.name} differs on branch {branch}")
+                break
+
+            last_common = change
+
         return last_common
 
+    def _get_deploy_script_id(
+        self, plan: Plan, change: Change, revision: str
+    ) -> Optional[str]:
+        """
+        Get the git blob ID of a change's deploy script at a revision.
+
+        Blob IDs are git's own content hashes, so comparing them needs no
+        script content to be read.
+
+        Args:
+            plan: Plan the change belongs to
+            change: Change to look up
+            revision: Commit, branch or tag name
+
+        Returns:
+            Blob ID of the deploy script, or None if it is missing
+        """
+        repository = self._get_repository()
+        script = plan.get_deploy_file(change)
+        if script.is_absolute():
+            relative = repository.get_relative_path(script)
+            path = relative.as_posix() if relative else script.name
+        else:
+            # './' makes git resolve the path from the working directory
+            path = f"./{script.as_posix()}"
+        info = repository.object_info(revision, path)
+        return info.oid if info else None
+
     def _configure_engine(self, engine, options: Dict[str, Any]) -> None:
         """Configure engine with options."""
         if options.get("verify") is not None:
@@ -387,6 +481,14 @@ class CheckoutCommand(BaseCommand):
             else:
                 raise
 
+    def _save_snapshot(self, engine) -> None:
+        """Save a snapshot of the database keyed by its deployed changes."""
+        from ..engines.base import snapshot_key
+
+        key = snapshot_key(engine.get_deployed_changes())
+        engine.save_snapshot(key)
+        self.debug(f"Saved database snapshot {key}")
+
     def _checkout_branch(self, branch: str) -> None:
         """Checkout the specified branch."""
         import subprocess
@@ -418,6 +520,7 @@ Options:
     -r --set-revert <key=value>  set a database client revert variable
     -e --set-deploy <key=value>  set a database client deploy variable
        --log-only                log changes without running them
+       --snapshot                restore and save database snapshots
        --lock-timeout <timeout>  seconds to wait for target lock
     -y                           disable the prompt before reverting
     -f --plan-file  <file>       path to a deployment plan file
@@ -479,6 +582,15 @@ OPTIONS
         Log the changes as if they were deployed, but without actually running
         the deploy scripts.
 
+    --snapshot
+    --no-snapshot
+        Save a snapshot of the database before reverting and after deploying,
+        keyed by the sequence of deployed changes. If a snapshot already exists
+        for the branch being checked out, it is restored instead of reverting
+        and deploying. Supported for SQLite (a copy next to the database file)
+        and PostgreSQL (a database cloned with CREATE DATABASE ... TEMPLATE).
+        Defaults to the checkout.snapshot configuration, or off.
+
     --lock-timeout <timeout>
         Set the number of seconds for Sqlitch to wait to get an exclusive advisory
         lock on the target database. Defaults to 60.
@@ -6,6 +6,7 @@ from the plan file to the target database, with transaction management,
 progress reporting, and rollback on failure.
 """
 
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
@@ -34,11 +35,22 @@ class DeployCommand(BaseCommand):
             # Parse arguments
             options = self._parse_args(args)
 
-            # Validate preconditions
-            self.validate_preconditions("deploy", options.get("target"))
+            # Validate preconditions (a bundle brings its own plan, so no
+            # local plan file is needed)
+            if options.get("bundle"):
+                user_errors = self.sqitch.validate_user_info()
+                if user_errors:
+                    raise SqlitchError("\n".join(user_errors))
+            else:
+                self.validate_preconditions("deploy", options.get("target"))
 
-            # Load plan
-            plan = self._load_plan(options.get("plan_file"))
+            # Load plan, reading it and its scripts from a bundle archive if given
+            if options.get("bundle"):
+                plan = self._load_bundle_plan(
+                    options["bundle"], options.get("plan_file")
+                )
+            else:
+                plan = self._load_plan(options.get("plan_file"))
 
             # Get target
             target = self.get_target(options.get("target"))
@@ -47,6 +59,9 @@ class DeployCommand(BaseCommand):
             from ..engines.base import EngineRegistry
 
             engine = EngineRegistry.create_engine(target, plan)
+            self.configure_slow_statement_log(engine)
+            if options.get("lock_timeout") is not None:
+                engine.set_lock_timeout(options["lock_timeout"])
 
             # For log-only mode, we don't need to connect to the database
             if not options.get("log_only"):
@@ -60,8 +75,15 @@ class DeployCommand(BaseCommand):
                 self.info("Nothing to deploy")
                 return 0
 
-            # Deploy changes
-            return self._deploy_changes(engine, changes_to_deploy, options)
+            # Deploy changes, holding the target's lock for the whole run
+            lock = (
+                nullcontext() if options.get("log_only") else engine.lock_destination()
+            )
+            try:
+                with lock:
+                    return self._deploy_changes(engine, changes_to_deploy, options)
+            finally:
+                self.report_slow_statements(engine)
 
         except Exception as e:
             return self.handle_error(e, "deploy")
@@ -85,6 +107,7 @@ class DeployCommand(BaseCommand):
             "log_only": False,
             "lock_timeout": None,
             "deploy_dir": None,
+            "bundle": None,
         }
 
         i = 0
@@ -133,6 +156,11 @@ class DeployCommand(BaseCommand):
                 except ValueError:
                     raise SqlitchError("--lock-timeout must be an integer")
                 i += 2
+            elif arg == "--bundle":
+                if i + 1 >= len(args):
+                    raise SqlitchError("--bundle requires a value")
+                options["bundle"] = Path(args[i + 1])
+                i += 2
             elif arg == "--deploy-dir":
                 if i + 1 >= len(args):
                     raise SqlitchError("--deploy-dir requires a value")
@@ -175,6 +203,40 @@ class DeployCommand(BaseCommand):
         except Exception as e:
             raise PlanError(f"Failed to load plan file {plan_file}: {e}")
 
+    def _load_bundle_plan(
+        self, archive: Path, plan_file: Optional[Path] = None
+    ) -> Plan:
+        """
+        Load the plan from a bundle archive.
+
+        The archive is read in place; deploy, revert and verify scripts are
+        read from it as they are needed.
+
+        Args:
+            archive: Bundle archive created by 'sqlitch bundle --archive'
+            plan_file: Optional plan file path inside the bundle
+
+        Returns:
+            Plan backed by the archive
+
+        Raises:
+            PlanError: If the archive or its plan cannot be read
+        """
+        from ..utils.bundle import BundleArchive
+
+        if not archive.exists():
+            raise PlanError(f"Bundle archive not found: {archive}")
+
+        if plan_file is None:
+            plan_file = self.sqitch.get_plan_file()
+
+        try:
+            return BundleArchive(archive).load_plan(plan_file)
+        except PlanError:
+            raise
+        except Exception as e:
+            raise PlanError(f"Failed to load plan from bundle {archive}: {e}")
+
     def _determine_changes_to_deploy(
         self, engine, plan: Plan, options: Dict[str, Any]
     ) -> List[Change]:
@@ -559,6 +621,7 @@ Options:
   --log-only            Show what would be deployed without executing
   --lock-timeout <sec>  Lock timeout in seconds
   --deploy-dir <dir>    Directory containing deploy scripts
+  --bundle <archive>    Read the plan and scripts from a bundle archive
   -h, --help           Show this help message
 
 Examples:
@@ -587,6 +650,11 @@ Examples:
 )
 @click.option("--lock-timeout", type=int, help="Lock timeout in seconds")
 @click.option("--deploy-dir", help="Directory containing deploy scripts")
+@click.option(
+    "--bundle",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Read the plan and scripts from a bundle archive",
+)
 @click.pass_context
 def deploy_command(ctx: click.Context, change: Optional[str], **kwargs) -> None:
     """Deploy database changes from the plan to the target database."""
@@ -6,6 +6,7 @@ and then redeploys up to another change, effectively rebasing the database state
 It supports interactive rebasing with user prompts and conflict resolution.
 """
 
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -60,8 +61,11 @@ class RebaseCommand(BaseCommand):
             # Configure engine
             self._configure_engine(engine, options)
 
-            # Execute rebase operation
-            self._execute_rebase(engine, target, onto_change, upto_change, options)
+            # Execute rebase operation, holding the target's lock for the
+            # revert and the deploy
+            lock = nullcontext() if options["log_only"] else engine.lock_destination()
+            with lock:
+                self._execute_rebase(engine, target, onto_change, upto_change, options)
 
             return 0
 
@@ -0,0 +1,219 @@
+"""
+Registry command implementation for sqlitch.
+
+This module implements the 'registry' command, which exports the registry
+tables of a target database to files and imports them into another
+target's registry, for moving deployment history between databases.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import click
+
+from ..core.exceptions import PlanError, SqlitchError
+from ..core.plan import Plan
+from .base import BaseCommand
+
+# Registry subcommands
+ACTIONS = ("export", "import")
+
+# Registry file formats
+FORMATS = ("csv", "binary")
+
+
+class RegistryCommand(BaseCommand):
+    """Export and import registry tables."""
+
+    def execute(self, args: List[str]) -> int:
+        """
+        Execute the registry command.
+
+        Args:
+            args: Command arguments
+
+        Returns:
+            Exit code (0 for success)
+        """
+        try:
+            options = self._parse_args(args)
+
+            self.require_initialized()
+
+            target = self.get_target(options.get("target"))
+            plan = self._load_plan(options.get("plan_file"))
+
+            from ..engines.base import EngineRegistry
+
+            engine = EngineRegistry.create_engine(target, plan)
+            directory = options["directory"]
+
+            if options["action"] == "export":
+                counts = engine.export_registry(directory, options["format"])
+                verb = "Exported"
+            else:
+                counts = engine.import_registry(directory, options["format"])
+                verb = "Imported"
+
+            for table, count in counts.items():
+                self.info(f"{verb} {count} row{'s' if count != 1 else ''} of {table}")
+
+            direction = "to" if options["action"] == "export" else "from"
+            self.info(f"{verb} registry of {target.uri} {direction} {directory}")
+            return 0
+
+        except Exception as e:
+            return self.handle_error(e, "registry")
+
+    def _parse_args(self, args: List[str]) -> Dict[str, Any]:  # noqa: C901
+        """
+        Parse command arguments.
+
+        Args:
+            args: Raw command arguments
+
+        Returns:
+            Parsed options dictionary
+        """
+        options: Dict[str, Any] = {
+            "action": None,
+            "directory": None,
+            "target": None,
+            "plan_file": None,
+            "format": self.config.get("registry.format", "csv"),
+        }
+
+        i = 0
+        while i < len(args):
+            arg = args[i]
+
+            if arg in ["--help", "-h"]:
+                self._show_help()
+                raise SystemExit(0)
+            elif arg == "--target":
+                if i + 1 >= len(args):
+                    raise SqlitchError("--target requires a value")
+                options["target"] = args[i + 1]
+                i += 2
+            elif arg == "--plan-file":
+                if i + 1 >= len(args):
+                    raise SqlitchError("--plan-file requires a value")
+                options["plan_file"] = Path(args[i + 1])
+                i += 2
+            elif arg == "--format":
+                if i + 1 >= len(args):
+                    raise SqlitchError("--format requires a value")
+                options["format"] = args[i + 1]
+                i += 2
+            elif arg.startswith("-"):
+                raise SqlitchError(f"Unknown option: {arg}")
+            elif options["action"] is None:
+                options["action"] = arg
+                i += 1
+            elif options["directory"] is None:
+                options["directory"] = Path(arg)
+                i += 1
+            else:
+                raise SqlitchError(f"Unexpected argument: {arg}")
+
+        if options["action"] not in ACTIONS:
+            raise SqlitchError(
+                f"Registry action must be {' or '.join(ACTIONS)}"
+                + (f", not {options['action']}" if options["action"] else "")
+            )
+        if options["directory"] is None:
+            raise SqlitchError(f"registry {options['action']} requires a directory")
+        if options["format"] not in FORMATS:
+            raise SqlitchError(
+                f"Unknown registry format: {options['format']} "
+                f"(expected {' or '.join(FORMATS)})"
+            )
+
+        return options
+
+    def _load_plan(self, plan_file: Optional[Path] = None) -> Plan:
+        """
+        Load plan file.
+
+        Args:
+            plan_file: Optional plan file path
+
+        Returns:
+            Loaded plan
+
+        Raises:
+            PlanError: If plan cannot be loaded
+        """
+        if plan_file is None:
+            plan_file = self.sqitch.get_plan_file()
+
+        if not plan_file.exists():
+            raise PlanError(f"Plan file not found: {plan_file}")
+
+        try:
+            return Plan.from_file(plan_file)
+        except Exception as e:
+            raise PlanError(f"Failed to load plan file {plan_file}: {e}")
+
+    def _show_help(self) -> None:
+        """Show command help."""
+        help_text = """Usage: sqlitch registry export <directory> [options]
+       sqlitch registry import <directory> [options]
+
+Export the registry tables of a target to one file per table, or load
+such files into the empty registry of another target. PostgreSQL targets
+use COPY, so whole registries move in a few round trips.
+
+Options:
+  --target <target>   Target database
+  --plan-file <file>  Plan file to read (default: sqitch.plan)
+  --format <format>   File format: csv (default) or binary
+  -h, --help          Show this help message
+
+Examples:
+  sqlitch registry export --target prod registry-backup
+  sqlitch registry import --target staging registry-backup
+"""
+        print(help_text)
+
+
+# Click command wrapper for CLI integration
+@click.command("registry")
+@click.argument("action", type=click.Choice(ACTIONS))
+@click.argument("directory", type=click.Path(file_okay=False))
+@click.option("--target", help="Target database")
+@click.option("--plan-file", help="Plan file to read")
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(FORMATS),
+    help="File format (default: csv)",
+)
+@click.pass_context
+def registry_command(
+    ctx: click.Context,
+    action: str,
+    directory: str,
+    target: Optional[str],
+    plan_file: Optional[str],
+    file_format: Optional[str],
+) -> None:
+    """Export or import registry tables."""
+    from ..cli import get_sqitch_from_context
+
+    sqitch = get_sqitch_from_context(ctx)
+    command = RegistryCommand(sqitch)
+
+    args = [action, directory]
+    if target:
+        args.extend(["--target", target])
+    if plan_file:
+        args.extend(["--plan-file", plan_file])
+    if file_format:
+        args.extend(["--format", file_format])
+
+    exit_code = command.execute(args)
+    if exit_code != 0:
+        raise click.ClickException(
+            f"Registry command failed with exit code {exit_code}"
+        )
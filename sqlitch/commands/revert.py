@@ -6,6 +6,7 @@ from the target database, with confirmation prompts, safety checks, and
 support for reverting to specific changes or tags.
 """
 
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -50,6 +51,9 @@ class RevertCommand(BaseCommand):
             from ..engines.base import EngineRegistry
 
             engine = EngineRegistry.create_engine(target, plan)
+            self.configure_slow_statement_log(engine)
+            if options.get("lock_timeout") is not None:
+                engine.set_lock_timeout(options["lock_timeout"])
 
             # For log-only mode, we don't need to connect to the database
             if not options.get("log_only"):
@@ -63,8 +67,15 @@ class RevertCommand(BaseCommand):
                 self.info("Nothing to revert")
                 return 0
 
-            # Revert changes
-            return self._revert_changes(engine, changes_to_revert, options)
+            # Revert changes, holding the target's lock for the whole run
+            lock = (
+                nullcontext() if options.get("log_only") else engine.lock_destination()
+            )
+            try:
+                with lock:
+                    return self._revert_changes(engine, changes_to_revert, options)
+            finally:
+                self.report_slow_statements(engine)
 
         except SqlitchError as e:
             self.error(str(e))
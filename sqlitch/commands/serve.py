@@ -0,0 +1,410 @@
+"""
+Serve command implementation for sqlitch.
+
+This module implements the 'serve' command, which runs sqlitch as a
+long-lived process answering JSON-RPC 2.0 requests on a local UNIX socket.
+Parsed configuration and plans are cached between requests (and reloaded
+when their files change) and engine connections are kept open, so that
+orchestrators calling status/deploy/verify/log repeatedly avoid paying
+interpreter start-up, config loading, plan parsing and connection setup on
+every call.
+"""
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import click
+
+from ..core.config import Config
+from ..core.exceptions import SqlitchError
+from ..core.plan import set_plan_cache
+from ..core.sqitch import Sqitch
+from ..engines.base import ConnectionCache, set_connection_cache
+from ..utils.cache import FileStampCache
+from .base import BaseCommand
+
+# Default socket path, relative to the project directory
+DEFAULT_SOCKET = "sqlitch.sock"
+
+# Methods served over JSON-RPC, mapped to 'module:class' of the command
+SERVED_COMMANDS: Dict[str, str] = {
+    "status": "sqlitch.commands.status:StatusCommand",
+    "deploy": "sqlitch.commands.deploy:DeployCommand",
+    "verify": "sqlitch.commands.verify:VerifyCommand",
+    "log": "sqlitch.commands.log:LogCommand",
+}
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class JsonRpcError(Exception):
+    """Error returned to a JSON-RPC client."""
+
+    def __init__(self, code: int, message: str) -> None:
+        """
+        Initialize JSON-RPC error.
+
+        Args:
+            code: JSON-RPC error code
+            message: Error message
+        """
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class SqlitchService:
+    """
+    Execute sqlitch commands in-process for JSON-RPC requests.
+
+    Commands run one at a time because their output is captured by
+    redirecting the process-wide stdout and stderr.
+    """
+
+    def __init__(
+        self, config_files: Optional[List[Path]] = None, verbosity: int = 0
+    ) -> None:
+        """
+        Initialize service.
+
+        Args:
+            config_files: Explicit configuration files (None for defaults)
+            verbosity: Verbosity level for served commands
+        """
+        self.config_files = config_files
+        self.verbosity = verbosity
+        self.config_cache = FileStampCache()
+        self.plan_cache = FileStampCache()
+        self.connection_cache = ConnectionCache()
+        self._lock = threading.Lock()
+        self._config_paths: List[Path] = []
+        self.shutdown_requested = False
+
+    def start(self) -> None:
+        """Enable plan and connection caching for served commands."""
+        self._config_paths = Config(self.config_files).get_candidate_paths()
+        set_plan_cache(self.plan_cache)
+        set_connection_cache(self.connection_cache)
+
+    def stop(self) -> None:
+        """Disable caching and close cached connections."""
+        set_plan_cache(None)
+        set_connection_cache(None)
+        self.connection_cache.close_all()
+
+    def get_sqitch(self) -> Sqitch:
+        """
+        Get the Sqitch instance, reloading it if configuration changed.
+
+        Returns:
+            Sqitch instance for the current configuration
+        """
+        return self.config_cache.get("sqitch", self._config_paths, self._load_sqitch)
+
+    def _load_sqitch(self) -> Sqitch:
+        """Load configuration and create a Sqitch instance."""
+        config = Config(self.config_files)
+        self._config_paths = config.get_candidate_paths()
+        return Sqitch(config=config, options={"verbosity": self.verbosity})
+
+    def handle(self, request: Any) -> Optional[Dict[str, Any]]:
+        """
+        Handle a decoded JSON-RPC request.
+
+        Args:
+            request: Decoded request object
+
+        Returns:
+            Response object, or None for notifications
+        """
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if (
+                not isinstance(request, dict)
+                or request.get("jsonrpc") != "2.0"
+                or not isinstance(request.get("method"), str)
+            ):
+                raise JsonRpcError(INVALID_REQUEST, "Invalid request")
+
+            result = self.call(request["method"], request.get("params"))
+            if "id" not in request:
+                return None
+            return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+        except JsonRpcError as e:
+            error = {"code": e.code, "message": e.message}
+        except Exception as e:
+            error = {"code": INTERNAL_ERROR, "message": str(e)}
+
+        return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+    def call(self, method: str, params: Any) -> Any:
+        """
+        Dispatch a JSON-RPC method call.
+
+        Args:
+            method: Method name
+            params: Method parameters
+
+        Returns:
+            Method result
+
+        Raises:
+            JsonRpcError: If the method or parameters are invalid
+        """
+        if method == "ping":
+            return "pong"
+        if method == "shutdown":
+            self.shutdown_requested = True
+            return True
+        if method not in SERVED_COMMANDS:
+            raise JsonRpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+
+        args = self._get_args(params)
+        return self.run_command(method, args)
+
+    def _get_args(self, params: Any) -> List[str]:
+        """Extract command arguments from request parameters."""
+        if params is None:
+            return []
+        if isinstance(params, dict):
+            args = params.get("args", [])
+        else:
+            args = params
+        if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+            raise JsonRpcError(INVALID_PARAMS, "params.args must be a list of strings")
+        return args
+
+    def run_command(self, name: str, args: List[str]) -> Dict[str, Any]:
+        """
+        Run a command and capture its output.
+
+        Args:
+            name: Command name
+            args: Command arguments
+
+        Returns:
+            Dictionary with exit_code, stdout and stderr
+        """
+        module_name, class_name = SERVED_COMMANDS[name].split(":", 1)
+        command_class = getattr(importlib.import_module(module_name), class_name)
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with self._lock:
+            # Create Sqitch before redirecting, so that log handlers it sets
+            # up are bound to the real streams rather than this request's
+            sqitch = self.get_sqitch()
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    exit_code = command_class(sqitch).execute(args)
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else 1
+                except SqlitchError as e:
+                    print(f"sqlitch: {e}", file=sys.stderr)
+                    exit_code = 1
+
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Read newline-delimited JSON-RPC requests from a client."""
+
+    server: "SqlitchServer"
+
+    def handle(self) -> None:
+        """Answer requests until the client disconnects."""
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response: Any = {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {"code": PARSE_ERROR, "message": "Parse error"},
+                }
+            else:
+                if isinstance(request, list) and request:
+                    response = [self.server.service.handle(r) for r in request]
+                    response = [r for r in response if r is not None] or None
+                else:
+                    response = self.server.service.handle(request)
+
+            if response is not None:
+                self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+            if self.server.service.shutdown_requested:
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class SqlitchServer(socketserver.ThreadingUnixStreamServer):
+        """UNIX socket server answering JSON-RPC requests."""
+
+        daemon_threads = True
+
+        def __init__(self, socket_path: Path, service: SqlitchService) -> None:
+            """
+            Initialize server.
+
+            Args:
+                socket_path: Path of the UNIX socket to listen on
+                service: Service executing requests
+            """
+            self.service = service
+            super().__init__(str(socket_path), _RequestHandler)
+
+else:  # pragma: no cover - platforms without AF_UNIX
+    SqlitchServer = None  # type: ignore[assignment,misc]
+
+
+class ServeCommand(BaseCommand):
+    """Serve sqlitch commands over a local JSON-RPC socket."""
+
+    def execute(self, args: List[str]) -> int:
+        """
+        Execute the serve command.
+
+        Args:
+            args: Command arguments
+
+        Returns:
+            Exit code (0 for success)
+        """
+        try:
+            options = self._parse_args(args)
+
+            self.require_initialized()
+
+            if SqlitchServer is None:
+                raise SqlitchError("sqlitch serve requires UNIX domain socket support")
+
+            socket_path = Path(options["socket"])
+            self._remove_stale_socket(socket_path)
+
+            config_files = [
+                source.path
+                for source in self.config.get_config_sources()
+                if source.source_type == "explicit" and source.path
+            ]
+            service = SqlitchService(
+                config_files=config_files or None, verbosity=self.sqitch.verbosity
+            )
+            service.start()
+            try:
+                with SqlitchServer(socket_path, service) as server:
+                    os.chmod(socket_path, 0o600)
+                    self.info(f"Listening on {socket_path}")
+                    try:
+                        server.serve_forever()
+                    except KeyboardInterrupt:
+                        pass
+            finally:
+                service.stop()
+                self._remove_stale_socket(socket_path)
+
+            return 0
+
+        except Exception as e:
+            return self.handle_error(e, "serve")
+
+    def _remove_stale_socket(self, socket_path: Path) -> None:
+        """Remove a leftover socket file, refusing to remove other files."""
+        if not socket_path.exists() and not socket_path.is_symlink():
+            return
+        if not socket_path.is_socket():
+            raise SqlitchError(f"{socket_path} exists and is not a socket")
+        socket_path.unlink()
+
+    def _parse_args(self, args: List[str]) -> Dict[str, Any]:
+        """
+        Parse command arguments.
+
+        Args:
+            args: Raw command arguments
+
+        Returns:
+            Parsed options dictionary
+        """
+        options: Dict[str, Any] = {"socket": DEFAULT_SOCKET}
+
+        i = 0
+        while i < len(args):
+            arg = args[i]
+
+            if arg in ["--help", "-h"]:
+                self._show_help()
+                raise SystemExit(0)
+            elif arg == "--socket":
+                if i + 1 >= len(args):
+                    raise SqlitchError("--socket requires a value")
+                options["socket"] = args[i + 1]
+                i += 2
+            else:
+                raise SqlitchError(f"Unknown option: {arg}")
+
+        return options
+
+    def _show_help(self) -> None:
+        """Show command help."""
+        help_text = f"""Usage: sqlitch serve [options]
+
+Serve status, deploy, verify and log requests as JSON-RPC 2.0 over a
+UNIX socket. Each request is one line of JSON; params.args holds the
+command-line arguments for the command.
+
+Options:
+  --socket <path>   Socket path (default: {DEFAULT_SOCKET})
+  -h, --help        Show this help message
+
+Example request:
+  {{"jsonrpc": "2.0", "id": 1, "method": "status", "params": {{"args": []}}}}
+"""
+        print(help_text)
+
+
+# Click command wrapper for CLI integration
+@click.command("serve")
+@click.option(
+    "--socket",
+    type=click.Path(dir_okay=False),
+    help=f"UNIX socket to listen on (default: {DEFAULT_SOCKET})",
+)
+@click.pass_context
+def serve_command(ctx: click.Context, socket: Optional[str]) -> None:
+    """Serve sqlitch commands over a local JSON-RPC socket."""
+    from ..cli import get_sqitch_from_context
+
+    sqitch = get_sqitch_from_context(ctx)
+    command = ServeCommand(sqitch)
+
+    args = []
+    if socket:
+        args.extend(["--socket", socket])
+
+    exit_code = command.execute(args)
+    if exit_code != 0:
+        ctx.exit(exit_code)
@@ -15,7 +15,7 @@ import click
 from ..core.change import Change
 from ..core.exceptions import EngineError, PlanError, SqlitchError
 from ..core.plan import Plan
-from ..engines.base import EngineRegistry
+from ..engines.base import EngineRegistry, RegistryStatus
 from .base import BaseCommand
 
 
@@ -48,13 +48,10 @@ class StatusCommand(BaseCommand):
             # Create engine with plan
             engine = EngineRegistry.create_engine(target, plan)
 
-            # Ensure registry exists
-            engine.ensure_registry()
+            # Read state, changes and tags in one registry round trip
+            status = self._get_status(engine, options.get("project"))
 
-            # Get current state
-            current_state = self._get_current_state(engine, options.get("project"))
-
-            if not current_state:
+            if not status.state:
                 self.error("No changes deployed")
                 return 1
 
@@ -62,18 +59,18 @@ class StatusCommand(BaseCommand):
             self.info(f"On database {target.uri}")
 
             # Display current state
-            self._emit_state(current_state, options)
+            self._emit_state(status.state, options)
 
             # Display changes if requested
             if options.get("show_changes"):
-                self._emit_changes(engine, options.get("project"), options)
+                self._emit_changes(status.changes, options)
 
             # Display tags if requested
             if options.get("show_tags"):
-                self._emit_tags(engine, options.get("project"), options)
+                self._emit_tags(status.tags, options)
 
             # Display status comparison with plan
-            self._emit_status(current_state, plan, options)
+            self._emit_status(status, plan, options)
 
             return 0
 
@@ -163,21 +160,19 @@ class StatusCommand(BaseCommand):
         except Exception as e:
             raise PlanError(f"Failed to load plan file {plan_file}: {e}")
 
-    def _get_current_state(
-        self, engine, project: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
+    def _get_status(self, engine, project: Optional[str] = None) -> RegistryStatus:
         """
-        Get current deployment state from database.
+        Get deployment status from database.
 
         Args:
             engine: Database engine
             project: Optional project name
 
         Returns:
-            Current state dictionary or None if no changes deployed
+            Registry status
         """
         try:
-            return engine.get_current_state(project)
+            return engine.get_status(project)
         except Exception as e:
             if not engine._registry_exists_in_db(engine._create_connection()):
                 raise SqlitchError("Database has not been initialized for Sqitch")
@@ -219,19 +214,16 @@ class StatusCommand(BaseCommand):
         self.info(f"By:       {state['committer_name']} <{state['committer_email']}>")
 
     def _emit_changes(
-        self, engine, project: Optional[str], options: Dict[str, Any]
+        self, changes: List[Dict[str, Any]], options: Dict[str, Any]
     ) -> None:
         """
         Emit list of deployed changes.
 
         Args:
-            engine: Database engine
-            project: Project name
+            changes: Deployed changes, most recent first
             options: Command options
         """
         try:
-            changes = list(engine.get_current_changes(project))
-
             if not changes:
                 self.info("")
                 self.info("Changes: None.")
@@ -271,20 +263,15 @@ class StatusCommand(BaseCommand):
         except Exception as e:
             self.warn(f"Failed to get deployed changes: {e}")
 
-    def _emit_tags(
-        self, engine, project: Optional[str], options: Dict[str, Any]
-    ) -> None:
+    def _emit_tags(self, tags: List[Dict[str, Any]], options: Dict[str, Any]) -> None:
         """
         Emit list of deployed tags.
 
         Args:
-            engine: Database engine
-            project: Project name
+            tags: Deployed tags, most recent first
             options: Command options
         """
         try:
-            tags = list(engine.get_current_tags(project))
-
             self.info("")
 
             if not tags:
@@ -323,28 +310,20 @@ class StatusCommand(BaseCommand):
             self.warn(f"Failed to get deployed tags: {e}")
 
     def _emit_status(
-        self, state: Dict[str, Any], plan: Plan, options: Dict[str, Any]
+        self, status: RegistryStatus, plan: Plan, options: Dict[str, Any]
     ) -> None:
         """
         Emit status comparison with plan.
 
         Args:
-            state: Current state dictionary
+            status: Registry status
             plan: Deployment plan
             options: Command options
         """
         self.info("")
 
         # Find the current change in the plan
-        current_change_id = state["change_id"]
-        current_index = None
-
-        for i, change in enumerate(plan.changes):
-            if change.id == current_change_id:
-                current_index = i
-                break
-
-        if current_index is None:
+        if plan.get_change(status.state["change_id"]) is None:
             self.warn(f"Cannot find this change in {plan.file}")
             self.error(
                 "Make sure you are connected to the proper database for this project."
@@ -352,18 +331,15 @@ class StatusCommand(BaseCommand):
             return
 
         # Check if we're up to date
-        total_changes = len(plan.changes)
-        if current_index == total_changes - 1:
+        if not status.pending:
             self.info("Nothing to deploy (up-to-date)")
         else:
             # Show undeployed changes
-            undeployed_count = total_changes - (current_index + 1)
-            change_word = "change" if undeployed_count == 1 else "changes"
+            change_word = "change" if status.pending_count == 1 else "changes"
             self.info(f"Undeployed {change_word}:")
 
             # List undeployed changes
-            for i in range(current_index + 1, total_changes):
-                change = plan.changes[i]
+            for change in status.pending:
                 # Format change name with tags if any
                 name_with_tags = self._format_change_name_with_tags(change)
                 self.info(f"  * {name_with_tags}")
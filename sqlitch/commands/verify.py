@@ -85,12 +85,16 @@ class VerifyCommand(BaseCommand):
             from ..engines.base import EngineRegistry
 
             engine = EngineRegistry.create_engine(target, plan)
+            self.configure_slow_statement_log(engine)
 
             # Ensure registry exists
             engine.ensure_registry()
 
             # Perform verification
-            return self._verify_changes(engine, plan, options)
+            try:
+                return self._verify_changes(engine, plan, options)
+            finally:
+                self.report_slow_statements(engine)
 
         except SqlitchError as e:
             self.error(str(e))
@@ -9,10 +9,12 @@ INI-style format as Perl sqitch with proper type coercion and validation.
 import configparser
 import os
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..utils.cache import FileStampCache
 from .exceptions import ConfigurationError
 from .target import Target
 from .types import (
@@ -23,6 +25,10 @@ from .types import (
     validate_uri,
 )
 
+# Parsed configuration files shared by all Config instances in the process,
+# keyed by resolved path and reparsed when a file's mtime or size changes
+_parse_cache = FileStampCache()
+
 
 @dataclass
 class ConfigSource:
@@ -54,18 +60,65 @@ class Config:
             config_files: Explicit list of config files to load
             cli_options: Command-line options to override config values
         """
-        self._sources: List[ConfigSource] = []
-        self._merged_config: Dict[str, Any] = {}
         self._cli_options = cli_options or {}
+        self._explicit_files: Optional[List[Path]] = (
+            list(config_files) if config_files else None
+        )
 
-        # Load configuration sources in priority order
-        if config_files:
-            self._load_explicit_configs(config_files)
-        else:
-            self._load_default_configs()
+        # Configuration files are loaded and merged on first use
+        self._loaded = False
+        self._source_list: List[ConfigSource] = []
+        self._merged: Dict[str, Any] = {}
+        self._lookup_cache: Dict[str, Any] = {}
+        self.load_timing: Optional[Tuple[float, float]] = None
 
-        # Merge all configurations
-        self._merge_configurations()
+    @property
+    def _sources(self) -> List[ConfigSource]:
+        """Configuration sources, loading them on first access."""
+        self._ensure_loaded()
+        return self._source_list
+
+    @_sources.setter
+    def _sources(self, sources: List[ConfigSource]) -> None:
+        self._loaded = True
+        self._source_list = sources
+
+    @property
+    def _merged_config(self) -> Dict[str, Any]:
+        """Merged configuration, loading sources on first access."""
+        self._ensure_loaded()
+        return self._merged
+
+    @_merged_config.setter
+    def _merged_config(self, merged: Dict[str, Any]) -> None:
+        self._loaded = True
+        self._merged = merged
+        self._lookup_cache.clear()
+
+    def _ensure_loaded(self) -> None:
+        """Load and merge configuration sources if not done yet."""
+        if self._loaded:
+            return
+
+        load_started = time.time()
+        self._loaded = True
+        try:
+            # Load configuration sources in priority order
+            if self._explicit_files:
+                self._load_explicit_configs(self._explicit_files)
+            else:
+                self._load_default_configs()
+
+            # Merge all configurations
+            self._merge_configurations()
+        except BaseException:
+            self._loaded = False
+            self._source_list = []
+            raise
+
+        # Remember how long loading took so it can be traced once tracing
+        # has been configured from this very configuration
+        self.load_timing = (load_started, time.time())
 
     def _load_explicit_configs(self, config_files: List[Path]) -> None:
         """Load explicitly specified configuration files."""
@@ -166,6 +219,25 @@ class Config:
         """
         Load and parse a configuration file.
 
+        Args:
+            config_path: Path to configuration file
+
+        Returns:
+            Parsed configuration
+
+        Raises:
+            ConfigurationError: If file cannot be parsed
+        """
+        return _parse_cache.get(
+            config_path.resolve(),
+            [config_path],
+            lambda: self._parse_config_file(config_path),
+        )
+
+    def _parse_config_file(self, config_path: Path) -> configparser.ConfigParser:
+        """
+        Parse a configuration file, bypassing the parse cache.
+
         Args:
             config_path: Path to configuration file
 
@@ -311,10 +383,7 @@ class Config:
         Raises:
             ConfigurationError: If key is invalid or type coercion fails
         """
-        if not validate_config_key(key):
-            raise ConfigurationError(f"Invalid configuration key: {key}")
-
-        value = self._get_nested_value(self._merged_config, key)
+        value = self._lookup(key)
 
         if value is None:
             return default
@@ -337,6 +406,32 @@ class Config:
 
         return value
 
+    def _lookup(self, key: str) -> Any:
+        """
+        Look up a raw value in the merged configuration, memoizing the result.
+
+        Args:
+            key: Configuration key in dot notation
+
+        Returns:
+            Raw configuration value, or None if not set
+
+        Raises:
+            ConfigurationError: If key is invalid
+        """
+        merged = self._merged_config
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            pass
+
+        if not validate_config_key(key):
+            raise ConfigurationError(f"Invalid configuration key: {key}")
+
+        value = self._get_nested_value(merged, key)
+        self._lookup_cache[key] = value
+        return value
+
     def _get_nested_value(self, config: Dict[str, Any], key: str) -> Any:
         """Get nested value using dot notation."""
         parts = key.split(".")
@@ -367,6 +462,7 @@ class Config:
 
         # Update in-memory config
         self._set_nested_value(self._merged_config, key, value)
+        self._lookup_cache.clear()
 
         # Write to file
         if filename is None:
@@ -640,6 +736,33 @@ class Config:
         """Get configuration as dictionary."""
         return self._merged_config.copy()
 
+    def get_candidate_paths(self) -> List[Path]:
+        """
+        Get every file path that could contribute configuration.
+
+        Unlike the loaded sources, this includes default locations where no
+        file exists yet, so that callers caching a Config can notice when one
+        is created.
+
+        Returns:
+            List of configuration file paths
+        """
+        paths = [source.path for source in self._sources if source.path]
+        if self._explicit_files is not None:
+            paths.extend(self._explicit_files)
+        else:
+            paths.extend(self._get_system_config_paths())
+            global_path = self._get_global_config_path()
+            if global_path:
+                paths.append(global_path)
+            paths.append(Path.cwd() / "sqitch.conf")
+
+        unique: List[Path] = []
+        for path in paths:
+            if path not in unique:
+                unique.append(path)
+        return unique
+
     def get_config_sources(self) -> List[ConfigSource]:
         """Get list of configuration sources in priority order."""
         return self._sources.copy()
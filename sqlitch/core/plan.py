@@ -1,14 +1,55 @@
 """Plan file parsing and management for sqitch."""
 
+import hashlib
+import os
 import re
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+from ..utils.cache import FileStamp, FileStampCache, file_stamp
+from ..utils.tracing import get_tracer
 from .change import Change, Dependency, Tag
 from .exceptions import PlanError
 
+# Cache of parsed plans, only enabled by long-running processes (see
+# set_plan_cache); one-shot CLI invocations always parse the file
+_plan_cache: Optional[FileStampCache] = None
+
+
+def set_plan_cache(cache: Optional[FileStampCache]) -> None:
+    """
+    Enable or disable caching of parsed plan files.
+
+    Cached plans are shared between callers and reparsed when the plan file
+    changes, so this is only suitable for callers that don't modify plans.
+
+    Args:
+        cache: Cache to use (None disables caching)
+    """
+    global _plan_cache
+    _plan_cache = cache
+
+
+def _items_digest(changes: List[Change], tags: List[Tag]) -> str:
+    """
+    Fingerprint the plan lines of changes and tags.
+
+    Args:
+        changes: Changes to fingerprint
+        tags: Tags to fingerprint
+
+    Returns:
+        Hex digest of the items' plan lines
+    """
+    digest = hashlib.sha1()
+    for item in [*changes, *tags]:
+        digest.update(str(item).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
 
 @dataclass
 class Plan:
@@ -22,6 +63,11 @@ class Plan:
     tags: List[Tag] = field(default_factory=list)
     _change_index: Dict[str, Change] = field(default_factory=dict, init=False)
     _tag_index: Dict[str, Tag] = field(default_factory=dict, init=False)
+    # What the plan file holds: (change count, tag count, digest of their
+    # lines, pragmas, file stamp)
+    _saved_state: Optional[
+        Tuple[int, int, str, Tuple[str, str, Optional[str]], FileStamp]
+    ] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Build indexes after initialization."""
@@ -78,12 +124,30 @@ class Plan:
         if not file_path.exists():
             raise PlanError(f"Plan file not found: {file_path}")
 
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError as e:
-            raise PlanError(f"Invalid encoding in plan file {file_path}: {e}")
+        if _plan_cache is not None:
+            return _plan_cache.get(
+                (cls, file_path.resolve()),
+                [file_path],
+                lambda: cls._parse_file(file_path),
+            )
+        return cls._parse_file(file_path)
 
-        return cls._parse_content(file_path, content)
+    @classmethod
+    def _parse_file(cls, file_path: Path) -> "Plan":
+        """Read and parse a plan file."""
+        with get_tracer().span("plan.parse", file=str(file_path)) as span:
+            stamp = file_stamp(file_path)
+            try:
+                content = file_path.read_text(encoding="utf-8")
+            except UnicodeDecodeError as e:
+                raise PlanError(f"Invalid encoding in plan file {file_path}: {e}")
+
+            plan = cls._parse_content(file_path, content)
+            plan._mark_saved(stamp)
+            if span:
+                span.set_attribute("changes", len(plan.changes))
+                span.set_attribute("tags", len(plan.tags))
+            return plan
 
     @classmethod
     def from_string(cls, content: str, file_path: Optional[Path] = None) -> "Plan":
@@ -413,7 +477,94 @@ class Plan:
         return tag
 
     def save(self) -> None:
-        """Save plan to file."""
+        """
+        Save plan to file.
+
+        If the file is unchanged since the plan was loaded or last saved, and
+        changes and tags were only added without editing the saved ones, the
+        new lines are appended and the rest of the file (including comments
+        and blank lines) is left untouched. Otherwise the whole file is
+        rewritten atomically.
+        """
+        lines = self._lines_to_append()
+        if lines is None:
+            self._rewrite()
+        elif lines:
+            self._append(lines)
+        self._mark_saved(file_stamp(self.file))
+
+    def _mark_saved(self, stamp: FileStamp) -> None:
+        """Remember what the plan file holds after loading or saving."""
+        self._saved_state = (
+            len(self.changes),
+            len(self.tags),
+            _items_digest(self.changes, self.tags),
+            (self.syntax_version, self.project, self.uri),
+            stamp,
+        )
+
+    def _lines_to_append(self) -> Optional[List[str]]:
+        """
+        Get the lines needed to bring the plan file up to date by appending.
+
+        Returns:
+            Lines to append, or None if the file has to be rewritten
+        """
+        if self._saved_state is None:
+            return None
+
+        saved_changes, saved_tags, digest, pragmas, stamp = self._saved_state
+        if (
+            stamp is None
+            or file_stamp(self.file) != stamp
+            or pragmas != (self.syntax_version, self.project, self.uri)
+            or len(self.changes) < saved_changes
+            or len(self.tags) < saved_tags
+        ):
+            return None
+
+        # Saved changes and tags edited in place (a new note, a rename) need
+        # the whole file rewritten
+        if (
+            _items_digest(self.changes[:saved_changes], self.tags[:saved_tags])
+            != digest
+        ):
+            return None
+
+        # Order new items like a full rewrite would
+        new_items: List[Union[Change, Tag]] = []
+        new_items.extend(self.changes[saved_changes:])
+        new_items.extend(self.tags[saved_tags:])
+        new_items.sort(key=lambda item: item.timestamp)
+
+        # A tag line applies to the change line before it, so appending only
+        # works for tags on the last change at that point in the file
+        last_change = self.changes[saved_changes - 1] if saved_changes else None
+        lines = []
+        for item in new_items:
+            if isinstance(item, Tag):
+                if last_change is None or item.change not in (None, last_change):
+                    return None
+            else:
+                last_change = item
+            lines.append(str(item))
+        return lines
+
+    def _append(self, lines: List[str]) -> None:
+        """Append lines to the plan file and flush them to disk."""
+        content = "\n".join(lines) + "\n"
+        with open(self.file, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    content = "\n" + content
+            f.write(content.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite(self) -> None:
+        """Rewrite the whole plan file atomically."""
         lines = []
 
         # Add pragmas
@@ -434,9 +585,29 @@ class Plan:
         for _, item in all_items:
             lines.append(str(item))
 
-        # Write to file
         content = "\n".join(lines) + "\n"
-        self.file.write_text(content, encoding="utf-8")
+        if not self.file.exists():
+            self.file.write_text(content, encoding="utf-8")
+            return
+
+        # Write to a temporary file and rename it over the plan file, so
+        # that readers never see a partially written plan
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{self.file.name}.", suffix=".tmp", dir=str(self.file.parent)
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_name, self.file.stat().st_mode & 0o7777)
+            os.replace(tmp_name, self.file)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
 
     @property
     def count(self) -> int:
@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
 
 from .. import i18n
 from ..utils.logging import SqlitchLogger, configure_logging
+from ..utils.tracing import configure_tracing
 from .config import Config
 from .exceptions import ConfigurationError, EngineError, SqlitchError
 from .target import Target
@@ -45,6 +46,7 @@ class Sqitch:
         self.user_name = self._get_user_name()
         self.user_email = self._get_user_email()
         self.logger = self._setup_logging()
+        self._setup_tracing()
 
     def _compute_verbosity(self) -> VerbosityLevel:
         """
@@ -164,6 +166,24 @@ class Sqitch:
         """
         return configure_logging(self.verbosity)
 
+    def _setup_tracing(self) -> None:
+        """
+        Set up tracing from the core.trace_file configuration.
+
+        Config loading happens before tracing can be configured, so its
+        span is recorded after the fact from the load timing.
+        """
+        trace_file = self.config.get("core.trace_file")
+        tracer = configure_tracing(Path(trace_file) if trace_file else None)
+
+        load_timing = getattr(self.config, "load_timing", None)
+        if load_timing:
+            tracer.record(
+                "config.load",
+                *load_timing,
+                sources=len(self.config.get_config_sources()),
+            )
+
     def info(self, message: str) -> None:
         """Send informational message to stdout if verbosity >= 1."""
         if self.verbosity >= 1:
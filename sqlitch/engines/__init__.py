@@ -7,45 +7,7 @@ database engines including PostgreSQL, MySQL, SQLite, Oracle, and others.
 
 from .base import Engine, EngineRegistry, RegistrySchema, register_engine
 
-# Import engines to register them
-try:
-    from . import pg
-except ImportError:
-    pass  # PostgreSQL engine not available
-
-try:
-    from . import mysql
-except ImportError:
-    pass  # MySQL engine not available
-
-try:
-    from . import sqlite
-except ImportError:
-    pass  # SQLite engine not available
-
-try:
-    from . import oracle
-except ImportError:
-    pass  # Oracle engine not available
-
-try:
-    from . import snowflake
-except ImportError:
-    pass  # Snowflake engine not available
-
-try:
-    from . import vertica
-except ImportError:
-    pass  # Vertica engine not available
-
-try:
-    from . import exasol
-except ImportError:
-    pass  # Exasol engine not available
-
-try:
-    from . import firebird
-except ImportError:
-    pass  # Firebird engine not available
+# Engine modules (and their database drivers) are imported by EngineRegistry
+# on first use rather than here, keeping CLI startup fast.
 
 __all__ = ["Engine", "EngineRegistry", "RegistrySchema", "register_engine"]
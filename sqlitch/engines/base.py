@@ -7,19 +7,16 @@ for database operations including deployment, revert, verification, and status.
 """
 
 import hashlib
+import importlib
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import (
-    Any,
-    Dict,
-    Iterator,
-    List,
-    Optional,
-    Protocol,
-)
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol
 
 from ..core.change import Change
 from ..core.exceptions import ConnectionError, DeploymentError, EngineError
@@ -31,6 +28,7 @@ from ..core.types import (
     EngineType,
     sanitize_connection_string,
 )
+from ..utils.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +61,149 @@ class Connection(Protocol):
         ...
 
 
+# Seconds to wait for another process's deploy lock (see Engine.lock_destination)
+DEFAULT_LOCK_TIMEOUT = 60
+
+# Maximum length of SQL excerpts in slow statement log entries
+SLOW_STATEMENT_EXCERPT_LENGTH = 80
+
+
+@dataclass
+class SlowStatement:
+    """A script statement that exceeded the slow statement threshold."""
+
+    sql_file: Optional[Path]
+    line: Optional[int]
+    sql: str
+    elapsed_ms: float
+
+    @property
+    def location(self) -> str:
+        """Get 'file:line' location of the statement."""
+        location = str(self.sql_file) if self.sql_file else "<unknown>"
+        if self.line is not None:
+            location = f"{location}:{self.line}"
+        return location
+
+    @property
+    def excerpt(self) -> str:
+        """Get a single-line, truncated excerpt of the statement."""
+        text = " ".join(self.sql.split())
+        if len(text) > SLOW_STATEMENT_EXCERPT_LENGTH:
+            text = text[: SLOW_STATEMENT_EXCERPT_LENGTH - 3] + "..."
+        return text
+
+
+@dataclass
+class RegistryStatus:
+    """Deployment status of a project, read from the registry in one go."""
+
+    # Most recently deployed change (as returned by get_current_state)
+    state: Optional[Dict[str, Any]]
+    # Deployed changes and tags, most recent first
+    changes: List[Dict[str, Any]]
+    tags: List[Dict[str, Any]]
+    # Planned changes that are not deployed, in plan order
+    pending: List[Change]
+
+    @property
+    def pending_count(self) -> int:
+        """Get number of planned changes that are not deployed."""
+        return len(self.pending)
+
+
+class ConnectionCache:
+    """
+    Keep engine connections open between operations.
+
+    Connections are keyed by engine type and target URI. A connection is
+    checked out for the duration of an operation and handed back only if
+    the operation succeeded, after rolling back any open transaction;
+    connections involved in a failure are closed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty connection cache."""
+        self._connections: Dict[str, Connection] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> Optional[Connection]:
+        """
+        Check out a cached connection.
+
+        Args:
+            key: Connection key
+
+        Returns:
+            Cached connection, or None if there is none
+        """
+        with self._lock:
+            return self._connections.pop(key, None)
+
+    def release(self, key: str, connection: Connection) -> None:
+        """
+        Hand a connection back for reuse.
+
+        Args:
+            key: Connection key
+            connection: Connection to keep open
+        """
+        with self._lock:
+            previous = self._connections.pop(key, None)
+            self._connections[key] = connection
+        if previous is not None and previous is not connection:
+            _close_quietly(previous)
+
+    def close_all(self) -> None:
+        """Close all cached connections."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            _close_quietly(connection)
+
+    def __len__(self) -> int:
+        """Get number of cached connections."""
+        return len(self._connections)
+
+
+def _close_quietly(connection: Connection) -> None:
+    """Close a connection, ignoring errors."""
+    try:
+        connection.close()
+    except Exception:
+        pass  # Ignore close errors
+
+
+# Connection cache, only enabled by long-running processes (see
+# set_connection_cache); one-shot CLI invocations connect per operation
+_connection_cache: Optional[ConnectionCache] = None
+
+
+def set_connection_cache(cache: Optional[ConnectionCache]) -> None:
+    """
+    Enable or disable reuse of engine connections between operations.
+
+    Args:
+        cache: Cache to use (None disables connection reuse)
+    """
+    global _connection_cache
+    _connection_cache = cache
+
+
+def snapshot_key(change_ids: Iterable[str]) -> str:
+    """
+    Get the snapshot key for a sequence of deployed changes.
+
+    Args:
+        change_ids: Deployed change IDs in deployment order
+
+    Returns:
+        SHA-1 hex digest identifying the sequence
+    """
+    return hashlib.sha1("\n".join(change_ids).encode("utf-8")).hexdigest()
+
+
 class RegistrySchema:
     """Schema definition for sqitch registry tables."""
 
@@ -74,6 +215,16 @@ class RegistrySchema:
     DEPENDENCIES_TABLE = "dependencies"
     EVENTS_TABLE = "events"
 
+    # Registry tables in foreign key order (referenced tables first)
+    TABLES = (
+        RELEASES_TABLE,
+        PROJECTS_TABLE,
+        CHANGES_TABLE,
+        TAGS_TABLE,
+        DEPENDENCIES_TABLE,
+        EVENTS_TABLE,
+    )
+
     # Registry version for schema upgrades
     REGISTRY_VERSION = "1.1"
 
@@ -113,7 +264,11 @@ class Engine(ABC):
         self.plan = plan
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._connection: Optional[Connection] = None
+        self._session: Optional[Connection] = None
         self._registry_exists: Optional[bool] = None
+        self._slow_statement_ms: Optional[float] = None
+        self.slow_statements: List[SlowStatement] = []
+        self.lock_timeout = DEFAULT_LOCK_TIMEOUT
 
     @property
     @abstractmethod
@@ -173,6 +328,111 @@ class Engine(ABC):
         """
         ...
 
+    def set_slow_statement_threshold(self, threshold_ms: Optional[float]) -> None:
+        """
+        Set the slow statement threshold.
+
+        Script statements taking at least this long are logged and collected
+        in ``slow_statements``.
+
+        Args:
+            threshold_ms: Threshold in milliseconds (None disables the log)
+        """
+        self._slow_statement_ms = threshold_ms
+
+    def set_lock_timeout(self, timeout: int) -> None:
+        """
+        Set how long to wait for another process's deploy lock.
+
+        Args:
+            timeout: Timeout in seconds
+        """
+        self.lock_timeout = timeout
+
+    @contextmanager
+    def lock_destination(self) -> Iterator[None]:
+        """
+        Hold the target's deploy lock for a whole deploy or revert run.
+
+        Engines that can serialize concurrent sqlitch processes override
+        this; the default takes no lock.
+
+        Yields:
+            None, while the lock is held
+
+        Raises:
+            EngineError: If the lock cannot be obtained in time
+        """
+        yield
+
+    def _execute_statement(
+        self,
+        connection: Connection,
+        statement: str,
+        sql_file: Optional[Path] = None,
+        line: Optional[int] = None,
+    ) -> Any:
+        """
+        Execute a single statement from a change script.
+
+        Engines route script statements through this method so that
+        statement-level instrumentation is shared by all of them.
+
+        Args:
+            connection: Database connection
+            statement: SQL statement to execute
+            sql_file: Script the statement was read from
+            line: Line in the script where the statement starts
+
+        Returns:
+            Result of the connection's execute call
+        """
+        with (
+            get_tracer().span(
+                "sql.statement",
+                file=str(sql_file) if sql_file else None,
+                line=line,
+                sql=statement[:200],
+            ),
+            self._timed_statement(statement, sql_file, line),
+        ):
+            return connection.execute(statement)
+
+    @contextmanager
+    def _timed_statement(
+        self,
+        statement: str,
+        sql_file: Optional[Path] = None,
+        line: Optional[int] = None,
+    ) -> Iterator[None]:
+        """
+        Time a script statement and record it if it was slow.
+
+        Statements are recorded even when they fail, since a statement that
+        ran into a lock timeout is exactly the one worth reporting.
+
+        Args:
+            statement: SQL statement being executed
+            sql_file: Script the statement was read from
+            line: Line in the script where the statement starts
+        """
+        if self._slow_statement_ms is None:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            if elapsed_ms >= self._slow_statement_ms:
+                slow = SlowStatement(sql_file, line, statement, elapsed_ms)
+                self.slow_statements.append(slow)
+                self.logger.warning(
+                    f"Slow statement ({elapsed_ms:.0f} ms) at {slow.location}: "
+                    f"{slow.excerpt}"
+                )
+
     @contextmanager
     def connection(self) -> Iterator[Connection]:
         """
@@ -185,12 +445,23 @@ class Engine(ABC):
             ConnectionError: If connection cannot be established
         """
         conn = None
+        session = self._session
+        cache = _connection_cache
+        cache_key = f"{self.engine_type}:{self.target.uri}"
+        reusable = False
         try:
-            conn = self._create_connection()
-            self.logger.debug(
-                f"Connected to {sanitize_connection_string(str(self.target.uri))}"
-            )
+            if session is not None:
+                conn = session
+            elif cache is not None:
+                conn = cache.acquire(cache_key)
+            if conn is None:
+                with get_tracer().span("engine.connect", engine=self.engine_type):
+                    conn = self._create_connection()
+                self.logger.debug(
+                    f"Connected to {sanitize_connection_string(str(self.target.uri))}"
+                )
             yield conn
+            reusable = cache is not None
         except Exception as e:
             if conn:
                 try:
@@ -203,11 +474,42 @@ class Engine(ABC):
                 engine_name=self.engine_type,
             ) from e
         finally:
-            if conn:
-                try:
-                    conn.close()
-                except Exception:
-                    pass  # Ignore close errors
+            if conn and conn is not session:
+                if reusable:
+                    # End any read transaction, so that a cached connection
+                    # holds no snapshot or locks until it is used again
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        reusable = False
+                if reusable:
+                    cache.release(cache_key, conn)
+                else:
+                    _close_quietly(conn)
+
+    @contextmanager
+    def _hold_session(self) -> Iterator[None]:
+        """
+        Share one connection between all operations in a block.
+
+        Engines whose logins are expensive use this from lock_destination,
+        so that a deploy or revert run connects once. A failed operation
+        rolls back but leaves the session open for the next one.
+
+        Yields:
+            None, while the session is open
+        """
+        if self._session is not None:
+            yield
+            return
+
+        with get_tracer().span("engine.connect", engine=self.engine_type):
+            self._session = self._create_connection()
+        try:
+            yield
+        finally:
+            session, self._session = self._session, None
+            _close_quietly(session)
 
     @contextmanager
     def transaction(self) -> Iterator[Connection]:
@@ -247,18 +549,30 @@ class Engine(ABC):
             return
 
         with self.transaction() as conn:
-            # Check if registry exists
-            if not self._registry_exists_in_db(conn):
-                self.logger.info("Creating sqitch registry")
-                self._create_registry(conn)
-            else:
-                # Check version and upgrade if needed
-                current_version = self._get_registry_version(conn)
-                if current_version != self.registry_schema.REGISTRY_VERSION:
-                    self.logger.info(
-                        f"Upgrading registry from {current_version} to {self.registry_schema.REGISTRY_VERSION}"
-                    )
-                    self._upgrade_registry(conn, current_version)
+            self._ensure_registry(conn)
+
+    def _ensure_registry(self, conn: Connection) -> None:
+        """
+        Create or upgrade the registry using an open connection.
+
+        Args:
+            conn: Database connection (the caller commits)
+        """
+        if self._registry_exists is True:
+            return
+
+        # Check if registry exists
+        if not self._registry_exists_in_db(conn):
+            self.logger.info("Creating sqitch registry")
+            self._create_registry(conn)
+        else:
+            # Check version and upgrade if needed
+            current_version = self._get_registry_version(conn)
+            if current_version != self.registry_schema.REGISTRY_VERSION:
+                self.logger.info(
+                    f"Upgrading registry from {current_version} to {self.registry_schema.REGISTRY_VERSION}"
+                )
+                self._upgrade_registry(conn, current_version)
 
         self._registry_exists = True
 
@@ -479,6 +793,105 @@ class Engine(ABC):
                     f"Failed to get current state: {e}", engine_name=self.engine_type
                 ) from e
 
+    def get_status(self, project: Optional[str] = None) -> RegistryStatus:
+        """
+        Get the deployment status of a project in one connection.
+
+        The registry is checked (and created if needed), then deployed changes
+        and tags are each read with a single query. Undeployed changes are
+        found with a set difference against the plan.
+
+        Args:
+            project: Project name (defaults to plan project)
+
+        Returns:
+            Registry status
+
+        Raises:
+            EngineError: If a query fails
+        """
+        project_name = project or self.plan.project_name
+
+        with self.connection() as conn:
+            if self._registry_exists is not True:
+                self._ensure_registry(conn)
+                conn.commit()
+
+            try:
+                conn.execute(
+                    f"""
+                    SELECT change_id, script_hash, change, project, note,
+                           committer_name, committer_email, committed_at,
+                           planner_name, planner_email, planned_at
+                    FROM {self.registry_schema.CHANGES_TABLE}
+                    WHERE project = ?
+                    ORDER BY committed_at DESC
+                    """,
+                    {"project": project_name},
+                )
+                changes = [
+                    {
+                        "change_id": row["change_id"],
+                        "script_hash": row["script_hash"],
+                        "change": row["change"],
+                        "project": row["project"],
+                        "note": row["note"] or "",
+                        "committer_name": row["committer_name"],
+                        "committer_email": row["committer_email"],
+                        "committed_at": row["committed_at"],
+                        "planner_name": row["planner_name"],
+                        "planner_email": row["planner_email"],
+                        "planned_at": row["planned_at"],
+                    }
+                    for row in conn.fetchall()
+                ]
+
+                conn.execute(
+                    f"""
+                    SELECT tag_id, tag, change_id, committer_name, committer_email,
+                           committed_at, planner_name, planner_email, planned_at
+                    FROM {self.registry_schema.TAGS_TABLE}
+                    WHERE project = ?
+                    ORDER BY committed_at DESC
+                    """,
+                    {"project": project_name},
+                )
+                tags = [
+                    {
+                        "tag_id": row["tag_id"],
+                        "tag": row["tag"],
+                        "change_id": row["change_id"],
+                        "committer_name": row["committer_name"],
+                        "committer_email": row["committer_email"],
+                        "committed_at": row["committed_at"],
+                        "planner_name": row["planner_name"],
+                        "planner_email": row["planner_email"],
+                        "planned_at": row["planned_at"],
+                    }
+                    for row in conn.fetchall()
+                ]
+
+            except Exception as e:
+                raise EngineError(
+                    f"Failed to get status: {e}", engine_name=self.engine_type
+                ) from e
+
+        state = None
+        if changes:
+            state = dict(changes[0])
+            state["tags"] = [
+                tag["tag"]
+                for tag in reversed(tags)
+                if tag["change_id"] == state["change_id"]
+            ]
+
+        deployed_ids = {change["change_id"] for change in changes}
+        pending = [
+            change for change in self.plan.changes if change.id not in deployed_ids
+        ]
+
+        return RegistryStatus(state=state, changes=changes, tags=tags, pending=pending)
+
     def get_current_changes(
         self, project: Optional[str] = None
     ) -> Iterator[Dict[str, Any]]:
@@ -758,15 +1171,23 @@ class Engine(ABC):
 
         self.logger.info(f"Deploying {change.name}")
 
-        with self.transaction() as conn:
+        tracer = get_tracer()
+        with (
+            tracer.span(
+                "engine.deploy_change", engine=self.engine_type, change=change.name
+            ),
+            self.transaction() as conn,
+        ):
             try:
                 # Execute deploy script
                 deploy_file = self.plan.get_deploy_file(change)
                 if deploy_file.exists():
-                    self._execute_sql_file(conn, deploy_file)
+                    with tracer.span("script.execute", file=str(deploy_file)):
+                        self._execute_sql_file(conn, deploy_file)
 
                 # Record deployment in registry
-                self._record_change_deployment(conn, change)
+                with tracer.span("registry.write", operation="deploy"):
+                    self._record_change_deployment(conn, change)
 
                 self.logger.info(f"Successfully deployed {change.name}")
 
@@ -792,15 +1213,23 @@ class Engine(ABC):
 
         self.logger.info(f"Reverting {change.name}")
 
-        with self.transaction() as conn:
+        tracer = get_tracer()
+        with (
+            tracer.span(
+                "engine.revert_change", engine=self.engine_type, change=change.name
+            ),
+            self.transaction() as conn,
+        ):
             try:
                 # Execute revert script
                 revert_file = self.plan.get_revert_file(change)
                 if revert_file.exists():
-                    self._execute_sql_file(conn, revert_file)
+                    with tracer.span("script.execute", file=str(revert_file)):
+                        self._execute_sql_file(conn, revert_file)
 
                 # Remove from registry
-                self._record_change_revert(conn, change)
+                with tracer.span("registry.write", operation="revert"):
+                    self._record_change_revert(conn, change)
 
                 self.logger.info(f"Successfully reverted {change.name}")
 
@@ -827,11 +1256,18 @@ class Engine(ABC):
         """
         self.logger.info(f"Verifying {change.name}")
 
+        tracer = get_tracer()
         try:
-            with self.connection() as conn:
+            with (
+                tracer.span(
+                    "engine.verify_change", engine=self.engine_type, change=change.name
+                ),
+                self.connection() as conn,
+            ):
                 verify_file = self.plan.get_verify_file(change)
                 if verify_file.exists():
-                    self._execute_sql_file(conn, verify_file)
+                    with tracer.span("script.execute", file=str(verify_file)):
+                        self._execute_sql_file(conn, verify_file)
 
                 self.logger.info(f"Successfully verified {change.name}")
                 return True
@@ -840,6 +1276,95 @@ class Engine(ABC):
             self.logger.error(f"Verification failed for {change.name}: {e}")
             return False
 
+    @property
+    def supports_snapshots(self) -> bool:
+        """Whether this engine can save and restore database snapshots."""
+        return False
+
+    def has_snapshot(self, key: str) -> bool:
+        """
+        Check whether a snapshot exists.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+
+        Returns:
+            True if a snapshot was saved under the key
+        """
+        return False
+
+    def save_snapshot(self, key: str) -> None:
+        """
+        Save a snapshot of the database, including the registry.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+
+        Raises:
+            EngineError: If snapshots are not supported for the target
+        """
+        raise EngineError(
+            f"Snapshots are not supported for this {self.engine_type} target",
+            engine_name=self.engine_type,
+        )
+
+    def restore_snapshot(self, key: str) -> None:
+        """
+        Replace the database with a previously saved snapshot.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+
+        Raises:
+            EngineError: If snapshots are not supported for the target
+        """
+        raise EngineError(
+            f"Snapshots are not supported for this {self.engine_type} target",
+            engine_name=self.engine_type,
+        )
+
+    def export_registry(
+        self, directory: Path, file_format: str = "csv"
+    ) -> Dict[str, int]:
+        """
+        Export the registry tables to one file per table.
+
+        Args:
+            directory: Directory to write the files to
+            file_format: File format (engine specific)
+
+        Returns:
+            Number of rows exported, keyed by table
+
+        Raises:
+            EngineError: If registry export is not supported for the target
+        """
+        raise EngineError(
+            f"Registry export is not supported for this {self.engine_type} target",
+            engine_name=self.engine_type,
+        )
+
+    def import_registry(
+        self, directory: Path, file_format: str = "csv"
+    ) -> Dict[str, int]:
+        """
+        Load registry tables exported by export_registry into an empty registry.
+
+        Args:
+            directory: Directory to read the files from
+            file_format: File format (engine specific)
+
+        Returns:
+            Number of rows imported, keyed by table
+
+        Raises:
+            EngineError: If registry import is not supported for the target
+        """
+        raise EngineError(
+            f"Registry import is not supported for this {self.engine_type} target",
+            engine_name=self.engine_type,
+        )
+
     def _record_change_deployment(self, connection: Connection, change: Change) -> None:
         """
         Record change deployment in registry.
@@ -1045,11 +1570,41 @@ class Engine(ABC):
         return " ".join(tags) if tags else ""
 
 
+# Engine modules, keyed by engine type, imported on first use so that
+# database drivers are only loaded for the engines actually in use
+ENGINE_MODULES: Dict[str, str] = {
+    "pg": "sqlitch.engines.pg",
+    "mysql": "sqlitch.engines.mysql",
+    "sqlite": "sqlitch.engines.sqlite",
+    "oracle": "sqlitch.engines.oracle",
+    "snowflake": "sqlitch.engines.snowflake",
+    "vertica": "sqlitch.engines.vertica",
+    "exasol": "sqlitch.engines.exasol",
+    "firebird": "sqlitch.engines.firebird",
+}
+
+
 class EngineRegistry:
     """Registry for database engine classes."""
 
     _engines: Dict[EngineType, type] = {}
 
+    @classmethod
+    def _load_engine_module(cls, engine_type: str) -> None:
+        """
+        Import the module for an engine type so that it registers itself.
+
+        Args:
+            engine_type: Engine type identifier
+        """
+        module_name = ENGINE_MODULES.get(engine_type)
+        if module_name is None:
+            return
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass  # Engine not available
+
     @classmethod
     def register(cls, engine_type: EngineType, engine_class: type) -> None:
         """
@@ -1075,6 +1630,8 @@ class EngineRegistry:
         Raises:
             EngineError: If engine type not supported
         """
+        if engine_type not in cls._engines:
+            cls._load_engine_module(engine_type)
         if engine_type not in cls._engines:
             raise EngineError(f"Unsupported engine type: {engine_type}")
         return cls._engines[engine_type]
@@ -1105,6 +1662,9 @@ class EngineRegistry:
         Returns:
             List of supported engine types
         """
+        for engine_type in ENGINE_MODULES:
+            if engine_type not in cls._engines:
+                cls._load_engine_module(engine_type)
         return list(cls._engines.keys())
 
     def planned_deployed_common_ancestor_id(self) -> Optional[str]:
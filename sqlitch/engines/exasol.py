@@ -8,7 +8,7 @@ SQL execution with proper error handling and transaction management.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs
 
 from ..core.exceptions import ConnectionError, DeploymentError, EngineError
@@ -343,13 +343,11 @@ class ExasolEngine(Engine):
             sql_content = sql_content.replace("&registry", self._registry_schema_name)
 
             # Split into individual statements and execute
-            statements = self._split_sql_statements(sql_content)
-
-            for statement in statements:
+            for statement, line in self._split_statement_lines(sql_content):
                 statement = statement.strip()
                 if statement and not statement.startswith("--"):
                     self.logger.debug(f"Executing SQL: {statement[:100]}...")
-                    connection.execute(statement)
+                    self._execute_statement(connection, statement, sql_file, line)
 
         except Exception as e:
             raise DeploymentError(
@@ -357,41 +355,44 @@ class ExasolEngine(Engine):
                 engine_name=self.engine_type,
             ) from e
 
-    def _split_sql_statements(self, sql_content: str) -> List[str]:
+    def _split_statement_lines(self, sql_content: str) -> List[Tuple[str, int]]:
         """
-        Split SQL content into individual statements.
+        Split SQL content into statements with their starting lines.
 
         Args:
             sql_content: SQL content to split
 
         Returns:
-            List of SQL statements
+            Tuples of (statement, 1-based line number it starts on)
         """
         # Remove comments and split on semicolons
         statements = []
         current_statement = []
+        start = 1
 
-        for line in sql_content.split("\n"):
+        for number, line in enumerate(sql_content.split("\n"), 1):
             line = line.strip()
 
             # Skip empty lines and comments
             if not line or line.startswith("--"):
                 continue
 
+            if not current_statement:
+                start = number
             current_statement.append(line)
 
             # Check if line ends with semicolon (end of statement)
             if line.endswith(";"):
                 statement = " ".join(current_statement)
                 if statement.strip():
-                    statements.append(statement)
+                    statements.append((statement, start))
                 current_statement = []
 
         # Add any remaining statement
         if current_statement:
             statement = " ".join(current_statement)
             if statement.strip():
-                statements.append(statement)
+                statements.append((statement, start))
 
         return statements
 
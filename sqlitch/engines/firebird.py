@@ -8,7 +8,7 @@ SQL execution with proper error handling and transaction management.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 try:
@@ -362,8 +362,7 @@ class FirebirdEngine(Engine):
             DeploymentError: If SQL execution fails
         """
         try:
-            with open(sql_file, "r", encoding="utf-8") as f:
-                sql_content = f.read()
+            sql_content = sql_file.read_text(encoding="utf-8")
 
             # Perform variable substitution if provided
             if variables:
@@ -372,13 +371,11 @@ class FirebirdEngine(Engine):
 
             # Split SQL content into individual statements
             # Firebird uses semicolon as statement separator
-            statements = self._split_sql_statements(sql_content)
-
-            for statement in statements:
+            for statement, line in self._split_statement_lines(sql_content):
                 statement = statement.strip()
                 if statement and not statement.startswith("--"):
                     self.logger.debug(f"Executing: {statement[:100]}...")
-                    connection.execute(statement)
+                    self._execute_statement(connection, statement, sql_file, line)
 
         except Exception as e:
             raise DeploymentError(
@@ -387,23 +384,24 @@ class FirebirdEngine(Engine):
                 engine_name=self.engine_type,
             ) from e
 
-    def _split_sql_statements(self, sql_content: str) -> List[str]:
+    def _split_statement_lines(self, sql_content: str) -> List[Tuple[str, int]]:
         """
-        Split SQL content into individual statements.
+        Split SQL content into statements with their starting lines.
 
         Args:
             sql_content: SQL content to split
 
         Returns:
-            List of SQL statements
+            Tuples of (statement, 1-based line number it starts on)
         """
         # Remove comments and split by semicolon
         # This is a simple implementation - more sophisticated parsing
         # might be needed for complex SQL with embedded semicolons
         statements = []
         current_statement = []
+        start = 1
 
-        for line in sql_content.split("\n"):
+        for number, line in enumerate(sql_content.split("\n"), 1):
             line = line.strip()
 
             # Skip empty lines and comments
@@ -414,20 +412,22 @@ class FirebirdEngine(Engine):
             if "--" in line:
                 line = line[: line.index("--")].strip()
 
+            if not current_statement:
+                start = number
             current_statement.append(line)
 
             # Check if statement ends with semicolon
             if line.endswith(";"):
                 statement = " ".join(current_statement)
                 if statement.strip():
-                    statements.append(statement)
+                    statements.append((statement, start))
                 current_statement = []
 
         # Add any remaining statement
         if current_statement:
             statement = " ".join(current_statement)
             if statement.strip():
-                statements.append(statement)
+                statements.append((statement, start))
 
         return statements
 
@@ -10,7 +10,7 @@ import logging
 import re
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 from ..core.change import Change
@@ -18,6 +18,7 @@ from ..core.exceptions import ConnectionError, DeploymentError, EngineError
 from ..core.plan import Plan
 from ..core.target import Target
 from ..core.types import EngineType, sanitize_connection_string
+from ..utils.tracing import get_tracer
 from .base import Engine, RegistrySchema, register_engine
 
 # Try to import PyMySQL
@@ -25,13 +26,36 @@ try:
     import pymysql
     import pymysql.cursors
     from pymysql import Error as MySQLError
+    from pymysql.constants import CLIENT
 except ImportError:
     pymysql = None
     MySQLError = None
+    CLIENT = None
 
 
 logger = logging.getLogger(__name__)
 
+# SQL mode required by the Sqitch registry
+SQL_MODE = (
+    "ansi,strict_trans_tables,no_auto_value_on_zero,no_zero_date,"
+    "no_zero_in_date,only_full_group_by,error_for_division_by_zero"
+)
+
+# Maximum size of script SQL sent in one multi-statement round trip
+SCRIPT_BATCH_SIZE = 1024 * 1024
+
+# Statements sent on their own, because they return extra result sets
+_UNBATCHED_STATEMENT = re.compile(r"CALL\b", re.IGNORECASE)
+
+# Session settings applied in a single statement when connecting
+SESSION_INIT_COMMAND = (
+    "SET SESSION character_set_client = 'utf8mb4', "
+    "character_set_server = 'utf8mb4', "
+    "time_zone = '+00:00', "
+    "group_concat_max_len = 32768, "
+    f"sql_mode = '{SQL_MODE}'"
+)
+
 
 class MySQLRegistrySchema(RegistrySchema):
     """MySQL-specific registry schema."""
@@ -49,7 +73,7 @@ class MySQLRegistrySchema(RegistrySchema):
         """
         return [
             # Set SQL mode for ANSI compliance
-            "SET SESSION sql_mode = 'ansi,strict_trans_tables,no_auto_value_on_zero,no_zero_date,no_zero_in_date,only_full_group_by,error_for_division_by_zero'",
+            f"SET SESSION sql_mode = '{SQL_MODE}'",
             # Releases table
             f"""
             CREATE TABLE IF NOT EXISTS {cls.RELEASES_TABLE} (
@@ -238,6 +262,39 @@ class MySQLConnection:
                 ),
             ) from e
 
+    def execute_batch(self, statements: List[str]) -> None:
+        """
+        Execute several statements in one multi-statement round trip.
+
+        All result sets are drained, so that an error in any statement is
+        raised here rather than by the next query.
+
+        Args:
+            statements: SQL statements, without trailing delimiters
+
+        Raises:
+            DeploymentError: If a statement fails; its position in the
+                batch is available as ``context["statement_index"]``
+        """
+        index = 0
+        try:
+            cursor = self._get_cursor()
+            cursor.execute(";\n".join(statements))
+            index = 1
+            while cursor.nextset():
+                index += 1
+        except MySQLError as e:
+            raise DeploymentError(
+                f"SQL execution failed: {e}",
+                engine_name="mysql",
+                sql_state=(
+                    getattr(e, "args", [None, None])[1]
+                    if hasattr(e, "args") and len(e.args) > 1
+                    else None
+                ),
+                statement_index=index,
+            ) from e
+
     def fetchone(self) -> Optional[Dict[str, Any]]:
         """
         Fetch one row from result set.
@@ -314,6 +371,7 @@ class MySQLEngine(Engine):
         self._registry_db_name = target.registry or self._connection_params.get(
             "database", "sqitch"
         )
+        self._server_version: Optional[str] = None
 
     @property
     def engine_type(self) -> EngineType:
@@ -363,6 +421,8 @@ class MySQLEngine(Engine):
                 "charset": "utf8mb4",
                 "autocommit": False,
                 "cursorclass": pymysql.cursors.DictCursor,
+                "init_command": SESSION_INIT_COMMAND,
+                "client_flag": CLIENT.MULTI_STATEMENTS,
             }
 
             # Handle query parameters
@@ -406,6 +466,38 @@ class MySQLEngine(Engine):
                 engine_name="mysql",
             ) from e
 
+    def _check_server_version(self, version_info: str) -> None:
+        """
+        Check the server meets Sqitch's minimum version and cache it.
+
+        The version comes from the connection handshake, so checking it
+        costs no extra round trip; it is only checked once per engine.
+
+        Args:
+            version_info: Server version string
+
+        Raises:
+            EngineError: If the server is too old
+        """
+        version_match = re.search(r"(\d+)\.(\d+)\.(\d+)", version_info)
+        if version_match:
+            major, minor, patch = map(int, version_match.groups())
+            if "mariadb" in version_info.lower():
+                # MariaDB 5.3.0 or higher required
+                if (major, minor) < (5, 3):
+                    raise EngineError(
+                        f"Sqitch requires MariaDB 5.3.0 or higher; this is {version_info}",
+                        engine_name="mysql",
+                    )
+            elif (major, minor) < (5, 1):
+                # MySQL 5.1.0 or higher required
+                raise EngineError(
+                    f"Sqitch requires MySQL 5.1.0 or higher; this is {version_info}",
+                    engine_name="mysql",
+                )
+
+        self._server_version = version_info
+
     def _create_connection(self) -> MySQLConnection:
         """
         Create a new MySQL connection.
@@ -421,44 +513,15 @@ class MySQLEngine(Engine):
                 f"Connecting to MySQL: {sanitize_connection_string(str(self.target.uri))}"
             )
 
-            # Create connection
+            # Session settings are applied by init_command during connect
             conn = pymysql.connect(**self._connection_params)
 
-            # Set MySQL session variables for sqitch compatibility
-            with conn.cursor() as cursor:
-                cursor.execute("SET SESSION character_set_client = 'utf8mb4'")
-                cursor.execute("SET SESSION character_set_server = 'utf8mb4'")
-                cursor.execute("SET SESSION time_zone = '+00:00'")
-                cursor.execute("SET SESSION group_concat_max_len = 32768")
-                cursor.execute(
-                    """SET SESSION sql_mode = 'ansi,strict_trans_tables,no_auto_value_on_zero,no_zero_date,no_zero_in_date,only_full_group_by,error_for_division_by_zero'"""
-                )
-
-                # Check MySQL version compatibility
-                cursor.execute("SELECT VERSION()")
-                version_info = cursor.fetchone()["VERSION()"]
-
-                # Parse version to check minimum requirements
-                if "mariadb" in version_info.lower():
-                    # MariaDB 5.3.0 or higher required
-                    version_match = re.search(r"(\d+)\.(\d+)\.(\d+)", version_info)
-                    if version_match:
-                        major, minor, patch = map(int, version_match.groups())
-                        if (major, minor) < (5, 3):
-                            raise EngineError(
-                                f"Sqitch requires MariaDB 5.3.0 or higher; this is {version_info}",
-                                engine_name="mysql",
-                            )
-                else:
-                    # MySQL 5.1.0 or higher required
-                    version_match = re.search(r"(\d+)\.(\d+)\.(\d+)", version_info)
-                    if version_match:
-                        major, minor, patch = map(int, version_match.groups())
-                        if (major, minor) < (5, 1):
-                            raise EngineError(
-                                f"Sqitch requires MySQL 5.1.0 or higher; this is {version_info}",
-                                engine_name="mysql",
-                            )
+            if self._server_version is None:
+                try:
+                    self._check_server_version(conn.get_server_info())
+                except EngineError:
+                    conn.close()
+                    raise
 
             return MySQLConnection(conn)
 
@@ -505,17 +568,22 @@ class MySQLEngine(Engine):
                     placeholder = f":{var_name}"
                     sql_content = sql_content.replace(placeholder, str(var_value))
 
-            # Split into individual statements and execute
-            statements = self._split_sql_statements(sql_content)
-
-            for statement in statements:
-                statement = statement.strip()
-                if (
-                    statement
-                    and not statement.startswith("--")
-                    and not statement.startswith("#")
-                ):
-                    connection.execute(statement)
+            # Split into individual statements
+            statements = [
+                (statement.strip(), line)
+                for statement, line in self._split_statement_lines(sql_content)
+                if statement.strip()
+                and not statement.strip().startswith("--")
+                and not statement.strip().startswith("#")
+            ]
+
+            if self._slow_statement_ms is not None:
+                # Run statements one at a time so each one can be timed
+                for statement, line in statements:
+                    self._execute_statement(connection, statement, sql_file, line)
+            else:
+                for batch in self._batch_statements(statements):
+                    self._execute_batch(connection, batch, sql_file)
 
         except Exception as e:
             if isinstance(e, DeploymentError):
@@ -526,22 +594,100 @@ class MySQLEngine(Engine):
                 engine_name="mysql",
             ) from e
 
-    def _split_sql_statements(self, sql_content: str) -> List[str]:  # noqa: C901
+    def _batch_statements(
+        self, statements: List[Tuple[str, Optional[int]]]
+    ) -> Iterator[List[Tuple[str, Optional[int]]]]:
+        """
+        Group script statements into multi-statement batches.
+
+        Batches are limited to SCRIPT_BATCH_SIZE characters of SQL.
+        Statements returning extra result sets (CALL) are sent on their own,
+        so that a failing statement can be found from the result count.
+
+        Args:
+            statements: Statements paired with their starting line
+
+        Yields:
+            Lists of statements paired with their starting line
+        """
+        batch: List[Tuple[str, Optional[int]]] = []
+        size = 0
+        for statement, line in statements:
+            if _UNBATCHED_STATEMENT.match(statement):
+                if batch:
+                    yield batch
+                    batch, size = [], 0
+                yield [(statement, line)]
+                continue
+
+            if batch and size + len(statement) > SCRIPT_BATCH_SIZE:
+                yield batch
+                batch, size = [], 0
+            batch.append((statement, line))
+            size += len(statement) + 2
+
+        if batch:
+            yield batch
+
+    def _execute_batch(
+        self,
+        connection: MySQLConnection,
+        batch: List[Tuple[str, Optional[int]]],
+        sql_file: Path,
+    ) -> None:
         """
-        Split SQL content into individual statements.
+        Execute a batch of script statements in one round trip.
+
+        Args:
+            connection: MySQL connection
+            batch: Statements paired with their starting line
+            sql_file: Script the statements were read from
+
+        Raises:
+            DeploymentError: If a statement fails, naming its line
+        """
+        if len(batch) == 1:
+            statement, line = batch[0]
+            self._execute_statement(connection, statement, sql_file, line)
+            return
+
+        with get_tracer().span(
+            "sql.batch", file=str(sql_file), line=batch[0][1], statements=len(batch)
+        ):
+            try:
+                connection.execute_batch([statement for statement, _ in batch])
+            except DeploymentError as e:
+                index = e.context.get("statement_index")
+                if index is None or index >= len(batch):
+                    raise
+                line = batch[index][1]
+                location = f"{sql_file}:{line}" if line is not None else str(sql_file)
+                raise DeploymentError(
+                    f"{e.message} (statement at {location})",
+                    sql_file=str(sql_file),
+                    engine_name="mysql",
+                    sql_state=e.context.get("sql_state"),
+                ) from e
+
+    def _split_statement_lines(  # noqa: C901
+        self, sql_content: str
+    ) -> List[Tuple[str, int]]:
+        """
+        Split SQL content into statements with their starting lines.
 
         Args:
             sql_content: SQL content to split
 
         Returns:
-            List of SQL statements
+            Tuples of (statement, 1-based line number it starts on)
         """
         statements = []
         current_statement = []
+        start = 1
         in_delimiter_block = False
         custom_delimiter = ";"
 
-        for line in sql_content.split("\n"):
+        for number, line in enumerate(sql_content.split("\n"), 1):
             line = line.strip()
 
             # Skip empty lines and comments
@@ -556,6 +702,8 @@ class MySQLEngine(Engine):
                     in_delimiter_block = custom_delimiter != ";"
                 continue
 
+            if not current_statement:
+                start = number
             current_statement.append(line)
 
             # Check if line ends with current delimiter
@@ -567,7 +715,7 @@ class MySQLEngine(Engine):
 
                 statement_text = "\n".join(current_statement).strip()
                 if statement_text:
-                    statements.append(statement_text)
+                    statements.append((statement_text, start))
                 current_statement = []
 
                 # Reset delimiter if we're ending a delimiter block
@@ -579,7 +727,7 @@ class MySQLEngine(Engine):
         if current_statement:
             statement_text = "\n".join(current_statement).strip()
             if statement_text:
-                statements.append(statement_text)
+                statements.append((statement_text, start))
 
         return statements
 
@@ -931,12 +1079,59 @@ class MySQLEngine(Engine):
         """
         return " ".join(tags) if tags else ""
 
+    @property
+    def _lock_name(self) -> str:
+        """Get the advisory lock name for this project and registry."""
+        # Lock names are server-wide and limited to 64 characters
+        return f"sqitch:{self.plan.project_name}@{self._registry_db_name}"[:64]
+
+    @contextmanager
+    def lock_destination(self) -> Iterator[None]:
+        """
+        Hold a named advisory lock for a whole deploy or revert run.
+
+        The lock is held by a dedicated session, so registry tables stay
+        readable (by status or log) while changes are deployed.
+
+        Yields:
+            None, while the lock is held
+
+        Raises:
+            EngineError: If another process holds the lock past the timeout
+        """
+        conn = self._create_connection()
+        try:
+            conn.execute(
+                "SELECT GET_LOCK(%(name)s, %(timeout)s) AS locked",
+                {"name": self._lock_name, "timeout": self.lock_timeout},
+            )
+            row = conn.fetchone()
+            if not row or row["locked"] != 1:
+                raise EngineError(
+                    f"Timed out waiting {self.lock_timeout} seconds for another "
+                    f"instance of Sqitch to finish work on {self._registry_db_name}",
+                    engine_name="mysql",
+                )
+
+            try:
+                yield
+            finally:
+                try:
+                    conn.execute(
+                        "SELECT RELEASE_LOCK(%(name)s)", {"name": self._lock_name}
+                    )
+                except Exception:
+                    pass  # The lock is released when the session closes
+        finally:
+            conn.close()
+
     @contextmanager
     def transaction(self) -> Iterator[MySQLConnection]:
         """
-        Get database connection with transaction management and table locking.
+        Get database connection with transaction management.
 
-        MySQL requires table locking for concurrent access control.
+        Registry writes use ordinary InnoDB transactions; concurrent
+        deploys are serialized by lock_destination instead of table locks.
 
         Yields:
             Database connection with active transaction
@@ -947,23 +1142,8 @@ class MySQLEngine(Engine):
         """
         with self.connection() as conn:
             try:
-                # Switch to registry database for locking
+                # Switch to registry database
                 conn.execute(f"USE `{self._registry_db_name}`")
-
-                # Lock all registry tables to prevent concurrent modifications
-                # This matches the Perl implementation's locking strategy
-                tables_to_lock = [
-                    f"{self.registry_schema.RELEASES_TABLE} WRITE",
-                    f"{self.registry_schema.CHANGES_TABLE} WRITE",
-                    f"{self.registry_schema.DEPENDENCIES_TABLE} WRITE",
-                    f"{self.registry_schema.EVENTS_TABLE} WRITE",
-                    f"{self.registry_schema.PROJECTS_TABLE} WRITE",
-                    f"{self.registry_schema.TAGS_TABLE} WRITE",
-                ]
-
-                conn.execute(f"LOCK TABLES {', '.join(tables_to_lock)}")
-
-                # Start transaction after locking
                 conn.execute("START TRANSACTION")
 
                 yield conn
@@ -981,12 +1161,6 @@ class MySQLEngine(Engine):
                 raise DeploymentError(
                     f"Transaction failed: {e}", engine_name="mysql"
                 ) from e
-            finally:
-                try:
-                    # Always unlock tables
-                    conn.execute("UNLOCK TABLES")
-                except Exception:
-                    pass  # Ignore unlock errors
 
     def _regex_condition(self, column: str, pattern: str) -> str:
         """
@@ -6,16 +6,20 @@ base class, handling Oracle connections, registry management, and
 SQL execution with proper error handling and transaction management.
 """
 
+import bisect
 import logging
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, NoReturn, Optional, Tuple
 from urllib.parse import urlparse
 
+from ..core.change import Change
 from ..core.exceptions import ConnectionError, DeploymentError, EngineError
 from ..core.plan import Plan
 from ..core.target import Target
 from ..core.types import EngineType, sanitize_connection_string
+from ..utils.tracing import get_tracer
 from .base import Engine, RegistrySchema, register_engine
 
 # Try to import cx_Oracle
@@ -27,6 +31,51 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Statements kept parsed per session, so repeated registry writes and
+# queries skip the parse on the server
+STATEMENT_CACHE_SIZE = 50
+
+# Maximum size of script SQL sent in one anonymous block
+SCRIPT_BATCH_SIZE = 1024 * 1024
+
+# Longest statement that fits in a PL/SQL string literal, in bytes
+_PLSQL_LITERAL_LIMIT = 32767
+
+# Script chunks that are PL/SQL units, sent to the server as they are
+_PLSQL_UNIT = re.compile(
+    r"(DECLARE|BEGIN|CREATE\s+(OR\s+REPLACE\s+)?((NON)?EDITIONABLE\s+)?"
+    r"(PROCEDURE|FUNCTION|PACKAGE|TRIGGER|TYPE|LIBRARY)\b)",
+    re.IGNORECASE,
+)
+
+# Queries, which do nothing inside EXECUTE IMMEDIATE and so run on their own
+_QUERY = re.compile(r"(SELECT|WITH)\b", re.IGNORECASE)
+
+# Line of an anonymous block reported for an unhandled exception
+_BLOCK_ERROR_LINE = re.compile(r"ORA-06512: at line (\d+)")
+
+
+def _skip_comments(sql: str) -> str:
+    """
+    Skip leading whitespace and comments.
+
+    Args:
+        sql: SQL text
+
+    Returns:
+        SQL text from its first token, or an empty string if there is none
+    """
+    while True:
+        sql = sql.lstrip()
+        if sql.startswith("--"):
+            end = sql.find("\n")
+            sql = "" if end == -1 else sql[end + 1 :]
+        elif sql.startswith("/*"):
+            end = sql.find("*/", 2)
+            sql = "" if end == -1 else sql[end + 2 :]
+        else:
+            return sql
+
 
 class OracleRegistrySchema(RegistrySchema):
     """Oracle-specific registry schema."""
@@ -225,6 +274,19 @@ class OracleConnection:
         else:
             return self._cursor.execute(sql)
 
+    def executemany(self, sql: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Execute a statement for many rows with array binding.
+
+        All rows are sent in one round trip. The statement uses Oracle's
+        named binds (``:name``), which are bound from each row's keys.
+
+        Args:
+            sql: SQL statement or PL/SQL block with named binds
+            rows: Bind values, one dictionary per execution
+        """
+        self._cursor.executemany(sql, rows)
+
     def fetchone(self) -> Optional[Dict[str, Any]]:
         """Fetch one row from result set."""
         row = self._cursor.fetchone()
@@ -360,6 +422,9 @@ class OracleEngine(Engine):
                 user=username, password=password, dsn=dsn, encoding="UTF-8"
             )
 
+            # Keep repeated statements parsed for the life of the session
+            connection.stmtcachesize = STATEMENT_CACHE_SIZE
+
             # Set session parameters
             cursor = connection.cursor()
 
@@ -422,29 +487,24 @@ class OracleEngine(Engine):
         """
         try:
             # Read SQL file content
-            with open(sql_file, "r", encoding="utf-8") as f:
-                sql_content = f.read()
+            sql_content = sql_file.read_text(encoding="utf-8")
 
             # Perform variable substitution if variables provided
             if variables:
                 for key, value in variables.items():
                     sql_content = sql_content.replace(f"&{key}", str(value))
 
-            # Split into individual statements (Oracle uses / as statement separator)
-            statements = self._split_oracle_statements(sql_content)
+            # Split into PL/SQL units and SQL statements
+            statements = self._split_statement_lines(sql_content)
 
-            for statement in statements:
-                statement = statement.strip()
-                if statement and not statement.startswith("--"):
-                    try:
-                        connection.execute(statement)
-                    except Exception as e:
-                        raise DeploymentError(
-                            f"Failed to execute SQL statement: {e}\nStatement: {statement[:200]}...",
-                            change_name=sql_file.stem,
-                            operation="execute_sql",
-                            engine_name=self.engine_type,
-                        ) from e
+            if self._slow_statement_ms is not None:
+                # Run statements one at a time so each one can be timed
+                batches = [[statement] for statement in statements]
+            else:
+                batches = list(self._batch_statements(statements))
+
+            for batch in batches:
+                self._execute_batch(connection, batch, sql_file)
 
         except Exception as e:
             if isinstance(e, DeploymentError):
@@ -456,41 +516,237 @@ class OracleEngine(Engine):
                 engine_name=self.engine_type,
             ) from e
 
-    def _split_oracle_statements(self, sql_content: str) -> List[str]:
+    def _split_statement_lines(self, sql_content: str) -> List[Tuple[str, int]]:
+        """
+        Split a script into statements the server can run.
+
+        Chunks separated by ``/`` lines are split into SQL statements on
+        semicolons, which are dropped since Oracle does not accept them. A
+        PL/SQL unit runs to the end of its chunk and is kept whole.
+
+        Args:
+            sql_content: Script content
+
+        Returns:
+            Tuples of (statement, 1-based line number it starts on) in script
+            order
+        """
+        statements: List[Tuple[str, int]] = []
+        for chunk, first_line in self._split_oracle_statements(sql_content):
+            rest = chunk
+            while True:
+                # Comments between statements belong to neither of them
+                rest = _skip_comments(rest)
+                if not rest:
+                    break
+                line = first_line + chunk.count("\n", 0, len(chunk) - len(rest))
+                if _PLSQL_UNIT.match(rest):
+                    statements.append((rest.rstrip(), line))
+                    break
+                statement, rest = self._next_sql_statement(rest)
+                if statement:
+                    statements.append((statement, line))
+        return statements
+
+    @staticmethod
+    def _next_sql_statement(sql: str) -> Tuple[str, str]:
+        """
+        Find the first semicolon outside string literals and comments.
+
+        Args:
+            sql: SQL statements, each ending with a semicolon
+
+        Returns:
+            Tuple of (first statement without its semicolon, remaining SQL)
+        """
+        i = 0
+        while i < len(sql):
+            if sql[i] == "'":
+                end = sql.find("'", i + 1)
+                while end != -1 and sql[end + 1 : end + 2] == "'":
+                    end = sql.find("'", end + 2)
+                i = len(sql) if end == -1 else end + 1
+            elif sql.startswith("--", i):
+                end = sql.find("\n", i)
+                i = len(sql) if end == -1 else end + 1
+            elif sql.startswith("/*", i):
+                end = sql.find("*/", i + 2)
+                i = len(sql) if end == -1 else end + 2
+            elif sql[i] == ";":
+                return sql[:i].strip(), sql[i + 1 :]
+            else:
+                i += 1
+        return sql.strip(), ""
+
+    def _batch_statements(
+        self, statements: List[Tuple[str, Optional[int]]]
+    ) -> Iterator[List[Tuple[str, Optional[int]]]]:
+        """
+        Group SQL statements to run together in anonymous blocks.
+
+        PL/SQL units, queries and statements too long for a PL/SQL string
+        literal run on their own. Batches are limited to SCRIPT_BATCH_SIZE
+        characters of SQL.
+
+        Args:
+            statements: Statements paired with their starting line
+
+        Yields:
+            Lists of statements paired with their starting line
+        """
+        batch: List[Tuple[str, Optional[int]]] = []
+        size = 0
+        for statement, line in statements:
+            if (
+                _PLSQL_UNIT.match(_skip_comments(statement))
+                or _QUERY.match(_skip_comments(statement))
+                or len(statement.replace("'", "''").encode("utf-8"))
+                > _PLSQL_LITERAL_LIMIT
+            ):
+                if batch:
+                    yield batch
+                    batch, size = [], 0
+                yield [(statement, line)]
+                continue
+
+            if batch and size + len(statement) > SCRIPT_BATCH_SIZE:
+                yield batch
+                batch, size = [], 0
+            batch.append((statement, line))
+            size += len(statement) + 24
+
+        if batch:
+            yield batch
+
+    def _execute_batch(
+        self,
+        connection: OracleConnection,
+        batch: List[Tuple[str, Optional[int]]],
+        sql_file: Path,
+    ) -> None:
+        """
+        Execute a batch of script statements in one round trip.
+
+        A single statement is executed as it is; several are wrapped in an
+        anonymous block running each with EXECUTE IMMEDIATE.
+
+        Args:
+            connection: Oracle database connection
+            batch: Statements paired with their starting line
+            sql_file: Script the statements were read from
+
+        Raises:
+            DeploymentError: If a statement fails, naming its line
+        """
+        if len(batch) == 1:
+            statement, line = batch[0]
+            try:
+                self._execute_statement(connection, statement, sql_file, line)
+            except Exception as e:
+                self._raise_statement_error(e, statement, line, sql_file)
+            return
+
+        block, block_lines = self._anonymous_block([s for s, _ in batch])
+        with get_tracer().span(
+            "sql.batch", file=str(sql_file), line=batch[0][1], statements=len(batch)
+        ):
+            try:
+                connection.execute(block)
+            except Exception as e:
+                match = _BLOCK_ERROR_LINE.search(str(e))
+                index = (
+                    bisect.bisect_right(block_lines, int(match.group(1))) - 1
+                    if match
+                    else -1
+                )
+                if index < 0:
+                    self._raise_statement_error(e, block, batch[0][1], sql_file)
+                statement, line = batch[index]
+                self._raise_statement_error(e, statement, line, sql_file)
+
+    @staticmethod
+    def _anonymous_block(statements: List[str]) -> Tuple[str, List[int]]:
+        """
+        Wrap SQL statements in an anonymous PL/SQL block.
+
+        Args:
+            statements: SQL statements, without semicolons
+
+        Returns:
+            Tuple of (block, line of the block each statement starts on)
+        """
+        parts = ["BEGIN"]
+        starts = []
+        line = 2
+        for statement in statements:
+            part = "  EXECUTE IMMEDIATE '{}';".format(statement.replace("'", "''"))
+            starts.append(line)
+            parts.append(part)
+            line += part.count("\n") + 1
+        parts.append("END;")
+        return "\n".join(parts), starts
+
+    def _raise_statement_error(
+        self,
+        error: Exception,
+        statement: str,
+        line: Optional[int],
+        sql_file: Path,
+    ) -> NoReturn:
+        """
+        Raise a DeploymentError naming the failing statement.
+
+        Args:
+            error: Error raised by the statement
+            statement: Failing statement
+            line: Line in the script where the statement starts
+            sql_file: Script the statement was read from
+
+        Raises:
+            DeploymentError: Always
+        """
+        location = f"{sql_file}:{line}" if line is not None else str(sql_file)
+        raise DeploymentError(
+            f"Failed to execute SQL statement at {location}: {error}\n"
+            f"Statement: {statement[:200]}...",
+            change_name=sql_file.stem,
+            operation="execute_sql",
+            engine_name=self.engine_type,
+        ) from error
+
+    def _split_oracle_statements(self, sql_content: str) -> List[Tuple[str, int]]:
         """
         Split Oracle SQL content into individual statements.
 
         Oracle uses / on its own line as statement separator for PL/SQL blocks,
-        and semicolon for regular SQL statements.
+        and semicolon for regular SQL statements. Comment lines are kept, so
+        that lines within a statement can be counted from its first line.
 
         Args:
             sql_content: SQL content to split
 
         Returns:
-            List of individual SQL statements
+            Tuples of (statement, 1-based line number of its first line)
         """
         statements = []
         current_statement = []
-        lines = sql_content.split("\n")
-
-        for line in lines:
-            stripped_line = line.strip()
-
-            # Skip empty lines and comments
-            if not stripped_line or stripped_line.startswith("--"):
-                continue
+        start = 1
 
+        for number, line in enumerate(sql_content.split("\n"), 1):
             # Check for statement separator
-            if stripped_line == "/":
-                if current_statement:
-                    statements.append("\n".join(current_statement))
-                    current_statement = []
+            if line.strip() == "/":
+                statement = "\n".join(current_statement)
+                if _skip_comments(statement):
+                    statements.append((statement, start))
+                current_statement = []
+                start = number + 1
             else:
                 current_statement.append(line)
 
         # Add final statement if exists
-        if current_statement:
-            statements.append("\n".join(current_statement))
+        statement = "\n".join(current_statement)
+        if _skip_comments(statement):
+            statements.append((statement, start))
 
         return statements
 
@@ -658,3 +914,141 @@ class OracleEngine(Engine):
                     "creator_email": creator_email,
                 },
             )
+
+    def _record_change_deployment(
+        self, connection: OracleConnection, change: Change
+    ) -> None:
+        """
+        Record change deployment in Oracle registry.
+
+        The change and event rows are inserted by one anonymous block and
+        the dependencies with array binding, so a change costs at most two
+        round trips however many dependencies it has.
+
+        Args:
+            connection: Oracle database connection
+            change: Deployed change
+        """
+        schema_prefix = f"{self._registry_schema}." if self._registry_schema else ""
+        params = self._event_params(change)
+        params["script_hash"] = self._calculate_script_hash(change)
+
+        connection.executemany(
+            f"""
+            BEGIN
+                INSERT INTO {schema_prefix}{self.registry_schema.CHANGES_TABLE}
+                (change_id, script_hash, change, project, note, committer_name, committer_email, planned_at, planner_name, planner_email)
+                VALUES (:change_id, :script_hash, :change, :project, :note, :committer_name, :committer_email, :planned_at, :planner_name, :planner_email);
+                {self._insert_event_statement(change, "deploy")};
+            END;
+            """,
+            [params],
+        )
+
+        if change.dependencies:
+            connection.executemany(
+                f"""
+                INSERT INTO {schema_prefix}{self.registry_schema.DEPENDENCIES_TABLE}
+                (change_id, type, dependency, dependency_id)
+                VALUES (:change_id, :type, :dependency, :dependency_id)
+                """,
+                [
+                    {
+                        "change_id": change.id,
+                        "type": dep.type,
+                        "dependency": dep.change,
+                        "dependency_id": self._resolve_dependency_id(dep.change),
+                    }
+                    for dep in change.dependencies
+                ],
+            )
+
+    def _record_change_revert(
+        self, connection: OracleConnection, change: Change
+    ) -> None:
+        """
+        Record change revert in Oracle registry.
+
+        The change row (and with it its dependencies) is deleted and the
+        revert event inserted by one anonymous block.
+
+        Args:
+            connection: Oracle database connection
+            change: Reverted change
+        """
+        schema_prefix = f"{self._registry_schema}." if self._registry_schema else ""
+
+        connection.executemany(
+            f"""
+            BEGIN
+                DELETE FROM {schema_prefix}{self.registry_schema.CHANGES_TABLE}
+                WHERE change_id = :change_id;
+                {self._insert_event_statement(change, "revert")};
+            END;
+            """,
+            [self._event_params(change)],
+        )
+
+    def _insert_event_statement(self, change: Change, event: str) -> str:
+        """
+        Get the INSERT statement for a change's event, with named binds.
+
+        The requires, conflicts and tags columns are SQITCH_ARRAY values,
+        built from one bind per element.
+
+        Args:
+            change: Deployed or reverted change
+            event: Event type (deploy or revert)
+
+        Returns:
+            INSERT statement without a trailing semicolon
+        """
+        schema_prefix = f"{self._registry_schema}." if self._registry_schema else ""
+        arrays = {
+            name: f"{schema_prefix}sqitch_array("
+            + ", ".join(f":{name}_{i}" for i in range(len(values)))
+            + ")"
+            for name, values in self._event_arrays(change).items()
+        }
+        return f"""
+                INSERT INTO {schema_prefix}{self.registry_schema.EVENTS_TABLE}
+                (event, change_id, change, project, note, requires, conflicts, tags, committer_name, committer_email, planned_at, planner_name, planner_email)
+                VALUES ('{event}', :change_id, :change, :project, :note, {arrays["requires"]}, {arrays["conflicts"]}, {arrays["tags"]}, :committer_name, :committer_email, :planned_at, :planner_name, :planner_email)"""
+
+    def _event_arrays(self, change: Change) -> Dict[str, List[str]]:
+        """Get the SQITCH_ARRAY column values for a change's events."""
+        return {
+            "requires": [
+                dep.change for dep in change.dependencies if dep.type == "require"
+            ],
+            "conflicts": [
+                dep.change for dep in change.dependencies if dep.type == "conflict"
+            ],
+            "tags": list(change.tags),
+        }
+
+    def _event_params(self, change: Change) -> Dict[str, Any]:
+        """
+        Get bind values for registry writes about a change.
+
+        Args:
+            change: Deployed or reverted change
+
+        Returns:
+            Bind values keyed by bind name
+        """
+        params: Dict[str, Any] = {
+            "change_id": change.id,
+            "change": change.name,
+            "project": self.plan.project_name,
+            "note": change.note or "",
+            "committer_name": change.planner_name,
+            "committer_email": change.planner_email,
+            "planned_at": change.timestamp,
+            "planner_name": change.planner_name,
+            "planner_email": change.planner_email,
+        }
+        for name, values in self._event_arrays(change).items():
+            for i, value in enumerate(values):
+                params[f"{name}_{i}"] = value
+        return params
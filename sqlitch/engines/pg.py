@@ -6,9 +6,14 @@ base class, handling PostgreSQL connections, registry management, and
 SQL execution with proper error handling and transaction management.
 """
 
+import csv
+import hashlib
 import logging
+import re
+import time
+from contextlib import closing, contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 from ..core.change import Change
@@ -16,6 +21,7 @@ from ..core.exceptions import ConnectionError, DeploymentError, EngineError
 from ..core.plan import Plan
 from ..core.target import Target
 from ..core.types import EngineType, sanitize_connection_string
+from ..utils.tracing import get_tracer
 from .base import Engine, RegistrySchema, register_engine
 
 # Try to import psycopg2, fall back to psycopg2-binary
@@ -37,6 +43,20 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Database to connect to when creating, renaming and dropping databases
+MAINTENANCE_DATABASE = "postgres"
+
+# Seconds between attempts to take a busy deploy lock, and between
+# progress messages while waiting for it
+LOCK_POLL_INTERVAL = 1.0
+LOCK_PROGRESS_INTERVAL = 10.0
+
+# COPY formats for registry export and import, with their file suffixes
+REGISTRY_COPY_FORMATS = {"csv": ".csv", "binary": ".pgcopy"}
+
+# Dollar-quote delimiters ($$ or $tag$) around function bodies
+_DOLLAR_QUOTE = re.compile(r"\$([A-Za-z_][A-Za-z_0-9]*)?\$")
+
 
 class PostgreSQLRegistrySchema(RegistrySchema):
     """PostgreSQL-specific registry schema."""
@@ -182,6 +202,31 @@ class PostgreSQLConnection:
                 sql_state=getattr(e, "pgcode", None),
             ) from e
 
+    def copy_expert(self, query: Any, file: IO[bytes]) -> int:
+        """
+        Run a COPY ... FROM STDIN or COPY ... TO STDOUT statement.
+
+        Args:
+            query: COPY statement
+            file: Binary file to read from or write to
+
+        Returns:
+            Number of rows copied
+
+        Raises:
+            DeploymentError: If the COPY fails
+        """
+        try:
+            cursor = self._get_cursor()
+            cursor.copy_expert(query, file)
+            return cursor.rowcount
+        except psycopg2.Error as e:
+            raise DeploymentError(
+                f"COPY failed: {e}",
+                engine_name="pg",
+                sql_state=getattr(e, "pgcode", None),
+            ) from e
+
     def fetchone(self) -> Optional[Dict[str, Any]]:
         """
         Fetch one row from result set.
@@ -394,13 +439,19 @@ class PostgreSQLEngine(Engine):
                     placeholder = f":{var_name}"
                     sql_content = sql_content.replace(placeholder, str(var_value))
 
-            # Split into individual statements and execute
-            statements = self._split_sql_statements(sql_content)
+            if self._slow_statement_ms is None:
+                # Send the whole script as one simple-query message; the
+                # server splits it, so function bodies need no client parsing
+                if sql_content.strip():
+                    with get_tracer().span("sql.script", file=str(sql_file)):
+                        connection.execute(sql_content)
+                return
 
-            for statement in statements:
+            # Split into individual statements so each one can be timed
+            for statement, line in self._split_statement_lines(sql_content):
                 statement = statement.strip()
                 if statement and not statement.startswith("--"):
-                    connection.execute(statement)
+                    self._execute_statement(connection, statement, sql_file, line)
 
         except Exception as e:
             if isinstance(e, DeploymentError):
@@ -411,38 +462,47 @@ class PostgreSQLEngine(Engine):
                 engine_name="pg",
             ) from e
 
-    def _split_sql_statements(self, sql_content: str) -> List[str]:
+    def _split_statement_lines(self, sql_content: str) -> List[Tuple[str, int]]:
         """
-        Split SQL content into individual statements.
+        Split SQL content into statements with their starting lines.
 
         Args:
             sql_content: SQL content to split
 
         Returns:
-            List of SQL statements
+            Tuples of (statement, 1-based line number it starts on)
         """
-        # Simple statement splitting - in production, this would be more sophisticated
-        # to handle strings, comments, and complex cases properly
         statements = []
         current_statement = []
+        start = 1
+        dollar_quote: Optional[str] = None
 
-        for line in sql_content.split("\n"):
+        for number, line in enumerate(sql_content.split("\n"), 1):
             line = line.strip()
 
             # Skip empty lines and comments
             if not line or line.startswith("--"):
                 continue
 
+            if not current_statement:
+                start = number
             current_statement.append(line)
 
+            # Track dollar-quoted function bodies, which contain semicolons
+            for match in _DOLLAR_QUOTE.finditer(line):
+                if dollar_quote is None:
+                    dollar_quote = match.group(0)
+                elif match.group(0) == dollar_quote:
+                    dollar_quote = None
+
             # Check if line ends with semicolon (end of statement)
-            if line.rstrip().endswith(";"):
-                statements.append("\n".join(current_statement))
+            if dollar_quote is None and line.rstrip().endswith(";"):
+                statements.append(("\n".join(current_statement), start))
                 current_statement = []
 
         # Add any remaining statement
         if current_statement:
-            statements.append("\n".join(current_statement))
+            statements.append(("\n".join(current_statement), start))
 
         return statements
 
@@ -785,6 +845,401 @@ class PostgreSQLEngine(Engine):
         """
         return " ".join(tags) if tags else ""
 
+    def _registry_files(self, directory: Path, file_format: str) -> Dict[str, Path]:
+        """Get the export file for each registry table, in foreign key order."""
+        if file_format not in REGISTRY_COPY_FORMATS:
+            raise EngineError(
+                f"Unknown registry format: {file_format} "
+                f"(expected {' or '.join(REGISTRY_COPY_FORMATS)})",
+                engine_name="pg",
+            )
+        suffix = REGISTRY_COPY_FORMATS[file_format]
+        return {
+            table: Path(directory) / f"{table}{suffix}"
+            for table in self.registry_schema.TABLES
+        }
+
+    def _registry_table(self, table: str) -> Any:
+        """Get a quoted, schema-qualified registry table name."""
+        return sql.SQL("{}.{}").format(
+            sql.Identifier(self._registry_schema_name), sql.Identifier(table)
+        )
+
+    def export_registry(
+        self, directory: Path, file_format: str = "csv"
+    ) -> Dict[str, int]:
+        """
+        Export the registry tables with COPY ... TO STDOUT.
+
+        All tables are read from one repeatable-read snapshot, so the files
+        are consistent with each other even while deploys run.
+
+        Args:
+            directory: Directory to write the files to
+            file_format: 'csv' (with a header row) or 'binary'
+
+        Returns:
+            Number of rows exported, keyed by table
+
+        Raises:
+            EngineError: If the format is unknown or the export fails
+        """
+        files = self._registry_files(directory, file_format)
+        options = "FORMAT csv, HEADER true" if file_format == "csv" else "FORMAT binary"
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+        counts = {}
+        with self.connection() as conn:
+            conn.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+            for table, path in files.items():
+                query = sql.SQL("COPY {} TO STDOUT WITH ({})").format(
+                    self._registry_table(table), sql.SQL(options)
+                )
+                with open(path, "wb") as f:
+                    counts[table] = conn.copy_expert(query, f)
+            conn.rollback()
+
+        return counts
+
+    def import_registry(
+        self, directory: Path, file_format: str = "csv"
+    ) -> Dict[str, int]:
+        """
+        Load exported registry tables with COPY ... FROM STDIN.
+
+        The registry is created if needed and must not record any changes
+        or events yet. All tables are loaded in one transaction, replacing
+        the release and project rows written when the registry was created.
+        CSV files are matched to columns by their header row, so registries
+        exported by other tools with the same columns can be loaded too.
+
+        Args:
+            directory: Directory to read the files from
+            file_format: 'csv' (with a header row) or 'binary'
+
+        Returns:
+            Number of rows imported, keyed by table
+
+        Raises:
+            EngineError: If a file is missing, the registry is not empty or
+                the import fails
+        """
+        files = self._registry_files(directory, file_format)
+        # CSV files name their columns in the header row
+        columns: Dict[str, List[str]] = {}
+        for table, path in files.items():
+            if not path.exists():
+                raise EngineError(f"Registry file not found: {path}", engine_name="pg")
+            if file_format == "csv":
+                with open(path, encoding="utf-8", newline="") as f:
+                    header = next(csv.reader(f), [])
+                if not header:
+                    raise EngineError(
+                        f"Registry file has no header row: {path}", engine_name="pg"
+                    )
+                columns[table] = header
+
+        tables = sql.SQL(", ").join(self._registry_table(t) for t in files)
+        changes = self._registry_table(self.registry_schema.CHANGES_TABLE)
+        events = self._registry_table(self.registry_schema.EVENTS_TABLE)
+
+        counts: Dict[str, int] = {}
+        with self.transaction() as conn:
+            self._ensure_registry(conn)
+
+            # Keep deploys out until the import commits
+            conn.execute(
+                sql.SQL("LOCK TABLE {} IN ACCESS EXCLUSIVE MODE").format(tables)
+            )
+            conn.execute(
+                sql.SQL(
+                    "SELECT EXISTS (SELECT 1 FROM {}) OR EXISTS (SELECT 1 FROM {})"
+                    " AS used"
+                ).format(changes, events)
+            )
+            row = conn.fetchone()
+            used = bool(row and row["used"])
+            if not used:
+                conn.execute(sql.SQL("TRUNCATE {}").format(tables))
+                counts = self._copy_registry_files(conn, files, columns)
+
+        if used:
+            raise EngineError(
+                "Registry already records deployments; import into an empty registry",
+                engine_name="pg",
+            )
+
+        return counts
+
+    def _copy_registry_files(
+        self,
+        conn: PostgreSQLConnection,
+        files: Dict[str, Path],
+        columns: Dict[str, List[str]],
+    ) -> Dict[str, int]:
+        """
+        Load each registry table from its export file with COPY.
+
+        Args:
+            conn: Connection with an open transaction
+            files: Export file for each table
+            columns: CSV header columns for each table (empty for binary)
+
+        Returns:
+            Number of rows loaded, keyed by table
+        """
+        counts = {}
+        for table, path in files.items():
+            with open(path, "rb") as f:
+                if table in columns:
+                    query = sql.SQL(
+                        "COPY {} ({}) FROM STDIN WITH (FORMAT csv, HEADER true)"
+                    ).format(
+                        self._registry_table(table),
+                        sql.SQL(", ").join(sql.Identifier(c) for c in columns[table]),
+                    )
+                else:
+                    query = sql.SQL("COPY {} FROM STDIN WITH (FORMAT binary)").format(
+                        self._registry_table(table)
+                    )
+                counts[table] = conn.copy_expert(query, f)
+        return counts
+
+    @property
+    def _lock_key(self) -> int:
+        """Get the advisory lock key (a signed 64-bit int) for the project."""
+        # Locks are taken in the maintenance database, shared by the cluster
+        database = self._connection_params.get("database")
+        digest = hashlib.sha1(
+            f"sqitch:{database}:{self.plan.project_name}".encode()
+        ).digest()
+        return int.from_bytes(digest[:8], "big", signed=True)
+
+    def _try_lock(self, connection: PostgreSQLConnection) -> bool:
+        """Try to take the project's advisory lock without waiting."""
+        connection.execute(
+            "SELECT pg_try_advisory_lock(%(key)s) AS locked", {"key": self._lock_key}
+        )
+        row = connection.fetchone()
+        # Session-level locks outlive the transaction; don't sit idle in one
+        connection.commit()
+        return bool(row and row["locked"])
+
+    @contextmanager
+    def lock_destination(self) -> Iterator[None]:
+        """
+        Hold a session-level advisory lock for a whole deploy or revert run.
+
+        The lock is keyed on the database and project and held by a
+        dedicated session on the maintenance database, so that the lock
+        holder can still clone and replace the database for snapshots. While
+        another process holds it, progress is logged until it is released or
+        ``lock_timeout`` seconds have passed.
+
+        Yields:
+            None, while the lock is held
+
+        Raises:
+            EngineError: If another process holds the lock past the timeout
+        """
+        conn = self._create_lock_connection()
+        try:
+            if not self._try_lock(conn):
+                database = self._connection_params.get("database")
+                self.logger.warning(
+                    f"Waiting for another instance of Sqitch to finish work on {database}"
+                )
+                started = time.monotonic()
+                reported = started
+                while not self._try_lock(conn):
+                    now = time.monotonic()
+                    if now - started >= self.lock_timeout:
+                        raise EngineError(
+                            f"Timed out waiting {self.lock_timeout} seconds for "
+                            f"another instance of Sqitch to finish work on {database}",
+                            engine_name="pg",
+                        )
+                    if now - reported >= LOCK_PROGRESS_INTERVAL:
+                        self.logger.warning(
+                            f"Still waiting for the deploy lock on {database} "
+                            f"({now - started:.0f}s of {self.lock_timeout}s)"
+                        )
+                        reported = now
+                    time.sleep(LOCK_POLL_INTERVAL)
+
+            try:
+                yield
+            finally:
+                try:
+                    conn.execute(
+                        "SELECT pg_advisory_unlock(%(key)s)", {"key": self._lock_key}
+                    )
+                    conn.commit()
+                except Exception:
+                    pass  # The lock is released when the session closes
+        finally:
+            conn.close()
+
+    def _create_lock_connection(self) -> PostgreSQLConnection:
+        """
+        Connect to the maintenance database to hold the deploy lock.
+
+        Returns:
+            PostgreSQL connection wrapper
+
+        Raises:
+            ConnectionError: If connection cannot be established
+        """
+        params = dict(self._connection_params, database=MAINTENANCE_DATABASE)
+        try:
+            conn = psycopg2.connect(**params)
+        except psycopg2.Error as e:
+            raise ConnectionError(
+                f"Failed to connect to PostgreSQL database: {e}",
+                connection_string=sanitize_connection_string(str(self.target.uri)),
+                engine_name="pg",
+            ) from e
+        conn.autocommit = False
+        return PostgreSQLConnection(conn)
+
+    @property
+    def supports_snapshots(self) -> bool:
+        """Whether this engine can save and restore database snapshots."""
+        # The maintenance connection would block cloning its own database
+        return self._connection_params["database"] != MAINTENANCE_DATABASE
+
+    def _snapshot_database(self, key: str) -> str:
+        """Get the snapshot database name for a key (at most 63 bytes)."""
+        return f"{self._connection_params['database'][:30]}_snapshot_{key[:20]}"
+
+    def _run_maintenance(self, *statements: Any, fetch: bool = False) -> Any:
+        """
+        Run statements against the maintenance database in autocommit mode.
+
+        CREATE DATABASE and DROP DATABASE cannot run inside a transaction or
+        while connected to the database they act on.
+
+        Args:
+            *statements: Statements or (statement, params) tuples
+            fetch: Whether to return the first row of the last statement
+
+        Returns:
+            First row of the last statement's result if fetch is set
+
+        Raises:
+            EngineError: If a statement fails
+        """
+        params = dict(self._connection_params, database=MAINTENANCE_DATABASE)
+        try:
+            with closing(psycopg2.connect(**params)) as conn:
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    for statement in statements:
+                        if isinstance(statement, tuple):
+                            cursor.execute(*statement)
+                        else:
+                            cursor.execute(statement)
+                    return cursor.fetchone() if fetch else None
+        except psycopg2.Error as e:
+            raise EngineError(
+                f"Snapshot operation failed: {e}", engine_name=self.engine_type
+            ) from e
+
+    def has_snapshot(self, key: str) -> bool:
+        """
+        Check whether a snapshot database exists.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+
+        Returns:
+            True if a snapshot was saved under the key
+        """
+        row = self._run_maintenance(
+            (
+                "SELECT 1 FROM pg_database WHERE datname = %s",
+                (self._snapshot_database(key),),
+            ),
+            fetch=True,
+        )
+        return row is not None
+
+    def save_snapshot(self, key: str) -> None:
+        """
+        Save a snapshot by cloning the database with CREATE DATABASE TEMPLATE.
+
+        The database must have no other open connections while it is cloned.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+
+        Raises:
+            EngineError: If the database cannot be cloned
+        """
+        if not self.supports_snapshots:
+            super().save_snapshot(key)
+
+        snapshot = sql.Identifier(self._snapshot_database(key))
+        database = sql.Identifier(self._connection_params["database"])
+        self._run_maintenance(
+            sql.SQL("DROP DATABASE IF EXISTS {}").format(snapshot),
+            sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(snapshot, database),
+        )
+
+    def restore_snapshot(self, key: str) -> None:
+        """
+        Replace the database with a clone of a snapshot database.
+
+        The clone is created under a temporary name first, so the database is
+        only swapped out once the copy has succeeded. If the clone cannot be
+        renamed into place, the original database is renamed back. Failing to
+        drop the replaced database afterwards only logs a warning, since the
+        restore itself has succeeded.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+
+        Raises:
+            EngineError: If there is no such snapshot or it cannot be restored
+        """
+        if not self.supports_snapshots:
+            super().restore_snapshot(key)
+        if not self.has_snapshot(key):
+            raise EngineError(
+                f"Snapshot not found: {key}", engine_name=self.engine_type
+            )
+
+        name = self._connection_params["database"]
+        snapshot = sql.Identifier(self._snapshot_database(key))
+        database = sql.Identifier(name)
+        incoming = sql.Identifier(f"{name[:40]}_restoring")
+        outgoing = sql.Identifier(f"{name[:40]}_replaced")
+        self._run_maintenance(
+            sql.SQL("DROP DATABASE IF EXISTS {}").format(incoming),
+            sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(incoming, snapshot),
+            # Left behind by an earlier restore whose final drop failed
+            sql.SQL("DROP DATABASE IF EXISTS {}").format(outgoing),
+            sql.SQL("ALTER DATABASE {} RENAME TO {}").format(database, outgoing),
+        )
+        try:
+            self._run_maintenance(
+                sql.SQL("ALTER DATABASE {} RENAME TO {}").format(incoming, database)
+            )
+        except EngineError:
+            # Put the original database back under its own name
+            self._run_maintenance(
+                sql.SQL("ALTER DATABASE {} RENAME TO {}").format(outgoing, database)
+            )
+            raise
+
+        try:
+            self._run_maintenance(sql.SQL("DROP DATABASE {}").format(outgoing))
+        except EngineError as e:
+            self.logger.warning(
+                f"Restored snapshot {key}, but could not drop "
+                f"{name[:40]}_replaced: {e}"
+            )
+
     def _regex_condition(self, column: str, pattern: str) -> str:
         """
         Get PostgreSQL-specific regex condition.
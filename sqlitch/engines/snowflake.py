@@ -9,14 +9,18 @@ SQL execution with proper error handling and transaction management.
 import logging
 import os
 import re
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import parse_qs
 
+from ..core.change import Change
 from ..core.exceptions import ConnectionError, DeploymentError, EngineError
 from ..core.plan import Plan
 from ..core.target import Target
 from ..core.types import EngineType, sanitize_connection_string
+from ..utils.tracing import get_tracer
 from .base import Engine, RegistrySchema, register_engine
 
 # Try to import snowflake-connector-python
@@ -38,6 +42,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Maximum size of script SQL sent in one multi-statement request
+SCRIPT_BATCH_SIZE = 1024 * 1024
+
+# Statements sent on their own, because multi-statement requests reject them
+_UNBATCHED_STATEMENT = re.compile(r"(PUT|GET)\b", re.IGNORECASE)
+
 
 class SnowflakeRegistrySchema(RegistrySchema):
     """Snowflake-specific registry schema."""
@@ -189,6 +199,45 @@ class SnowflakeConnection:
                 sql_state=getattr(e, "sqlstate", None),
             ) from e
 
+    def execute_batch(
+        self, statements: List[str], params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Execute several statements in one multi-statement request.
+
+        The statement count is sent as MULTI_STATEMENT_COUNT, so Snowflake
+        queues and compiles the whole batch in a single round trip. All
+        result sets are drained, so that a failing statement is raised here
+        rather than by the next query.
+
+        Args:
+            statements: SQL statements, without trailing delimiters
+            params: Optional ``%(name)s`` parameters, bound client-side
+
+        Raises:
+            DeploymentError: If a statement fails; its position in the
+                batch is available as ``context["statement_index"]`` when
+                it is known
+        """
+        index = None
+        try:
+            cursor = self._get_cursor()
+            sql_query = ";\n".join(statements)
+            if params:
+                cursor.execute(sql_query, params, num_statements=len(statements))
+            else:
+                cursor.execute(sql_query, num_statements=len(statements))
+            index = 1
+            while cursor.nextset():
+                index += 1
+        except SnowflakeError as e:
+            raise DeploymentError(
+                f"SQL execution failed: {e}",
+                engine_name="snowflake",
+                sql_state=getattr(e, "sqlstate", None),
+                statement_index=index,
+            ) from e
+
     def fetchone(self) -> Optional[Dict[str, Any]]:
         """
         Fetch one row from result set.
@@ -345,6 +394,8 @@ class SnowflakeEngine(Engine):
                 "database": database,
                 "warehouse": warehouse,
                 "autocommit": False,  # We manage transactions manually
+                # Sessions last for a whole deploy run (see lock_destination)
+                "client_session_keep_alive": True,
             }
 
             # Add password if available
@@ -377,9 +428,15 @@ class SnowflakeEngine(Engine):
             # Set session parameters for sqitch compatibility
             cursor = raw_connection.cursor()
             try:
-                # Resume warehouse if suspended
+                # Resume warehouse if suspended, so that the first change does
+                # not pay for the warehouse starting up
                 cursor.execute(f"ALTER WAREHOUSE {warehouse} RESUME IF SUSPENDED")
+            except SnowflakeError as e:
+                # Resuming needs OPERATE on the warehouse; queries resume it
+                # on their own when auto-resume is enabled
+                self.logger.debug(f"Could not resume warehouse {warehouse}: {e}")
 
+            try:
                 # Set timezone to UTC for consistency
                 cursor.execute("ALTER SESSION SET TIMEZONE='UTC'")
 
@@ -407,6 +464,22 @@ class SnowflakeEngine(Engine):
                 engine_name="snowflake",
             ) from e
 
+    @contextmanager
+    def lock_destination(self) -> Iterator[None]:
+        """
+        Hold one Snowflake session for a whole deploy or revert run.
+
+        Snowflake takes no deploy lock. Instead, the run authenticates once
+        and resumes the warehouse once, and every script and registry write
+        reuses that session. The session is kept alive by the connector's
+        heartbeat, so it does not expire during long changes.
+
+        Yields:
+            None, while the session is open
+        """
+        with self._hold_session():
+            yield
+
     def _execute_sql_file(
         self,
         connection: SnowflakeConnection,
@@ -440,14 +513,21 @@ class SnowflakeEngine(Engine):
             # Replace &warehouse with actual warehouse name
             sql_content = sql_content.replace("&warehouse", self._warehouse)
 
-            # Split into individual statements and execute
-            statements = self._split_sql_statements(sql_content)
+            # Split into individual statements
+            statements = [
+                (statement.strip(), line)
+                for statement, line in self._split_statement_lines(sql_content)
+                if statement.strip() and not statement.strip().startswith("--")
+            ]
 
-            for statement in statements:
-                statement = statement.strip()
-                if statement and not statement.startswith("--"):
+            if self._slow_statement_ms is not None:
+                # Run statements one at a time so each one can be timed
+                for statement, line in statements:
                     self.logger.debug(f"Executing SQL: {statement[:100]}...")
-                    connection.execute(statement)
+                    self._execute_statement(connection, statement, sql_file, line)
+            else:
+                for batch in self._batch_statements(statements):
+                    self._execute_batch(connection, batch, sql_file)
 
         except Exception as e:
             raise DeploymentError(
@@ -456,45 +536,229 @@ class SnowflakeEngine(Engine):
                 sql_file=str(sql_file),
             ) from e
 
-    def _split_sql_statements(self, sql_content: str) -> List[str]:
+    def _batch_statements(
+        self, statements: List[Tuple[str, Optional[int]]]
+    ) -> Iterator[List[Tuple[str, Optional[int]]]]:
         """
-        Split SQL content into individual statements.
+        Group script statements into multi-statement requests.
+
+        Batches are limited to SCRIPT_BATCH_SIZE characters of SQL.
+        File transfer statements (PUT, GET) are sent on their own, since
+        Snowflake does not accept them in multi-statement requests.
+
+        Args:
+            statements: Statements paired with their starting line
+
+        Yields:
+            Lists of statements paired with their starting line
+        """
+        batch: List[Tuple[str, Optional[int]]] = []
+        size = 0
+        for statement, line in statements:
+            if _UNBATCHED_STATEMENT.match(statement):
+                if batch:
+                    yield batch
+                    batch, size = [], 0
+                yield [(statement, line)]
+                continue
+
+            if batch and size + len(statement) > SCRIPT_BATCH_SIZE:
+                yield batch
+                batch, size = [], 0
+            batch.append((statement, line))
+            size += len(statement) + 2
+
+        if batch:
+            yield batch
+
+    def _execute_batch(
+        self,
+        connection: SnowflakeConnection,
+        batch: List[Tuple[str, Optional[int]]],
+        sql_file: Path,
+    ) -> None:
+        """
+        Execute a batch of script statements in one request.
+
+        Args:
+            connection: Snowflake connection
+            batch: Statements paired with their starting line
+            sql_file: Script the statements were read from
+
+        Raises:
+            DeploymentError: If a statement fails, naming its line
+        """
+        if len(batch) == 1:
+            statement, line = batch[0]
+            self.logger.debug(f"Executing SQL: {statement[:100]}...")
+            self._execute_statement(connection, statement, sql_file, line)
+            return
+
+        with get_tracer().span(
+            "sql.batch", file=str(sql_file), line=batch[0][1], statements=len(batch)
+        ):
+            try:
+                connection.execute_batch(
+                    [statement.rstrip(";").rstrip() for statement, _ in batch]
+                )
+            except DeploymentError as e:
+                index = e.context.get("statement_index")
+                if index is not None and index < len(batch):
+                    line = batch[index][1]
+                    where = "statement"
+                else:
+                    line = batch[0][1]
+                    where = f"batch of {len(batch)} statements"
+                location = f"{sql_file}:{line}" if line is not None else str(sql_file)
+                raise DeploymentError(
+                    f"{e.message} ({where} at {location})",
+                    sql_file=str(sql_file),
+                    engine_name="snowflake",
+                    sql_state=e.context.get("sql_state"),
+                ) from e
+
+    def _split_statement_lines(self, sql_content: str) -> List[Tuple[str, int]]:
+        """
+        Split SQL content into statements with their starting lines.
 
         Args:
             sql_content: SQL content to split
 
         Returns:
-            List of individual SQL statements
+            Tuples of (statement, 1-based line number it starts on)
         """
         # Simple statement splitting on semicolons
         # This could be enhanced to handle more complex cases
         statements = []
         current_statement = []
+        start = 1
 
-        for line in sql_content.split("\n"):
+        for number, line in enumerate(sql_content.split("\n"), 1):
             line = line.strip()
 
             # Skip empty lines and comments
             if not line or line.startswith("--"):
                 continue
 
+            if not current_statement:
+                start = number
             current_statement.append(line)
 
             # Check if line ends with semicolon (end of statement)
             if line.endswith(";"):
                 statement = " ".join(current_statement)
                 if statement.strip():
-                    statements.append(statement)
+                    statements.append((statement, start))
                 current_statement = []
 
         # Add any remaining statement
         if current_statement:
             statement = " ".join(current_statement)
             if statement.strip():
-                statements.append(statement)
+                statements.append((statement, start))
 
         return statements
 
+    def _record_change_deployment(
+        self, connection: SnowflakeConnection, change: Change
+    ) -> None:
+        """
+        Record change deployment in Snowflake registry.
+
+        The change, its dependencies and the deploy event are written in a
+        single multi-statement request.
+
+        Args:
+            connection: Snowflake connection
+            change: Deployed change
+        """
+        params = self._event_params(change, "deploy")
+        params["script_hash"] = self._calculate_script_hash(change)
+        statements = [
+            f"""
+            INSERT INTO {self.registry_schema.CHANGES_TABLE}
+            (change_id, script_hash, change, project, note, committed_at, committer_name, committer_email, planned_at, planner_name, planner_email)
+            VALUES (%(change_id)s, %(script_hash)s, %(change)s, %(project)s, %(note)s, %(committed_at)s, %(committer_name)s, %(committer_email)s, %(planned_at)s, %(planner_name)s, %(planner_email)s)
+            """
+        ]
+
+        for i, dep in enumerate(change.dependencies):
+            statements.append(
+                f"""
+                INSERT INTO {self.registry_schema.DEPENDENCIES_TABLE}
+                (change_id, type, dependency, dependency_id)
+                VALUES (%(change_id)s, %(type_{i})s, %(dependency_{i})s, %(dependency_id_{i})s)
+                """
+            )
+            params[f"type_{i}"] = dep.type
+            params[f"dependency_{i}"] = dep.change
+            params[f"dependency_id_{i}"] = self._resolve_dependency_id(dep.change)
+
+        statements.append(self._insert_event_statement())
+        connection.execute_batch(statements, params)
+
+    def _record_change_revert(
+        self, connection: SnowflakeConnection, change: Change
+    ) -> None:
+        """
+        Record change revert in Snowflake registry.
+
+        The change and its dependencies are removed and the revert event is
+        written in a single multi-statement request.
+
+        Args:
+            connection: Snowflake connection
+            change: Reverted change
+        """
+        statements = [
+            f"DELETE FROM {self.registry_schema.DEPENDENCIES_TABLE} "
+            "WHERE change_id = %(change_id)s",
+            f"DELETE FROM {self.registry_schema.CHANGES_TABLE} "
+            "WHERE change_id = %(change_id)s",
+            self._insert_event_statement(),
+        ]
+        connection.execute_batch(statements, self._event_params(change, "revert"))
+
+    def _insert_event_statement(self) -> str:
+        """Get the INSERT statement for an event, with named parameters."""
+        return f"""
+            INSERT INTO {self.registry_schema.EVENTS_TABLE}
+            (event, change_id, change, project, note, requires, conflicts, tags, committed_at, committer_name, committer_email, planned_at, planner_name, planner_email)
+            VALUES (%(event)s, %(change_id)s, %(change)s, %(project)s, %(note)s, %(requires)s, %(conflicts)s, %(tags)s, %(committed_at)s, %(committer_name)s, %(committer_email)s, %(planned_at)s, %(planner_name)s, %(planner_email)s)
+            """
+
+    def _event_params(self, change: Change, event: str) -> Dict[str, Any]:
+        """
+        Get parameters for registry writes about a change.
+
+        Args:
+            change: Deployed or reverted change
+            event: Event type (deploy or revert)
+
+        Returns:
+            Parameters for the change and event statements
+        """
+        return {
+            "event": event,
+            "change_id": change.id,
+            "change": change.name,
+            "project": self.plan.project_name,
+            "note": change.note or "",
+            "requires": self._format_dependencies(
+                [dep.change for dep in change.dependencies if dep.type == "require"]
+            ),
+            "conflicts": self._format_dependencies(
+                [dep.change for dep in change.dependencies if dep.type == "conflict"]
+            ),
+            "tags": self._format_tags(change.tags),
+            "committed_at": datetime.now(timezone.utc),
+            "committer_name": change.planner_name,
+            "committer_email": change.planner_email,
+            "planned_at": change.timestamp,
+            "planner_name": change.planner_name,
+            "planner_email": change.planner_email,
+        }
+
     def _get_registry_version(self, connection: SnowflakeConnection) -> Optional[str]:
         """
         Get current registry version from database.
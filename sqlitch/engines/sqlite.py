@@ -7,7 +7,9 @@ SQL execution with proper error handling and transaction management.
 """
 
 import logging
+import os
 import sqlite3
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -407,8 +409,10 @@ class SQLiteEngine(Engine):
                     sql_content = sql_content.replace(f":{key}", str(value))
 
             # Execute SQL content
-            # SQLite executescript() handles multiple statements
-            connection._connection.executescript(sql_content)
+            # SQLite executescript() handles multiple statements, so the
+            # whole script is timed as a single statement
+            with self._timed_statement(sql_content, sql_file, 1):
+                connection._connection.executescript(sql_content)
 
             self.logger.debug(f"Executed SQL file: {sql_file}")
 
@@ -492,6 +496,80 @@ class SQLiteEngine(Engine):
         with self.connection() as conn:
             self._execute_sql_file(conn, file_path)
 
+    @property
+    def supports_snapshots(self) -> bool:
+        """Whether this engine can save and restore database snapshots."""
+        return self._db_path != ":memory:"
+
+    def _snapshot_path(self, key: str) -> Path:
+        """Get the snapshot file for a key, next to the database file."""
+        db_file = Path(self._db_path)
+        return db_file.parent / f"{db_file.name}.snapshots" / f"{key}.db"
+
+    def has_snapshot(self, key: str) -> bool:
+        """
+        Check whether a snapshot exists.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+
+        Returns:
+            True if a snapshot was saved under the key
+        """
+        return self.supports_snapshots and self._snapshot_path(key).exists()
+
+    def save_snapshot(self, key: str) -> None:
+        """
+        Save a copy of the database file using the SQLite backup API.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+
+        Raises:
+            EngineError: If the database is in memory or cannot be copied
+        """
+        if not self.supports_snapshots:
+            super().save_snapshot(key)
+
+        path = self._snapshot_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            self._backup(Path(self._db_path), temp_path)
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def restore_snapshot(self, key: str) -> None:
+        """
+        Replace the database content with a saved snapshot.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+
+        Raises:
+            EngineError: If there is no such snapshot or it cannot be copied
+        """
+        if not self.has_snapshot(key):
+            raise EngineError(
+                f"Snapshot not found: {key}", engine_name=self.engine_type
+            )
+        self._backup(self._snapshot_path(key), Path(self._db_path))
+
+    def _backup(self, source: Path, dest: Path) -> None:
+        """Copy one database into another with the online backup API."""
+        try:
+            with (
+                closing(sqlite3.connect(str(source))) as src,
+                closing(sqlite3.connect(str(dest))) as dst,
+            ):
+                src.backup(dst)
+        except sqlite3.Error as e:
+            raise EngineError(
+                f"Failed to copy database {source} to {dest}: {e}",
+                engine_name=self.engine_type,
+            ) from e
+
     def _regex_condition(self, column: str, pattern: str) -> str:
         """
         Get SQLite-specific regex condition.
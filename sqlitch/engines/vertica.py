@@ -9,8 +9,9 @@ SQL execution with proper error handling and transaction management.
 import logging
 import os
 import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import parse_qs
 
 from ..core.exceptions import ConnectionError, DeploymentError, EngineError
@@ -37,6 +38,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# SQLSTATE of a lock request that timed out
+LOCK_TIMEOUT_SQLSTATE = "55V03"
+
 
 class VerticaRegistrySchema(RegistrySchema):
     """Vertica-specific registry schema."""
@@ -437,13 +441,11 @@ class VerticaEngine(Engine):
             sql_content = sql_content.replace("&registry", self._registry_schema_name)
 
             # Split into individual statements and execute
-            statements = self._split_sql_statements(sql_content)
-
-            for statement in statements:
+            for statement, line in self._split_statement_lines(sql_content):
                 statement = statement.strip()
                 if statement and not statement.startswith("--"):
                     self.logger.debug(f"Executing SQL: {statement[:100]}...")
-                    connection.execute(statement)
+                    self._execute_statement(connection, statement, sql_file, line)
 
         except Exception as e:
             raise DeploymentError(
@@ -452,42 +454,45 @@ class VerticaEngine(Engine):
                 sql_file=str(sql_file),
             ) from e
 
-    def _split_sql_statements(self, sql_content: str) -> List[str]:
+    def _split_statement_lines(self, sql_content: str) -> List[Tuple[str, int]]:
         """
-        Split SQL content into individual statements.
+        Split SQL content into statements with their starting lines.
 
         Args:
             sql_content: SQL content to split
 
         Returns:
-            List of individual SQL statements
+            Tuples of (statement, 1-based line number it starts on)
         """
         # Simple statement splitting on semicolons
         # This could be enhanced to handle more complex cases
         statements = []
         current_statement = []
+        start = 1
 
-        for line in sql_content.split("\n"):
+        for number, line in enumerate(sql_content.split("\n"), 1):
             line = line.strip()
 
             # Skip empty lines and comments
             if not line or line.startswith("--"):
                 continue
 
+            if not current_statement:
+                start = number
             current_statement.append(line)
 
             # Check if line ends with semicolon (end of statement)
             if line.endswith(";"):
                 statement = " ".join(current_statement)
                 if statement.strip():
-                    statements.append(statement)
+                    statements.append((statement, start))
                 current_statement = []
 
         # Add any remaining statement
         if current_statement:
             statement = " ".join(current_statement)
             if statement.strip():
-                statements.append(statement)
+                statements.append((statement, start))
 
         return statements
 
@@ -524,21 +529,68 @@ class VerticaEngine(Engine):
         # Vertica uses ~ operator for regex matching
         return f"{column} ~ ?"
 
-    def begin_work(self) -> None:
+    @contextmanager
+    def lock_destination(self) -> Iterator[None]:
+        """
+        Hold an exclusive registry lock for a whole deploy or revert run.
+
+        Vertica releases table locks when a transaction ends, and DDL in
+        change scripts commits, so the lock cannot live on the deploy
+        connection. A dedicated session locks the projects table, which
+        deploys and reverts do not write, and keeps its transaction open
+        until the run ends. Changes are deployed on a second session that
+        is shared by the whole run.
+
+        Yields:
+            None, while the lock is held
+
+        Raises:
+            EngineError: If another process holds the lock past the timeout
         """
-        Begin transaction with exclusive lock on changes table.
+        lock_conn = self._create_connection()
+        try:
+            self._lock_registry(lock_conn)
+            with self._hold_session():
+                yield
+        finally:
+            try:
+                # Ending the transaction releases the lock
+                lock_conn.rollback()
+            except Exception:
+                pass  # The lock is released when the session closes
+            try:
+                lock_conn.close()
+            except Exception:
+                pass  # Ignore close errors
 
-        This ensures that only one instance of Sqitch runs at one time,
-        matching the behavior of the Perl implementation.
+    def _lock_registry(self, connection: VerticaConnection) -> None:
         """
-        with self.connection() as conn:
-            # Start transaction
-            conn.execute("BEGIN")
+        Take the registry lock, waiting at most lock_timeout seconds.
 
-            # Lock changes table in exclusive mode
-            conn.execute(
-                f"LOCK TABLE {self._registry_schema_name}.{self.registry_schema.CHANGES_TABLE} IN EXCLUSIVE MODE"
+        Args:
+            connection: Dedicated lock session
+
+        Raises:
+            EngineError: If the lock cannot be taken
+        """
+        table = f"{self._registry_schema_name}.{self.registry_schema.PROJECTS_TABLE}"
+        try:
+            connection.execute(
+                f"ALTER SESSION SET LockTimeout = {int(self.lock_timeout)}"
             )
+            connection.execute(f"LOCK TABLE {table} IN EXCLUSIVE MODE")
+        except DeploymentError as e:
+            if e.context.get("sql_state") == LOCK_TIMEOUT_SQLSTATE:
+                raise EngineError(
+                    f"Timed out waiting {self.lock_timeout} seconds for another "
+                    f"instance of Sqitch to finish work on "
+                    f"{self._registry_schema_name}",
+                    engine_name="vertica",
+                ) from e
+            raise EngineError(
+                f"Failed to lock registry {self._registry_schema_name}: {e}",
+                engine_name="vertica",
+            ) from e
 
     def _get_host(self) -> str:
         """
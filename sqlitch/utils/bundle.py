@@ -0,0 +1,679 @@
+"""
+Bundle writing utilities for sqlitch.
+
+This module provides the content-addressed file synchronisation used by
+'sqlitch bundle': files are identified by their SHA-256 digest, recorded in
+a checksum manifest, and only copied when their content differs from what
+is already in the bundle. Bundles can also be streamed into a compressed
+archive and read back by 'sqlitch deploy --bundle' without extracting them.
+"""
+
+import hashlib
+import io
+import os
+import posixpath
+import shutil
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
+
+from ..core.change import Change
+from ..core.exceptions import PlanError, SqlitchError
+from ..core.plan import Plan
+
+# Checksum manifest written at the top of every bundle, in the format used
+# by sha256sum so that bundles can be checked with 'sha256sum -c'
+MANIFEST_FILE = "SHA256SUMS"
+
+# Worker threads used to hash and copy files
+COPY_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Chunk size used when hashing and copying files
+CHUNK_SIZE = 1024 * 1024
+
+# Supported archive suffixes and their formats
+ARCHIVE_FORMATS = {
+    ".tar.gz": "tar.gz",
+    ".tgz": "tar.gz",
+    ".tar.zst": "tar.zst",
+    ".zip": "zip",
+}
+
+
+def file_digest(path: Path) -> str:
+    """
+    Compute the SHA-256 digest of a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest of the file content
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def copy_file(src: Path, dest: Path) -> None:
+    """
+    Copy a file's content and metadata.
+
+    On Linux the data is copied with ``os.copy_file_range``, which stays in
+    the kernel and lets copy-on-write filesystems (btrfs, XFS) share extents
+    instead of duplicating them. Other platforms, and filesystems that do not
+    support it, fall back to ``shutil.copyfile``.
+
+    Args:
+        src: Source file
+        dest: Destination file
+    """
+    if not _copy_file_range(src, dest):
+        shutil.copyfile(src, dest)
+    shutil.copystat(src, dest)
+
+
+def _copy_file_range(src: Path, dest: Path) -> bool:
+    """Copy file data with os.copy_file_range, returning False if unsupported."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    try:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(
+                    fsrc.fileno(), fdest.fileno(), min(remaining, 1 << 30)
+                )
+                if copied == 0:
+                    break
+                remaining -= copied
+        return remaining <= 0
+    except OSError:
+        return False
+
+
+def read_manifest(path: Path) -> Dict[str, str]:
+    """
+    Read a checksum manifest.
+
+    Args:
+        path: Manifest file
+
+    Returns:
+        Dictionary of relative path to hex digest (empty if the file is
+        missing or unreadable)
+    """
+    try:
+        content = path.read_text(encoding="utf-8")
+    except OSError:
+        return {}
+    return parse_manifest(content)
+
+
+def parse_manifest(content: str) -> Dict[str, str]:
+    """
+    Parse checksum manifest content.
+
+    Args:
+        content: Manifest content
+
+    Returns:
+        Dictionary of relative path to hex digest
+    """
+    entries: Dict[str, str] = {}
+    for line in content.splitlines():
+        digest, sep, name = line.partition("  ")
+        if sep and len(digest) == 64:
+            entries[name] = digest
+    return entries
+
+
+def format_manifest(entries: Dict[str, str]) -> str:
+    """
+    Format a checksum manifest.
+
+    Args:
+        entries: Dictionary of relative path to hex digest
+
+    Returns:
+        Manifest content, one ``<digest>  <path>`` line per file
+    """
+    return "".join(f"{entries[name]}  {name}\n" for name in sorted(entries))
+
+
+class BundleDirectory:
+    """
+    Write files into a bundle directory incrementally.
+
+    Files are queued with :meth:`copy` and synchronised by :meth:`close`,
+    which hashes and copies them in a thread pool. A file is only copied
+    when its digest differs from the one recorded for its destination in the
+    previous manifest (or, without one, from the destination's own digest),
+    so rebundling touches only what changed regardless of modification
+    times. The previous manifest is removed before the bundle is first
+    written to and only replaced once every file is in place, so an
+    interrupted run never leaves a manifest that disagrees with the files.
+    """
+
+    def __init__(self, dest_dir: Path, workers: int = COPY_WORKERS) -> None:
+        """
+        Initialize bundle directory.
+
+        Args:
+            dest_dir: Bundle directory
+            workers: Number of worker threads for hashing and copying
+        """
+        self.dest_dir = dest_dir
+        self.workers = workers
+        self.previous = read_manifest(dest_dir / MANIFEST_FILE)
+        self._manifest_removed = False
+        self.digests: Dict[str, str] = {}
+        self.copied: List[Path] = []
+        self._queue: List[Tuple[Path, Path]] = []
+        self._lock = threading.Lock()
+
+    def relative_name(self, dest: Path) -> str:
+        """
+        Get the manifest name of a destination path.
+
+        Args:
+            dest: Destination path inside the bundle
+
+        Returns:
+            POSIX path relative to the bundle directory
+        """
+        try:
+            return dest.relative_to(self.dest_dir).as_posix()
+        except ValueError:
+            return dest.as_posix()
+
+    def copy(self, src: Path, dest: Path) -> None:
+        """
+        Queue a file to be copied into the bundle.
+
+        Args:
+            src: Source file
+            dest: Destination path inside the bundle
+        """
+        if not src.exists():
+            raise SqlitchError(f"Cannot copy {src}: does not exist")
+        self._queue.append((src, dest))
+
+    def write_text(self, dest: Path, content: str) -> None:
+        """
+        Write generated content into the bundle if it changed.
+
+        Args:
+            dest: Destination path inside the bundle
+            content: File content
+        """
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if not self._is_current(dest, digest, len(data)):
+            self._remove_manifest()
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(data)
+            self.copied.append(dest)
+        self.digests[self.relative_name(dest)] = digest
+
+    def close(self) -> None:
+        """Copy queued files and write the checksum manifest."""
+        queue, self._queue = self._queue, []
+        if queue:
+            self._remove_manifest()
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for future in [executor.submit(self._sync, *job) for job in queue]:
+                    future.result()
+
+        self.dest_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self.dest_dir / MANIFEST_FILE
+        tmp_path = manifest.with_name(f".{MANIFEST_FILE}.tmp")
+        try:
+            tmp_path.write_text(format_manifest(self.digests), encoding="utf-8")
+            os.replace(tmp_path, manifest)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+
+    def _remove_manifest(self) -> None:
+        """Remove the previous manifest before the bundle is modified."""
+        if self._manifest_removed:
+            return
+        try:
+            (self.dest_dir / MANIFEST_FILE).unlink()
+        except FileNotFoundError:
+            pass
+        self._manifest_removed = True
+
+    def _sync(self, src: Path, dest: Path) -> None:
+        """Copy a file unless the destination already has its content."""
+        digest = file_digest(src)
+        if not self._is_current(dest, digest, src.stat().st_size):
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                copy_file(src, dest)
+            except OSError as e:
+                raise SqlitchError(f'Cannot copy "{src}" to "{dest}": {e}')
+            with self._lock:
+                self.copied.append(dest)
+
+        with self._lock:
+            self.digests[self.relative_name(dest)] = digest
+
+    def _is_current(self, dest: Path, digest: str, size: int) -> bool:
+        """Check whether the destination already holds the given content."""
+        try:
+            if dest.stat().st_size != size:
+                return False
+        except OSError:
+            return False
+
+        recorded: Optional[str] = self.previous.get(self.relative_name(dest))
+        if recorded is not None:
+            return recorded == digest
+        return file_digest(dest) == digest
+
+
+def archive_format(path: Path) -> str:
+    """
+    Get the archive format for a file name.
+
+    Args:
+        path: Archive path
+
+    Returns:
+        One of 'tar.gz', 'tar.zst' or 'zip'
+
+    Raises:
+        SqlitchError: If the suffix is not a supported archive format
+    """
+    name = path.name.lower()
+    for suffix, fmt in ARCHIVE_FORMATS.items():
+        if name.endswith(suffix):
+            return fmt
+    supported = ", ".join(ARCHIVE_FORMATS)
+    raise SqlitchError(f"Unsupported archive format: {path} (expected {supported})")
+
+
+def _import_zstandard() -> Any:
+    """Import the optional zstandard package."""
+    try:
+        import zstandard
+    except ImportError:
+        raise SqlitchError(
+            ".tar.zst archives require the zstandard package " "(pip install zstandard)"
+        )
+    return zstandard
+
+
+def _member_name(path: Union[Path, str]) -> str:
+    """Normalize a path to an archive member name."""
+    name = posixpath.normpath(Path(path).as_posix())
+    if name == "." or name.startswith("../") or posixpath.isabs(name):
+        raise SqlitchError(f"Cannot store {path} in a bundle archive")
+    return name
+
+
+class _HashingReader:
+    """File wrapper that hashes the data read through it."""
+
+    def __init__(self, raw: IO[bytes]) -> None:
+        self.raw = raw
+        self.hasher = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.raw.read(size)
+        self.hasher.update(data)
+        return data
+
+
+class BundleArchiveWriter:
+    """
+    Stream a bundle into a compressed archive.
+
+    Files are written straight into the archive as they are added, with a
+    checksum manifest appended when the archive is closed. The archive is
+    assembled under a temporary name and only renamed into place once
+    complete.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize archive writer.
+
+        Args:
+            path: Archive to create (.tar.gz, .tgz, .tar.zst or .zip)
+        """
+        self.path = path
+        self.format = archive_format(path)
+        self.digests: Dict[str, str] = {}
+        self.dest_dir = Path(".")
+        self._tmp_path = path.with_name(f".{path.name}.tmp")
+        self._tar: Optional[tarfile.TarFile] = None
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._compressor: Any = None
+
+        zstandard = _import_zstandard() if self.format == "tar.zst" else None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp_path, "wb")
+        try:
+            if self.format == "zip":
+                self._zip = zipfile.ZipFile(self._file, "w", zipfile.ZIP_DEFLATED)
+            elif self.format == "tar.gz":
+                self._tar = tarfile.open(fileobj=self._file, mode="w:gz")
+            else:
+                self._compressor = zstandard.ZstdCompressor().stream_writer(self._file)
+                self._tar = tarfile.open(fileobj=self._compressor, mode="w|")
+        except Exception:
+            self.abort()
+            raise
+
+    @property
+    def copied(self) -> List[str]:
+        """Get names of the files written to the archive."""
+        return list(self.digests)
+
+    def copy(self, src: Path, dest: Path) -> None:
+        """
+        Add a file to the archive.
+
+        Args:
+            src: Source file
+            dest: Path of the file inside the bundle
+        """
+        if not src.exists():
+            raise SqlitchError(f"Cannot copy {src}: does not exist")
+
+        name = _member_name(dest)
+        if name in self.digests:
+            return
+
+        stat = src.stat()
+        with open(src, "rb") as f:
+            self._add(name, f, stat.st_size, stat.st_mtime)
+
+    def write_text(self, dest: Path, content: str) -> None:
+        """
+        Add generated content to the archive.
+
+        Args:
+            dest: Path of the file inside the bundle
+            content: File content
+        """
+        data = content.encode("utf-8")
+        self._add(_member_name(dest), io.BytesIO(data), len(data), time.time())
+
+    def _add(self, name: str, fileobj: IO[bytes], size: int, mtime: float) -> None:
+        """Stream a member into the archive, recording its digest."""
+        reader = _HashingReader(fileobj)
+
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, time.localtime(mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            info.file_size = size
+            with self._zip.open(info, "w") as out:
+                for chunk in iter(lambda: reader.read(CHUNK_SIZE), b""):
+                    out.write(chunk)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = size
+            info.mtime = int(mtime)
+            info.mode = 0o644
+            self._tar.addfile(info, reader)
+
+        self.digests[name] = reader.hasher.hexdigest()
+
+    def close(self) -> None:
+        """Write the checksum manifest and finish the archive."""
+        manifest = format_manifest(self.digests).encode("utf-8")
+        self._add(MANIFEST_FILE, io.BytesIO(manifest), len(manifest), time.time())
+        self._close_streams()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard a partially written archive."""
+        try:
+            self._close_streams()
+        except Exception:
+            pass
+        try:
+            self._tmp_path.unlink()
+        except OSError:
+            pass
+
+    def _close_streams(self) -> None:
+        """Close the archive and its underlying streams."""
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+        if self._compressor is not None:
+            self._compressor.close()
+        self._file.close()
+
+
+class BundleArchive:
+    """
+    Read a bundle archive without extracting it.
+
+    Zip archives are read on demand; tar archives are read in one streaming
+    pass and kept in memory. Files listed in the archive's checksum manifest
+    are verified when read.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open a bundle archive.
+
+        Args:
+            path: Archive path
+
+        Raises:
+            SqlitchError: If the archive cannot be read
+        """
+        self.path = path
+        self.format = archive_format(path)
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._members: Dict[str, bytes] = {}
+
+        try:
+            if self.format == "zip":
+                self._zip = zipfile.ZipFile(path)
+                self._names = {_member_name(n) for n in self._zip.namelist()}
+            else:
+                self._read_tar()
+                self._names = set(self._members)
+        except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+            raise SqlitchError(f"Cannot read bundle archive {path}: {e}")
+
+        self.manifest: Dict[str, str] = {}
+        if MANIFEST_FILE in self._names:
+            self.manifest = parse_manifest(
+                self._read_member(MANIFEST_FILE).decode("utf-8")
+            )
+
+    def _read_tar(self) -> None:
+        """Read all regular files from a tar archive in one pass."""
+        with open(self.path, "rb") as f:
+            if self.format == "tar.zst":
+                stream: Any = _import_zstandard().ZstdDecompressor().stream_reader(f)
+            else:
+                stream = f
+            with tarfile.open(fileobj=stream, mode="r|*") as tar:
+                for member in tar:
+                    if member.isfile():
+                        data = tar.extractfile(member).read()
+                        self._members[_member_name(member.name)] = data
+
+    def _read_member(self, name: str) -> bytes:
+        """Read raw member data."""
+        if self._zip is not None:
+            return self._zip.read(name)
+        return self._members[name]
+
+    def exists(self, name: str) -> bool:
+        """
+        Check whether the archive contains a file.
+
+        Args:
+            name: File path inside the bundle
+
+        Returns:
+            True if the file is in the archive
+        """
+        return _member_name(name) in self._names
+
+    def read_bytes(self, name: str) -> bytes:
+        """
+        Read a file from the archive, verifying its checksum.
+
+        Args:
+            name: File path inside the bundle
+
+        Returns:
+            File content
+
+        Raises:
+            SqlitchError: If the file is missing or fails verification
+        """
+        name = _member_name(name)
+        if name not in self._names:
+            raise SqlitchError(f"{name} not found in bundle archive {self.path}")
+
+        data = self._read_member(name)
+        expected = self.manifest.get(name)
+        if expected is not None and hashlib.sha256(data).hexdigest() != expected:
+            raise SqlitchError(f"Checksum mismatch for {name} in {self.path}")
+        return data
+
+    def script(self, name: Union[Path, str]) -> "ArchivePath":
+        """
+        Get a path-like handle for a file in the archive.
+
+        Args:
+            name: File path inside the bundle
+
+        Returns:
+            Archive path
+        """
+        return ArchivePath(self, _member_name(name))
+
+    def load_plan(self, plan_file: Path) -> "BundlePlan":
+        """
+        Parse the plan stored in the archive.
+
+        Args:
+            plan_file: Plan file path; its name is used if the full path is
+                not in the archive
+
+        Returns:
+            Plan whose scripts are read from the archive
+
+        Raises:
+            PlanError: If the plan is not in the archive
+        """
+        for name in (plan_file.as_posix(), plan_file.name):
+            if self.exists(name):
+                content = self.read_bytes(name).decode("utf-8")
+                plan = BundlePlan._parse_content(self.script(name), content)
+                plan.archive = self
+                return plan
+        raise PlanError(f"Plan file {plan_file} not found in {self.path}")
+
+    def close(self) -> None:
+        """Close the archive."""
+        if self._zip is not None:
+            self._zip.close()
+        self._members.clear()
+
+    def __enter__(self) -> "BundleArchive":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ArchivePath:
+    """
+    Path-like handle for a script inside a bundle archive.
+
+    Supports the subset of the ``pathlib.Path`` interface that engines use
+    to read scripts.
+    """
+
+    def __init__(self, archive: BundleArchive, member: str) -> None:
+        """
+        Initialize archive path.
+
+        Args:
+            archive: Archive containing the file
+            member: File path inside the archive
+        """
+        self.archive = archive
+        self.member = member
+
+    @property
+    def name(self) -> str:
+        """Get the file name."""
+        return posixpath.basename(self.member)
+
+    def exists(self) -> bool:
+        """Check whether the file is in the archive."""
+        return self.archive.exists(self.member)
+
+    def is_file(self) -> bool:
+        """Check whether the file is in the archive."""
+        return self.exists()
+
+    def read_bytes(self) -> bytes:
+        """Read the file content."""
+        return self.archive.read_bytes(self.member)
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        """Read the file content as text."""
+        return self.read_bytes().decode(encoding)
+
+    def __str__(self) -> str:
+        return f"{self.archive.path}:{self.member}"
+
+    def __repr__(self) -> str:
+        return f"ArchivePath({str(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ArchivePath)
+            and other.archive is self.archive
+            and other.member == self.member
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.archive), self.member))
+
+
+class BundlePlan(Plan):
+    """Plan loaded from a bundle archive, reading its scripts from the archive."""
+
+    archive: BundleArchive
+
+    def get_deploy_file(self, change: Change) -> ArchivePath:  # type: ignore
+        """Get deploy script in the archive for a change."""
+        return self.archive.script(super().get_deploy_file(change))
+
+    def get_revert_file(self, change: Change) -> ArchivePath:  # type: ignore
+        """Get revert script in the archive for a change."""
+        return self.archive.script(super().get_revert_file(change))
+
+    def get_verify_file(self, change: Change) -> ArchivePath:  # type: ignore
+        """Get verify script in the archive for a change."""
+        return self.archive.script(super().get_verify_file(change))
@@ -0,0 +1,102 @@
+"""
+File-backed caching utilities for sqlitch.
+
+This module provides caches for values derived from files (parsed plans,
+configurations), keyed by each file's modification time and size so that
+cached values are invalidated as soon as a file changes on disk.
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# (st_mtime_ns, st_size) of a file, or None if it does not exist
+FileStamp = Optional[Tuple[int, int]]
+
+
+def file_stamp(path: Path) -> FileStamp:
+    """
+    Get the stamp identifying the current version of a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        Tuple of (mtime in nanoseconds, size), or None if the file is missing
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def files_stamp(paths: Iterable[Path]) -> Tuple[Tuple[str, FileStamp], ...]:
+    """
+    Get a combined stamp for several files.
+
+    Args:
+        paths: File paths (missing files are included as None stamps)
+
+    Returns:
+        Tuple of (path, stamp) pairs
+    """
+    return tuple((str(path), file_stamp(path)) for path in paths)
+
+
+class FileStampCache:
+    """
+    Cache values derived from files.
+
+    Each entry remembers the stamps of the files it was loaded from and is
+    reloaded when any of them changes, appears or disappears.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: Dict[
+            Hashable, Tuple[Tuple[Tuple[str, FileStamp], ...], object]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, paths: Iterable[Path], loader: Callable[[], T]) -> T:
+        """
+        Get a cached value, loading it if missing or stale.
+
+        Args:
+            key: Cache key
+            paths: Files the value is derived from
+            loader: Function producing the value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        stamp = files_stamp(paths)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                return entry[1]  # type: ignore[return-value]
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (stamp, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop cached values.
+
+        Args:
+            key: Key to drop (None drops everything)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        """Get number of cached entries."""
+        return len(self._entries)
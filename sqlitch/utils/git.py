@@ -2,14 +2,17 @@
 Git integration utilities for sqlitch.
 
 This module provides Git repository detection, status checking,
-and integration for change file naming and commit tracking.
+and integration for change file naming and commit tracking. Files at any
+revision are read through long-lived ``git cat-file --batch`` processes, so
+reading many plans and scripts from history costs no extra process spawns.
 """
 
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Dict, List, Optional, Tuple
 
 from ..core.exceptions import SqlitchError
 
@@ -33,19 +36,47 @@ class GitStatus:
     untracked_files: List[str]
 
 
+@dataclass
+class GitObject:
+    """Git object information reported by ``git cat-file``."""
+
+    oid: str
+    type: str
+    size: int
+
+
 class GitRepository:
-    """Git repository interface."""
+    """
+    Git repository interface.
+
+    Objects are read through ``git cat-file --batch`` and ``--batch-check``
+    processes that are started on first use and kept running until
+    :meth:`close` is called (or the repository is used as a context manager).
+    """
 
-    def __init__(self, path: Optional[Path] = None):
+    def __init__(
+        self, path: Optional[Path] = None, git_executable: Optional[str] = None
+    ):
         """
         Initialize Git repository interface.
 
         Args:
             path: Repository path (defaults to current directory)
+            git_executable: Git client to run (defaults to git on PATH)
         """
         self.path = path or Path.cwd()
         self._git_dir = self._find_git_dir()
-        self._git_executable = None  # Lazy initialization
+        self._git_executable = git_executable  # Lazy initialization
+        self._batch_processes: Dict[str, subprocess.Popen] = {}
+        self._batch_lock = threading.Lock()
+
+    def __enter__(self) -> "GitRepository":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager, stopping batch processes."""
+        self.close()
 
     def _find_git_executable(self) -> str:
         """Find the git executable (handles git vs git.exe on Windows)."""
@@ -116,6 +147,143 @@ class GitRepository:
         except FileNotFoundError:
             raise VCSError("Git command not found. Please install Git.")
 
+    def _batch_process(self, option: str) -> subprocess.Popen:
+        """
+        Get a running ``git cat-file`` batch process, starting it if needed.
+
+        Args:
+            option: Batch option (``--batch`` or ``--batch-check``)
+
+        Returns:
+            Running process
+
+        Raises:
+            VCSError: If git cannot be started
+        """
+        process = self._batch_processes.get(option)
+        if process is not None and process.poll() is None:
+            return process
+
+        try:
+            process = subprocess.Popen(
+                [self._find_git_executable(), "cat-file", option],
+                cwd=self.path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise VCSError(f"Failed to start git cat-file: {e}")
+
+        self._batch_processes[option] = process
+        return process
+
+    def _batch_query(
+        self, option: str, revision: str, path: str
+    ) -> Tuple[Optional[GitObject], IO[bytes]]:
+        """
+        Send an object name to a batch process and read its header.
+
+        Args:
+            option: Batch option (``--batch`` or ``--batch-check``)
+            revision: Commit, branch or tag name
+            path: File path relative to the repository root
+
+        Returns:
+            Tuple of (object information or None if missing, process stdout)
+
+        Raises:
+            VCSError: If the object name is invalid or git exits
+        """
+        name = f"{revision}:{path}"
+        if "\n" in name:
+            raise VCSError(f"Invalid object name: {name!r}")
+
+        process = self._batch_process(option)
+        assert process.stdin is not None and process.stdout is not None
+        try:
+            process.stdin.write(name.encode("utf-8") + b"\n")
+            process.stdin.flush()
+            header = process.stdout.readline().decode("utf-8")
+        except OSError as e:
+            raise VCSError(f"git cat-file failed: {e}")
+
+        if not header:
+            raise VCSError(f"git cat-file exited while reading {name}")
+
+        header = header.rstrip("\n")
+        if header.endswith((" missing", " ambiguous")):
+            return None, process.stdout
+
+        oid, object_type, size = header.split(" ")
+        return GitObject(oid=oid, type=object_type, size=int(size)), process.stdout
+
+    def object_info(self, revision: str, path: str) -> Optional[GitObject]:
+        """
+        Get information about a file at a revision.
+
+        Args:
+            revision: Commit, branch or tag name
+            path: File path relative to the repository root
+
+        Returns:
+            Object information or None if the file does not exist there
+
+        Raises:
+            VCSError: If git fails
+        """
+        with self._batch_lock:
+            info, _ = self._batch_query("--batch-check", revision, path)
+            return info
+
+    def read_file(self, revision: str, path: str) -> Optional[bytes]:
+        """
+        Read a file's content at a revision.
+
+        Args:
+            revision: Commit, branch or tag name
+            path: File path relative to the repository root
+
+        Returns:
+            File content or None if the file does not exist there
+
+        Raises:
+            VCSError: If the path is not a file or git fails
+        """
+        with self._batch_lock:
+            info, stdout = self._batch_query("--batch", revision, path)
+            if info is None:
+                return None
+
+            # Content is followed by a newline, which must be consumed too
+            data = stdout.read(info.size)
+            stdout.read(1)
+            if len(data) != info.size:
+                raise VCSError(f"git cat-file exited while reading {revision}:{path}")
+            if info.type != "blob":
+                raise VCSError(f"{revision}:{path} is a {info.type}, not a file")
+            return data
+
+    def close(self) -> None:
+        """Stop any running batch processes."""
+        with self._batch_lock:
+            processes = list(self._batch_processes.values())
+            self._batch_processes.clear()
+
+        for process in processes:
+            if process.stdin is not None:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            if process.stdout is not None:
+                process.stdout.close()
+
     def get_status(self) -> GitStatus:
         """
         Get repository status.
@@ -135,52 +303,36 @@ class GitRepository:
             )
 
         try:
-            # Get current branch
-            branch_result = self._run_git_command(
-                ["rev-parse", "--abbrev-ref", "HEAD"], check=False
-            )
-            current_branch = (
-                branch_result.stdout.strip() if branch_result.returncode == 0 else None
-            )
-
-            # Get current commit
-            commit_result = self._run_git_command(["rev-parse", "HEAD"], check=False)
-            current_commit = (
-                commit_result.stdout.strip() if commit_result.returncode == 0 else None
-            )
-
-            # Get status
+            # One call reports the branch, commit and working tree state
             status_result = self._run_git_command(
-                ["status", "--porcelain"], check=False
-            )
-            status_lines = (
-                status_result.stdout.rstrip().split("\n")
-                if status_result.stdout.rstrip()
-                else []
+                ["status", "--porcelain=v2", "--branch"], check=False
             )
+            if status_result.returncode != 0:
+                raise VCSError(status_result.stderr)
 
+            current_branch = None
+            current_commit = None
             has_staged_changes = False
             has_unstaged_changes = False
             untracked_files = []
 
-            for line in status_lines:
-                if len(line) >= 2:
-                    staged_status = line[0]
-                    unstaged_status = line[1]
-                    filename = line[3:] if len(line) > 3 else ""
-
-                    # Staged changes: first character is not space or ?
-                    if staged_status != " " and staged_status != "?":
+            for line in status_result.stdout.splitlines():
+                if line.startswith("# branch.oid "):
+                    oid = line[len("# branch.oid ") :]
+                    current_commit = None if oid == "(initial)" else oid
+                elif line.startswith("# branch.head "):
+                    head = line[len("# branch.head ") :]
+                    # Match 'git rev-parse --abbrev-ref HEAD' when detached
+                    current_branch = "HEAD" if head == "(detached)" else head
+                elif line.startswith("? "):
+                    untracked_files.append(line[2:])
+                elif line[:2] in ("1 ", "2 ", "u ") and len(line) >= 4:
+                    # XY: staged and unstaged state, '.' for unmodified
+                    if line[2] != ".":
                         has_staged_changes = True
-
-                    # Unstaged changes: second character is not space
-                    if unstaged_status != " ":
+                    if line[3] != ".":
                         has_unstaged_changes = True
 
-                    # Untracked files: both characters are ?
-                    if staged_status == "?" and unstaged_status == "?":
-                        untracked_files.append(filename)
-
             is_clean = (
                 not has_staged_changes
                 and not has_unstaged_changes
@@ -0,0 +1,97 @@
+"""
+Command profiling utilities for sqlitch.
+
+This module wraps command execution with cProfile so that slow deploys,
+status checks and other operations can be diagnosed from a field report
+without any external tooling.
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+
+class CommandProfiler:
+    """
+    Profile a sqlitch command run with cProfile.
+
+    On stop, the collected statistics are optionally dumped to a pstats
+    file and a summary of the top functions by cumulative time is written
+    to stderr.
+    """
+
+    def __init__(
+        self,
+        output: Optional[Path] = None,
+        limit: int = 25,
+        sort_key: str = "cumulative",
+        file: Optional[TextIO] = None,
+    ) -> None:
+        """
+        Initialize command profiler.
+
+        Args:
+            output: Optional path to write pstats data to
+            limit: Number of functions to include in the summary
+            sort_key: pstats sort key for the summary
+            file: Output stream for the summary (defaults to stderr)
+        """
+        self.output = output
+        self.limit = limit
+        self.sort_key = sort_key
+        self.file = file or sys.stderr
+        self.active = False
+        self._profile: Optional[cProfile.Profile] = None
+
+    def start(self) -> None:
+        """Start collecting profile data."""
+        if self.active:
+            return
+
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        self.active = True
+
+    def stop(self) -> None:
+        """Stop collecting profile data and report the results."""
+        if not self.active or self._profile is None:
+            return
+
+        self._profile.disable()
+        self.active = False
+
+        if self.output is not None:
+            self.output.parent.mkdir(parents=True, exist_ok=True)
+            self._profile.dump_stats(str(self.output))
+
+        self.file.write(self.summary())
+        if self.output is not None:
+            self.file.write(f"Profile data written to {self.output}\n")
+        self.file.flush()
+
+    def summary(self) -> str:
+        """
+        Format the top functions by the configured sort key.
+
+        Returns:
+            Summary text, or an empty string if nothing was profiled
+        """
+        if self._profile is None:
+            return ""
+
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.strip_dirs().sort_stats(self.sort_key).print_stats(self.limit)
+        return stream.getvalue()
+
+    def __enter__(self) -> "CommandProfiler":
+        """Enter context and start profiling."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit context and report profile results."""
+        self.stop()
@@ -6,20 +6,35 @@ including built-in templates for different database engines and
 support for custom template directories.
 """
 
+import importlib.util
+import os
+import re
+import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-try:
-    from jinja2 import BaseLoader, Environment, FileSystemLoader
-
-    JINJA2_AVAILABLE = True
-except ImportError:
-    JINJA2_AVAILABLE = False
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from ..core.exceptions import SqlitchError
 from ..core.types import EngineType, OperationType
 
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+# Jinja2 is only imported when a template engine is created, so that
+# importing this module stays cheap
+JINJA2_AVAILABLE = importlib.util.find_spec("jinja2") is not None
+
+# Template Toolkit constructs used by the built-in templates
+_TT_VARIABLE = re.compile(r"\[%\s*(\w+)\s*%\]")
+_TT_FOREACH = re.compile(r"\[%\s*FOREACH\s+(\w+)\s+IN\s+(\w+)\s*-%\]")
+_TT_END = re.compile(r"\[%\s*END\s*-%\]")
+
+# Jinja2 environments shared by template engines, keyed by the template
+# directories and bytecode cache directory they were created for
+_environment_cache: Dict[Tuple[Any, ...], "Environment"] = {}
+_environment_lock = threading.Lock()
+
 
 class TemplateError(SqlitchError):
     """Template processing error."""
@@ -36,16 +51,20 @@ class TemplateContext:
     engine: str
     requires: List[str] = None
     conflicts: List[str] = None
+    variables: Dict[str, Any] = None
 
     def __post_init__(self):
         if self.requires is None:
             self.requires = []
         if self.conflicts is None:
             self.conflicts = []
+        if self.variables is None:
+            self.variables = {}
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for template rendering."""
         return {
+            **self.variables,
             "project": self.project,
             "change": self.change,
             "engine": self.engine,
@@ -54,17 +73,10 @@ class TemplateContext:
         }
 
 
-class BuiltinTemplateLoader(BaseLoader):
-    """Loader for built-in templates."""
-
-    def __init__(self):
-        self.templates = self._load_builtin_templates()
-
-    def _load_builtin_templates(self) -> Dict[str, str]:
-        """Load built-in template content."""
-        return {
-            # PostgreSQL templates
-            "deploy/pg.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
+# Built-in templates, in Template Toolkit syntax (converted on first use)
+_BUILTIN_TEMPLATES: Dict[str, str] = {
+    # PostgreSQL templates
+    "deploy/pg.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
 [% FOREACH item IN requires -%]
 -- requires: [% item %]
 [% END -%]
@@ -78,7 +90,7 @@ BEGIN;
 
 COMMIT;
 """,
-            "revert/pg.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
+    "revert/pg.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
 
 BEGIN;
 
@@ -86,7 +98,7 @@ BEGIN;
 
 COMMIT;
 """,
-            "verify/pg.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
+    "verify/pg.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
 
 BEGIN;
 
@@ -94,8 +106,8 @@ BEGIN;
 
 ROLLBACK;
 """,
-            # MySQL templates
-            "deploy/mysql.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
+    # MySQL templates
+    "deploy/mysql.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
 [% FOREACH item IN requires -%]
 -- requires: [% item %]
 [% END -%]
@@ -109,7 +121,7 @@ BEGIN;
 
 COMMIT;
 """,
-            "revert/mysql.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
+    "revert/mysql.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
 
 BEGIN;
 
@@ -117,7 +129,7 @@ BEGIN;
 
 COMMIT;
 """,
-            "verify/mysql.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
+    "verify/mysql.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
 
 BEGIN;
 
@@ -125,8 +137,8 @@ BEGIN;
 
 ROLLBACK;
 """,
-            # SQLite templates
-            "deploy/sqlite.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
+    # SQLite templates
+    "deploy/sqlite.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
 [% FOREACH item IN requires -%]
 -- requires: [% item %]
 [% END -%]
@@ -140,7 +152,7 @@ BEGIN;
 
 COMMIT;
 """,
-            "revert/sqlite.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
+    "revert/sqlite.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
 
 BEGIN;
 
@@ -148,7 +160,7 @@ BEGIN;
 
 COMMIT;
 """,
-            "verify/sqlite.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
+    "verify/sqlite.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
 
 BEGIN;
 
@@ -156,8 +168,8 @@ BEGIN;
 
 ROLLBACK;
 """,
-            # Oracle templates
-            "deploy/oracle.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
+    # Oracle templates
+    "deploy/oracle.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
 [% FOREACH item IN requires -%]
 -- requires: [% item %]
 [% END -%]
@@ -167,16 +179,16 @@ ROLLBACK;
 
 -- XXX Add DDLs here.
 """,
-            "revert/oracle.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
+    "revert/oracle.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
 
 -- XXX Add DDLs here.
 """,
-            "verify/oracle.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
+    "verify/oracle.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
 
 -- XXX Add verifications here.
 """,
-            # Snowflake templates
-            "deploy/snowflake.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
+    # Snowflake templates
+    "deploy/snowflake.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
 [% FOREACH item IN requires -%]
 -- requires: [% item %]
 [% END -%]
@@ -188,20 +200,20 @@ USE WAREHOUSE &warehouse;
 
 -- XXX Add DDLs here.
 """,
-            "revert/snowflake.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
+    "revert/snowflake.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
 
 USE WAREHOUSE &warehouse;
 
 -- XXX Add DDLs here.
 """,
-            "verify/snowflake.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
+    "verify/snowflake.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
 
 USE WAREHOUSE &warehouse;
 
 -- XXX Add verifications here.
 """,
-            # Vertica templates
-            "deploy/vertica.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
+    # Vertica templates
+    "deploy/vertica.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
 [% FOREACH item IN requires -%]
 -- requires: [% item %]
 [% END -%]
@@ -211,16 +223,16 @@ USE WAREHOUSE &warehouse;
 
 -- XXX Add DDLs here.
 """,
-            "revert/vertica.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
+    "revert/vertica.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
 
 -- XXX Add DDLs here.
 """,
-            "verify/vertica.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
+    "verify/vertica.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
 
 -- XXX Add verifications here.
 """,
-            # Exasol templates
-            "deploy/exasol.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
+    # Exasol templates
+    "deploy/exasol.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
 [% FOREACH item IN requires -%]
 -- requires: [% item %]
 [% END -%]
@@ -232,20 +244,20 @@ USE WAREHOUSE &warehouse;
 
 COMMIT;
 """,
-            "revert/exasol.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
+    "revert/exasol.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
 
 -- XXX Add DDLs here.
 
 COMMIT;
 """,
-            "verify/exasol.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
+    "verify/exasol.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
 
 -- XXX Add verifications here.
 
 ROLLBACK;
 """,
-            # Firebird templates
-            "deploy/firebird.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
+    # Firebird templates
+    "deploy/firebird.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
 [% FOREACH item IN requires -%]
 -- requires: [% item %]
 [% END -%]
@@ -257,20 +269,20 @@ ROLLBACK;
 
 COMMIT;
 """,
-            "revert/firebird.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
+    "revert/firebird.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
 
 -- XXX Add DDLs here.
 
 COMMIT;
 """,
-            "verify/firebird.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
+    "verify/firebird.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
 
 -- XXX Add verifications here.
 
 ROLLBACK;
 """,
-            # CockroachDB templates
-            "deploy/cockroach.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
+    # CockroachDB templates
+    "deploy/cockroach.tmpl": """-- Deploy [% project %]:[% change %] to [% engine %]
 [% FOREACH item IN requires -%]
 -- requires: [% item %]
 [% END -%]
@@ -280,39 +292,64 @@ ROLLBACK;
 
 -- XXX Add DDLs here.
 """,
-            "revert/cockroach.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
+    "revert/cockroach.tmpl": """-- Revert [% project %]:[% change %] from [% engine %]
 
 -- XXX Add DDLs here.
 """,
-            "verify/cockroach.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
+    "verify/cockroach.tmpl": """-- Verify [% project %]:[% change %] on [% engine %]
 
 -- XXX Add verifications here.
 """,
-        }
+}
+
+
+class BuiltinTemplateLoader:
+    """
+    Loader for built-in templates.
+
+    Implements the Jinja2 loader interface without subclassing
+    ``jinja2.BaseLoader`` so that Jinja2 is not imported with this module.
+    """
+
+    has_source_access = True
+
+    def __init__(self):
+        self.templates = _BUILTIN_TEMPLATES
+        self._converted: Dict[str, str] = {}
 
     def get_source(self, _environment, template):
         """Get template source."""
-        if template in self.templates:
-            source = self.templates[template]
-            # Convert Template Toolkit syntax to Jinja2
-            source = self._convert_tt_to_jinja2(source)
-            return source, None, lambda: True
-        raise TemplateError(f"Template not found: {template}")
+        if template not in self.templates:
+            raise TemplateError(f"Template not found: {template}")
+
+        # Convert Template Toolkit syntax to Jinja2 on first use only
+        source = self._converted.get(template)
+        if source is None:
+            source = self._convert_tt_to_jinja2(self.templates[template])
+            self._converted[template] = source
+        return source, None, lambda: True
+
+    def load(
+        self,
+        environment: "Environment",
+        name: str,
+        globals: Optional[Dict[str, Any]] = None,
+    ) -> "Template":
+        """Load a template, using Jinja2's standard loader logic."""
+        from jinja2 import BaseLoader
+
+        return BaseLoader.load(self, environment, name, globals)  # type: ignore
 
     def _convert_tt_to_jinja2(self, content: str) -> str:
         """Convert Template Toolkit syntax to Jinja2."""
-        import re
-
         # Convert [% variable %] to {{ variable }}
-        content = re.sub(r"\[%\s*(\w+)\s*%\]", r"{{ \1 }}", content)
+        content = _TT_VARIABLE.sub(r"{{ \1 }}", content)
 
         # Convert [% FOREACH item IN list %] to {% for item in list %}
-        content = re.sub(
-            r"\[%\s*FOREACH\s+(\w+)\s+IN\s+(\w+)\s*-%\]", r"{% for \1 in \2 %}", content
-        )
+        content = _TT_FOREACH.sub(r"{% for \1 in \2 %}", content)
 
         # Convert [% END %] to {% endfor %}
-        content = re.sub(r"\[%\s*END\s*-%\]", r"{% endfor %}", content)
+        content = _TT_END.sub(r"{% endfor %}", content)
 
         return content
 
@@ -320,21 +357,53 @@ ROLLBACK;
 class TemplateEngine:
     """Template processing engine."""
 
-    def __init__(self, template_dirs: Optional[List[Path]] = None):
+    def __init__(
+        self,
+        template_dirs: Optional[List[Path]] = None,
+        cache_dir: Optional[Path] = None,
+    ):
         """
         Initialize template engine.
 
+        Jinja2 environments are shared between engines created for the same
+        template directories, so templates are only compiled once per
+        process. Compiled templates are also cached on disk in
+        ``cache_dir`` so that later processes can skip compilation.
+
         Args:
             template_dirs: Optional list of custom template directories
+            cache_dir: Bytecode cache directory (defaults to the user cache
+                directory; caching is skipped if it cannot be created)
         """
         if not JINJA2_AVAILABLE:
             raise TemplateError("Jinja2 is required for template processing")
 
         self.template_dirs = template_dirs or []
-        self.env = self._create_environment()
-
-    def _create_environment(self) -> Environment:
+        self.cache_dir = cache_dir or get_template_cache_dir()
+        self.env = self._get_environment()
+
+    def _get_environment(self) -> "Environment":
+        """Get the shared Jinja2 environment for this engine's settings."""
+        key = (
+            tuple(str(d.resolve()) for d in self.template_dirs if d.exists()),
+            str(self.cache_dir),
+        )
+        with _environment_lock:
+            env = _environment_cache.get(key)
+            if env is None:
+                env = self._create_environment()
+                _environment_cache[key] = env
+            return env
+
+    def _create_environment(self) -> "Environment":
         """Create Jinja2 environment with appropriate loaders."""
+        from jinja2 import (
+            ChoiceLoader,
+            Environment,
+            FileSystemBytecodeCache,
+            FileSystemLoader,
+        )
+
         loaders = []
 
         # Add custom template directories
@@ -346,12 +415,18 @@ class TemplateEngine:
         loaders.append(BuiltinTemplateLoader())
 
         # Create environment with choice loader
-        from jinja2 import ChoiceLoader
-
         loader = ChoiceLoader(loaders) if loaders else BuiltinTemplateLoader()
 
+        bytecode_cache = None
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(self.cache_dir))
+        except OSError:
+            pass
+
         return Environment(
             loader=loader,
+            bytecode_cache=bytecode_cache,
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
@@ -415,9 +490,8 @@ class TemplateEngine:
         """
         templates = []
 
-        # Get templates from built-in loader
-        builtin_loader = BuiltinTemplateLoader()
-        templates.extend(builtin_loader.templates.keys())
+        # Get built-in templates
+        templates.extend(_BUILTIN_TEMPLATES.keys())
 
         # Get templates from custom directories
         for template_dir in self.template_dirs:
@@ -430,6 +504,28 @@ class TemplateEngine:
         return sorted(set(templates))
 
 
+def get_template_cache_dir() -> Path:
+    """
+    Get the default directory for compiled template bytecode.
+
+    Returns:
+        Template cache directory in the user cache directory
+    """
+    if sys.platform.startswith("win"):
+        return Path.home() / ".sqlitch" / "cache" / "templates"
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache:
+        return Path(xdg_cache) / "sqlitch" / "templates"
+    return Path.home() / ".cache" / "sqlitch" / "templates"
+
+
+def clear_template_cache() -> None:
+    """Drop shared Jinja2 environments and their compiled templates."""
+    with _environment_lock:
+        _environment_cache.clear()
+
+
 def create_template_engine(
     template_dirs: Optional[List[Path]] = None,
 ) -> TemplateEngine:
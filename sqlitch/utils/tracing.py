@@ -0,0 +1,246 @@
+"""
+Lightweight tracing support for sqlitch.
+
+This module provides nested timing spans for the phases of a sqlitch run
+(config loading, plan parsing, engine connect, script and statement
+execution, registry writes). Finished spans are exported as JSON lines so
+that deploy traces can be fed into an observability stack. Tracing is
+disabled unless a trace file is configured via ``core.trace_file``.
+"""
+
+import json
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class Span:
+    """A single timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time: float = 0.0
+    end_time: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """Get span duration in milliseconds, or None if still open."""
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) * 1000.0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set a span attribute.
+
+        Args:
+            key: Attribute name
+            value: Attribute value (should be JSON serializable)
+        """
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert span to a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": _format_timestamp(self.start_time),
+            "end_time": (
+                _format_timestamp(self.end_time) if self.end_time is not None else None
+            ),
+            "duration_ms": (
+                round(self.duration_ms, 3) if self.duration_ms is not None else None
+            ),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format an epoch timestamp as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class JsonLinesExporter:
+    """Export finished spans as one JSON object per line."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize exporter.
+
+        Args:
+            path: File to append spans to
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """
+        Append a finished span to the trace file.
+
+        Args:
+            span: Span to export
+        """
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class Tracer:
+    """
+    Create and export nested spans.
+
+    A tracer without an exporter is disabled and its spans cost almost
+    nothing, so instrumentation can stay in place unconditionally.
+    """
+
+    def __init__(self, exporter: Optional[JsonLinesExporter] = None) -> None:
+        """
+        Initialize tracer.
+
+        Args:
+            exporter: Exporter for finished spans (None disables tracing)
+        """
+        self.exporter = exporter
+        self.trace_id = secrets.token_hex(16)
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether spans are being recorded."""
+        return self.exporter is not None
+
+    def _stack(self) -> List[Span]:
+        """Get the open span stack for the current thread."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    @property
+    def current_span(self) -> Optional[Span]:
+        """Get the innermost open span in the current thread."""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        Record a span around a block of code.
+
+        Args:
+            name: Span name (e.g. 'engine.connect')
+            **attributes: Initial span attributes
+
+        Yields:
+            The open span, or None if tracing is disabled
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        parent = self.current_span
+        span = Span(
+            name=name,
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_time=time.time(),
+            attributes=dict(attributes),
+        )
+        stack = self._stack()
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.error = str(e)
+            raise
+        finally:
+            span.end_time = time.time()
+            stack.pop()
+            self._export(span)
+
+    def record(
+        self, name: str, start_time: float, end_time: float, **attributes: Any
+    ) -> None:
+        """
+        Record a span for work that finished before tracing was configured.
+
+        Args:
+            name: Span name
+            start_time: Epoch start time
+            end_time: Epoch end time
+            **attributes: Span attributes
+        """
+        if not self.enabled:
+            return
+
+        parent = self.current_span
+        self._export(
+            Span(
+                name=name,
+                trace_id=self.trace_id,
+                span_id=secrets.token_hex(8),
+                parent_id=parent.span_id if parent else None,
+                start_time=start_time,
+                end_time=end_time,
+                attributes=dict(attributes),
+            )
+        )
+
+    def _export(self, span: Span) -> None:
+        """Hand a finished span to the exporter, never failing the caller."""
+        if self.exporter is None:
+            return
+        try:
+            self.exporter.export(span)
+        except OSError:
+            pass  # Tracing must never break the traced operation
+
+
+# Global tracer instance (disabled until configured)
+_global_tracer: Tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """
+    Get global tracer instance.
+
+    Returns:
+        Global tracer (disabled unless configured)
+    """
+    return _global_tracer
+
+
+def configure_tracing(trace_file: Optional[Path] = None) -> Tracer:
+    """
+    Configure global tracing.
+
+    Args:
+        trace_file: JSON lines file to export spans to (None disables tracing)
+
+    Returns:
+        Configured tracer instance
+    """
+    global _global_tracer
+    exporter = JsonLinesExporter(Path(trace_file)) if trace_file else None
+    _global_tracer = Tracer(exporter)
+    return _global_tracer
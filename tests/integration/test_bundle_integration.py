@@ -1,5 +1,6 @@
 """Integration tests for bundle command."""
 
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -11,6 +12,7 @@ from sqlitch.commands.bundle import BundleCommand
 from sqlitch.core.config import Config
 from sqlitch.core.exceptions import SqlitchError
 from sqlitch.core.sqitch import Sqitch
+from sqlitch.utils.bundle import BundleArchive
 
 
 @pytest.fixture
@@ -398,6 +400,64 @@ class TestBundleIntegration:
         # File should not have been re-copied
         assert second_bundle_time == first_bundle_time
 
+    def test_bundle_skips_touched_files(self, sqitch_instance, temp_project):
+        """Test that files with fresh mtimes but unchanged content are skipped."""
+        command = BundleCommand(sqitch_instance)
+        assert command.execute([]) == 0
+
+        bundled_file = temp_project / "bundle" / "deploy" / "initial.sql"
+        bundled_mtime = bundled_file.stat().st_mtime_ns
+
+        # Simulate a fresh checkout: same content, newer modification time
+        deploy_file = temp_project / "deploy" / "initial.sql"
+        stat = deploy_file.stat()
+        os.utime(deploy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**10))
+
+        assert command.execute([]) == 0
+
+        assert bundled_file.stat().st_mtime_ns == bundled_mtime
+        assert (temp_project / "bundle" / "SHA256SUMS").exists()
+
+    @pytest.mark.parametrize("suffix", [".tar.gz", ".zip"])
+    def test_bundle_archive(self, sqitch_instance, temp_project, suffix):
+        """Test bundling straight into an archive."""
+        archive = temp_project / "dist" / f"release{suffix}"
+        command = BundleCommand(sqitch_instance)
+
+        result = command.execute(["--archive", str(archive)])
+
+        assert result == 0
+        assert not (temp_project / "bundle").exists()
+        with BundleArchive(archive) as bundle:
+            assert bundle.exists("sqitch.conf")
+            assert bundle.exists("sqitch.plan")
+            assert (
+                bundle.read_bytes("deploy/users.sql")
+                == (temp_project / "deploy" / "users.sql").read_bytes()
+            )
+            assert "deploy/users.sql" in bundle.manifest
+
+    def test_bundle_archive_partial_plan(self, sqitch_instance, temp_project):
+        """Test partial plans are streamed into the archive."""
+        archive = temp_project / "release.zip"
+        command = BundleCommand(sqitch_instance)
+
+        result = command.execute(["--archive", str(archive), "--to", "users"])
+
+        assert result == 0
+        with BundleArchive(archive) as bundle:
+            plan = bundle.load_plan(Path("sqitch.plan"))
+            assert [c.name for c in plan.changes] == ["initial", "users"]
+            assert not bundle.exists("deploy/posts.sql")
+
+    def test_bundle_archive_unsupported_format(self, sqitch_instance, temp_project):
+        """Test unsupported archive formats are rejected."""
+        command = BundleCommand(sqitch_instance)
+
+        result = command.execute(["--archive", "release.rar"])
+
+        assert result == 1
+
     def test_bundle_creates_nested_directories(self, sqitch_instance, temp_project):
         """Test that bundling creates necessary nested directories."""
         # Create a nested script file
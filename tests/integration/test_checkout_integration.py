@@ -5,7 +5,7 @@ Integration tests for checkout command.
 import subprocess
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -126,7 +126,7 @@ class TestCheckoutIntegration:
             with patch(
                 "sqlitch.engines.base.EngineRegistry.create_engine"
             ) as mock_create_engine:
-                mock_engine = Mock()
+                mock_engine = MagicMock()
                 mock_engine.ensure_registry.return_value = None
                 mock_engine.revert.return_value = None
                 mock_engine.deploy.return_value = None
@@ -157,6 +157,55 @@ class TestCheckoutIntegration:
         finally:
             os.chdir(original_cwd)
 
+    def test_find_last_common_change_compares_scripts(
+        self, checkout_command, temp_git_repo, monkeypatch
+    ):
+        """Test scripts edited on a branch without a plan change diverge."""
+        monkeypatch.chdir(temp_git_repo)
+
+        def commit(message):
+            subprocess.run(["git", "add", "."], check=True)
+            subprocess.run(["git", "commit", "-q", "-m", message], check=True)
+
+        (temp_git_repo / "deploy").mkdir()
+        (temp_git_repo / "deploy" / "users.sql").write_text("CREATE TABLE users;\n")
+        commit("Add users script")
+        subprocess.run(["git", "checkout", "-q", "feature"], check=True)
+        subprocess.run(["git", "merge", "-q", "main"], check=True)
+        target = Mock(plan_file=Path("sqitch.plan"))
+
+        try:
+            current_plan = checkout_command._load_branch_plan("main", target)
+            feature_plan = checkout_command._load_branch_plan("feature", target)
+
+            # Same scripts: the last change of main is common
+            common = checkout_command._find_last_common_change(
+                current_plan, feature_plan, "main"
+            )
+            assert common.name == "users"
+
+            # Edit the script on the feature branch only
+            (temp_git_repo / "deploy" / "users.sql").write_text(
+                "CREATE TABLE users (id INT);\n"
+            )
+            commit("Change users script")
+            subprocess.run(["git", "checkout", "-q", "main"], check=True)
+
+            assert (
+                checkout_command._find_last_common_change(
+                    current_plan, feature_plan
+                ).name
+                == "users"
+            )
+            assert (
+                checkout_command._find_last_common_change(
+                    current_plan, feature_plan, "feature"
+                )
+                is None
+            )
+        finally:
+            checkout_command._repository.close()
+
     def test_checkout_already_on_branch(self, checkout_command, temp_git_repo):
         """Test checkout when already on target branch."""
         import os
@@ -263,7 +312,7 @@ widgets 2023-01-20T09:00:00Z Bob Smith <bob@example.com> # Add widgets table
             with patch(
                 "sqlitch.engines.base.EngineRegistry.create_engine"
             ) as mock_create_engine:
-                mock_engine = Mock()
+                mock_engine = MagicMock()
                 mock_engine.ensure_registry.return_value = None
                 mock_engine.revert.return_value = None
                 mock_engine.deploy.return_value = None
@@ -343,7 +392,7 @@ widgets 2023-01-20T09:00:00Z Bob Smith <bob@example.com> # Add widgets table
             with patch(
                 "sqlitch.engines.base.EngineRegistry.create_engine"
             ) as mock_create_engine:
-                mock_engine = Mock()
+                mock_engine = MagicMock()
                 mock_engine.ensure_registry.return_value = None
                 mock_engine.revert.side_effect = SqlitchError("Revert failed")
                 mock_create_engine.return_value = mock_engine
@@ -274,6 +274,7 @@ class TestDeployCommandIntegration:
         mock_cursor.fetchone.side_effect = [
             None,  # Schema doesn't exist
             None,  # Project doesn't exist
+            {"locked": True},  # Deploy lock is free
             None,  # No deployed changes
         ]
         mock_cursor.fetchall.return_value = []  # No deployed changes
@@ -303,6 +304,7 @@ class TestDeployCommandIntegration:
         mock_cursor.fetchone.side_effect = [
             None,  # Schema doesn't exist
             None,  # Project doesn't exist
+            {"locked": True},  # Deploy lock is free
         ]
         mock_cursor.fetchall.return_value = []  # No deployed changes
 
@@ -330,6 +332,7 @@ class TestDeployCommandIntegration:
         mock_cursor.fetchone.side_effect = [
             None,  # Schema doesn't exist
             None,  # Project doesn't exist
+            {"locked": True},  # Deploy lock is free
         ]
         mock_cursor.fetchall.return_value = []  # No deployed changes
 
@@ -381,6 +384,7 @@ class TestDeployCommandIntegration:
         mock_cursor.fetchone.side_effect = [
             None,  # Schema doesn't exist
             None,  # Project doesn't exist
+            {"locked": True},  # Deploy lock is free
         ]
         mock_cursor.fetchall.return_value = []  # No deployed changes
 
@@ -413,6 +417,7 @@ class TestDeployCommandIntegration:
         mock_cursor.fetchone.side_effect = [
             None,  # Schema doesn't exist
             None,  # Project doesn't exist
+            {"locked": True},  # Deploy lock is free
         ]
         mock_cursor.fetchall.return_value = []  # No deployed changes
 
@@ -442,6 +447,7 @@ class TestDeployCommandCLIIntegration:
         mock_cursor.fetchone.side_effect = [
             None,  # Schema doesn't exist
             None,  # Project doesn't exist
+            {"locked": True},  # Deploy lock is free
         ]
         mock_cursor.fetchall.return_value = []  # No deployed changes
 
@@ -486,6 +492,7 @@ class TestDeployCommandCLIIntegration:
         mock_cursor.fetchone.side_effect = [
             None,  # Schema doesn't exist
             None,  # Project doesn't exist
+            {"locked": True},  # Deploy lock is free
         ]
         mock_cursor.fetchall.return_value = []  # No deployed changes
 
@@ -602,6 +609,7 @@ class TestDeployCommandErrorHandling:
             mock_cursor.fetchone.side_effect = [
                 None,  # Schema doesn't exist
                 None,  # Project doesn't exist
+                {"locked": True},  # Deploy lock is free
             ]
             mock_cursor.fetchall.return_value = []  # No deployed changes
 
@@ -626,6 +634,7 @@ class TestDeployCommandProgressReporting:
         mock_cursor.fetchone.side_effect = [
             None,  # Schema doesn't exist
             None,  # Project doesn't exist
+            {"locked": True},  # Deploy lock is free
         ]
         mock_cursor.fetchall.return_value = []  # No deployed changes
 
@@ -652,6 +661,7 @@ class TestDeployCommandProgressReporting:
         mock_cursor.fetchone.side_effect = [
             None,  # Schema doesn't exist
             None,  # Project doesn't exist
+            {"locked": True},  # Deploy lock is free
         ]
         mock_cursor.fetchall.return_value = []  # No deployed changes
 
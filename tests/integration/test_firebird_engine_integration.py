@@ -324,7 +324,9 @@ class TestFirebirdEngineIntegration:
         SELECT * FROM test;
         """
 
-        statements = engine._split_sql_statements(sql_content)
+        statements = [
+            statement for statement, _ in engine._split_statement_lines(sql_content)
+        ]
 
         expected = [
             "CREATE TABLE test ( id INTEGER PRIMARY KEY );",
@@ -250,6 +250,53 @@ class TestGitRepositoryIntegration:
 
         assert status.current_branch == "feature/test"
 
+    def test_read_file_at_revision(self, git_repo_with_commits):
+        """Test reading files from history through one batch process."""
+        (git_repo_with_commits / "test.txt").write_text("Working copy")
+
+        with GitRepository(git_repo_with_commits) as repo:
+            assert repo.read_file("HEAD", "test.txt") == b"Initial content"
+            assert repo.read_file("HEAD~1", "test2.txt") is None
+            assert repo.read_file("HEAD", "missing.txt") is None
+            process = repo._batch_processes["--batch"]
+            assert repo.read_file("HEAD", "test2.txt") == b"Second content"
+            assert repo._batch_processes["--batch"] is process
+
+        assert repo._batch_processes == {}
+        assert process.poll() is not None
+
+    def test_object_info(self, git_repo_with_commits):
+        """Test object information from --batch-check."""
+        blob_id = subprocess.run(
+            ["git", "rev-parse", "HEAD:test.txt"],
+            cwd=git_repo_with_commits,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+        with GitRepository(git_repo_with_commits) as repo:
+            info = repo.object_info("HEAD", "test.txt")
+            assert repo.object_info("nope", "test.txt") is None
+
+        assert info.oid == blob_id
+        assert info.type == "blob"
+        assert info.size == len("Initial content")
+
+    def test_read_file_not_a_blob(self, git_repo_with_commits):
+        """Test reading a directory is an error, and the stream stays usable."""
+        (git_repo_with_commits / "deploy").mkdir()
+        (git_repo_with_commits / "deploy" / "a.sql").write_text("SELECT 1;")
+        subprocess.run(["git", "add", "."], cwd=git_repo_with_commits, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Add deploy"], cwd=git_repo_with_commits, check=True
+        )
+
+        with GitRepository(git_repo_with_commits) as repo:
+            with pytest.raises(VCSError, match="not a file"):
+                repo.read_file("HEAD", "deploy")
+            assert repo.read_file("HEAD", "deploy/a.sql") == b"SELECT 1;"
+
 
 class TestUtilityFunctionsIntegration:
     """Integration tests for utility functions."""
@@ -13,6 +13,7 @@ from unittest.mock import Mock
 import pytest
 
 from sqlitch.core.change import Change, Dependency
+from sqlitch.core.exceptions import DeploymentError
 from sqlitch.core.plan import Plan
 from sqlitch.core.target import Target
 from sqlitch.core.types import URI
@@ -349,6 +350,34 @@ class TestMySQLEngineIntegration:
                     f"DROP DATABASE IF EXISTS `{mysql_engine._registry_db_name}`"
                 )
 
+    def test_execute_sql_file_in_batches(self, mysql_engine, tmp_path):
+        """Test scripts with DELIMITER blocks run as multi-statement batches."""
+        sql_file = tmp_path / "batch.sql"
+        sql_file.write_text(
+            "CREATE TABLE batch_test (id INT PRIMARY KEY);\n"
+            "INSERT INTO batch_test VALUES (1);\n"
+            "DELIMITER $$\n"
+            "CREATE PROCEDURE batch_test_add(n INT)\n"
+            "BEGIN\n"
+            "  INSERT INTO batch_test VALUES (n);\n"
+            "END$$\n"
+            "DELIMITER ;\n"
+            "CALL batch_test_add(2);\n"
+            "INSERT INTO batch_test VALUES (3);\n"
+            "INSERT INTO batch_test VALUES (1);\n"
+        )
+
+        with mysql_engine.connection() as conn:
+            try:
+                with pytest.raises(DeploymentError, match=r"batch\.sql:11"):
+                    mysql_engine._execute_sql_file(conn, sql_file)
+
+                conn.execute("SELECT COUNT(*) AS n FROM batch_test")
+                assert conn.fetchone()["n"] == 3
+            finally:
+                conn.execute("DROP PROCEDURE IF EXISTS batch_test_add")
+                conn.execute("DROP TABLE IF EXISTS batch_test")
+
     def test_multiple_changes_deployment_order(self, mysql_engine, tmp_path):
         """Test deploying multiple changes in correct order."""
         # Create multiple test changes
@@ -443,7 +472,7 @@ class TestMySQLEngineIntegration:
                 assert mode in sql_mode.upper()
 
     def test_concurrent_access_locking(self, mysql_engine, test_change, tmp_path):
-        """Test that table locking prevents concurrent modifications."""
+        """Test deploying while holding the advisory deploy lock."""
         # Create test SQL file
         deploy_file = tmp_path / f"deploy_{test_change.name}.sql"
         deploy_file.write_text("CREATE TABLE lock_test (id INT PRIMARY KEY);")
@@ -457,15 +486,28 @@ class TestMySQLEngineIntegration:
         mysql_engine.ensure_registry()
 
         try:
-            # Test that transaction context manager handles locking
+            # Test that transaction context manager works without table locks
             with mysql_engine.transaction() as conn:
                 # Verify we can execute statements within transaction
                 conn.execute("SELECT 1")
                 result = conn.fetchone()
                 assert result is not None
 
-            # Deploy change to test full transaction cycle
-            mysql_engine.deploy_change(test_change)
+            # Deploy change while holding the lock; readers are not blocked
+            with mysql_engine.lock_destination():
+                mysql_engine.deploy_change(test_change)
+                assert test_change.id in mysql_engine.get_deployed_changes()
+
+                # A second session cannot take the lock
+                other = mysql_engine._create_connection()
+                try:
+                    other.execute(
+                        "SELECT GET_LOCK(%(name)s, 0) AS locked",
+                        {"name": mysql_engine._lock_name},
+                    )
+                    assert other.fetchone()["locked"] == 0
+                finally:
+                    other.close()
 
             # Verify change was deployed
             deployed_changes = mysql_engine.get_deployed_changes()
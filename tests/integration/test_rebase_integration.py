@@ -23,7 +23,7 @@ from sqlitch.core.sqitch import Sqitch
 
 def create_mock_engine():
     """Create a mock engine for testing."""
-    mock_engine = Mock()
+    mock_engine = MagicMock()
     mock_engine.planned_deployed_common_ancestor_id = Mock(return_value="initial")
     mock_engine.revert = Mock()
     mock_engine.deploy = Mock()
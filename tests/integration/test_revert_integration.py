@@ -10,6 +10,7 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import click
 import pytest
 
 from sqlitch.commands.revert import RevertCommand
@@ -412,7 +413,9 @@ class TestRevertCommandCLIIntegration:
         from sqlitch.cli import cli
 
         # Check that revert command is registered
-        assert "revert" in [cmd.name for cmd in cli.commands.values()]
+        ctx = click.Context(cli)
+        assert "revert" in cli.list_commands(ctx)
+        assert cli.get_command(ctx, "revert").name == "revert"
 
     def test_revert_command_click_wrapper(self, temp_project):
         """Test Click command wrapper."""
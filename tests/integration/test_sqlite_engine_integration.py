@@ -336,6 +336,40 @@ class TestSQLiteEngineIntegration:
         assert state["project"] == "test_project"
         assert state["change_id"] == users_change.id
 
+    def test_get_status(self, engine):
+        """Test reading state, changes, tags and pending changes together."""
+        connections = []
+        create_connection = engine._create_connection
+
+        def counting_connection():
+            connections.append(1)
+            return create_connection()
+
+        engine._create_connection = counting_connection
+
+        # The registry is created through the same connection
+        status = engine.get_status()
+        assert status.state is None
+        assert status.changes == []
+        assert status.pending == engine.plan.changes
+        assert len(connections) == 1
+
+        users_change, posts_change = engine.plan.changes
+        engine.deploy_change(users_change)
+
+        status = engine.get_status()
+        assert status.state["change_id"] == users_change.id
+        assert status.state["tags"] == []
+        assert [change["change"] for change in status.changes] == ["users_table"]
+        assert status.pending == [posts_change]
+        assert status.pending_count == 1
+
+        engine.deploy_change(posts_change)
+
+        status = engine.get_status()
+        assert status.state["change"] == "posts_table"
+        assert status.pending == []
+
     def test_get_deployed_changes(self, engine):
         """Test getting list of deployed changes."""
         engine.ensure_registry()
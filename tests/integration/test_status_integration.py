@@ -16,6 +16,7 @@ from sqlitch.core.change import Change, Dependency
 from sqlitch.core.config import Config
 from sqlitch.core.plan import Plan
 from sqlitch.core.sqitch import Sqitch
+from sqlitch.engines.base import RegistryStatus
 
 
 @pytest.fixture
@@ -213,7 +214,9 @@ class TestStatusIntegration:
         # Mock the engine to simulate no deployed changes
         mock_engine = Mock()
         mock_engine.ensure_registry.return_value = None
-        mock_engine.get_current_state.return_value = None
+        mock_engine.get_status.return_value = RegistryStatus(
+            state=None, changes=[], tags=[], pending=[]
+        )
 
         mock_target = Mock()
         mock_target.uri = "postgresql://test@localhost/test_db"
@@ -249,8 +252,6 @@ class TestStatusIntegration:
             "planner_email": "test@example.com",
             "planned_at": datetime(2023, 1, 16, 14, 20, 0, tzinfo=timezone.utc),
         }
-        mock_engine.get_current_state.return_value = current_state
-
         # Mock current changes
         changes = [
             {
@@ -274,7 +275,6 @@ class TestStatusIntegration:
                 "planned_at": datetime(2023, 1, 15, 10, 30, 0, tzinfo=timezone.utc),
             },
         ]
-        mock_engine.get_current_changes.return_value = iter(changes)
 
         # Mock current tags
         tags = [
@@ -289,7 +289,9 @@ class TestStatusIntegration:
                 "planned_at": datetime(2023, 1, 20, 9, 0, 0, tzinfo=timezone.utc),
             }
         ]
-        mock_engine.get_current_tags.return_value = iter(tags)
+        mock_engine.get_status.return_value = RegistryStatus(
+            state=current_state, changes=changes, tags=tags, pending=[]
+        )
 
         # Mock target
         mock_target = Mock()
@@ -343,9 +345,9 @@ class TestStatusIntegration:
             "planner_email": "jane@example.com",
             "planned_at": last_change.timestamp,
         }
-        mock_engine.get_current_state.return_value = current_state
-        mock_engine.get_current_changes.return_value = iter([])
-        mock_engine.get_current_tags.return_value = iter([])
+        mock_engine.get_status.return_value = RegistryStatus(
+            state=current_state, changes=[], tags=[], pending=[]
+        )
 
         mock_target = Mock()
         mock_target.uri = "postgresql://test@localhost/test_db"
@@ -390,9 +392,9 @@ class TestStatusIntegration:
             "planner_email": "test@example.com",
             "planned_at": first_change.timestamp,
         }
-        mock_engine.get_current_state.return_value = current_state
-        mock_engine.get_current_changes.return_value = iter([])
-        mock_engine.get_current_tags.return_value = iter([])
+        mock_engine.get_status.return_value = RegistryStatus(
+            state=current_state, changes=[], tags=[], pending=plan.changes[1:]
+        )
 
         mock_target = Mock()
         mock_target.uri = "postgresql://test@localhost/test_db"
@@ -432,9 +434,9 @@ class TestStatusIntegration:
             "planner_email": "test@example.com",
             "planned_at": datetime(2023, 1, 15, 10, 30, 0, tzinfo=timezone.utc),
         }
-        mock_engine.get_current_state.return_value = current_state
-        mock_engine.get_current_changes.return_value = iter([])
-        mock_engine.get_current_tags.return_value = iter([])
+        mock_engine.get_status.return_value = RegistryStatus(
+            state=current_state, changes=[], tags=[], pending=[]
+        )
 
         mock_target = Mock()
         mock_target.uri = "postgresql://test@localhost/test_db"
@@ -474,9 +476,9 @@ class TestStatusIntegration:
             "planner_email": "test@example.com",
             "planned_at": datetime(2023, 1, 15, 10, 30, 0, tzinfo=timezone.utc),
         }
-        mock_engine.get_current_state.return_value = current_state
-        mock_engine.get_current_changes.return_value = iter([])
-        mock_engine.get_current_tags.return_value = iter([])
+        mock_engine.get_status.return_value = RegistryStatus(
+            state=current_state, changes=[], tags=[], pending=[]
+        )
 
         mock_target = Mock()
         mock_target.uri = "postgresql://test@localhost/test_db"
@@ -514,7 +516,8 @@ class TestStatusIntegration:
 
         # Test with engine error
         mock_engine = Mock()
-        mock_engine.ensure_registry.side_effect = Exception("Database error")
+        mock_engine.get_status.side_effect = Exception("Database error")
+        mock_engine._create_connection.side_effect = Exception("Database error")
 
         mock_target = Mock()
         mock_target.uri = "postgresql://test@localhost/test_db"
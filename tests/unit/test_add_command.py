@@ -431,6 +431,160 @@ class TestAddCommand:
         add_command.logger.error.assert_called()
 
 
+class TestAddFromManifest:
+    """Test adding changes from a manifest file."""
+
+    @pytest.fixture
+    def project(self, tmp_path, mock_target):
+        """Create a plan file and point the target at it."""
+        plan_file = tmp_path / "sqitch.plan"
+        plan_file.write_text(
+            "%syntax-version=1.0.0\n%project=test_project\n\n"
+            "base 2024-01-01T00:00:00Z Test User <test@example.com> # Base\n"
+        )
+        mock_target.plan_file = plan_file
+        mock_target.top_dir = tmp_path
+        return tmp_path
+
+    @pytest.fixture
+    def command(self, add_command, mock_target):
+        """Create AddCommand with project checks stubbed out."""
+        add_command.require_initialized = Mock()
+        add_command.validate_user_info = Mock()
+        add_command._get_targets = Mock(return_value=[mock_target])
+        return add_command
+
+    def test_load_csv_manifest(self, command, tmp_path):
+        """Test CSV manifests with dependencies and template variables."""
+        manifest = tmp_path / "changes.csv"
+        manifest.write_text(
+            "name,requires,note,tenant\n"
+            "users_a,base,Users for A,a\n"
+            "users_b,base users_a,,b\n"
+        )
+
+        entries = command._load_manifest(manifest)
+
+        assert entries[0] == {
+            "name": "users_a",
+            "requires": ["base"],
+            "conflicts": [],
+            "note": "Users for A",
+            "variables": {"tenant": "a"},
+        }
+        assert entries[1]["requires"] == ["base", "users_a"]
+
+    def test_load_json_manifest(self, command, tmp_path):
+        """Test JSON manifests accept lists for dependencies."""
+        manifest = tmp_path / "changes.json"
+        manifest.write_text(
+            '[{"name": "grants", "requires": ["base"], "conflicts": "old"}]'
+        )
+
+        entries = command._load_manifest(manifest)
+
+        assert entries[0]["requires"] == ["base"]
+        assert entries[0]["conflicts"] == ["old"]
+
+    @pytest.mark.parametrize(
+        "filename,content,message",
+        [
+            ("changes.txt", "x", "Unsupported manifest format"),
+            ("changes.json", '{"name": "x"}', "must contain a list"),
+            ("changes.json", '[{"note": "x"}]', "entry 1 has no name"),
+            ("changes.csv", "name\nx\nx\n", "listed more than once"),
+            ("changes.json", "[", "Cannot read manifest"),
+        ],
+    )
+    def test_load_invalid_manifest(self, command, tmp_path, filename, content, message):
+        """Test invalid manifests are rejected."""
+        manifest = tmp_path / filename
+        manifest.write_text(content)
+
+        with pytest.raises(SqlitchError, match=message):
+            command._load_manifest(manifest)
+
+    def test_execute_from_file(self, command, project):
+        """Test all changes are added, rendered and saved in one run."""
+        manifest = project / "changes.csv"
+        manifest.write_text(
+            "name,requires,note\n"
+            + "".join(f"part_{n},base,Partition {n}\n" for n in range(20))
+        )
+
+        with patch.object(Plan, "save", autospec=True, side_effect=Plan.save) as save:
+            result = command.execute(["--from-file", str(manifest)])
+
+        assert result == 0
+        save.assert_called_once()
+
+        plan = Plan.from_file(project / "sqitch.plan")
+        assert [c.name for c in plan.changes][1:] == [f"part_{n}" for n in range(20)]
+        assert plan.changes[5].note == "Partition 4"
+
+        deploy = (project / "deploy" / "part_7.sql").read_text()
+        assert "Deploy test_project:part_7 to pg" in deploy
+        assert "-- requires: base" in deploy
+        assert (project / "revert" / "part_19.sql").exists()
+        assert (project / "verify" / "part_0.sql").exists()
+
+    def test_execute_from_file_template_variables(self, command, project):
+        """Test manifest fields are passed to templates as variables."""
+        templates = project / "templates"
+        (templates / "deploy").mkdir(parents=True)
+        (templates / "deploy" / "grant.tmpl").write_text(
+            "GRANT SELECT ON {{ table }} TO {{ role }};\n"
+        )
+        manifest = project / "grants.json"
+        manifest.write_text(
+            '[{"name": "grant_users", "table": "users"},'
+            ' {"name": "grant_orders", "table": "orders", "role": "admin"}]'
+        )
+
+        result = command.execute(
+            [
+                "--from-file",
+                str(manifest),
+                "--template",
+                "grant",
+                "--template-directory",
+                str(templates),
+                "--without",
+                "revert",
+                "--without",
+                "verify",
+                "--set",
+                "role=reader",
+            ]
+        )
+
+        assert result == 0
+        assert (project / "deploy" / "grant_users.sql").read_text() == (
+            "GRANT SELECT ON users TO reader;\n"
+        )
+        assert (project / "deploy" / "grant_orders.sql").read_text() == (
+            "GRANT SELECT ON orders TO admin;\n"
+        )
+
+    def test_execute_from_file_skips_existing(self, command, project):
+        """Test changes already in the plan are skipped with a warning."""
+        manifest = project / "changes.csv"
+        manifest.write_text("name\nbase\nextra\n")
+
+        result = command.execute(["--from-file", str(manifest)])
+
+        assert result == 0
+        command.logger.warn.assert_called()
+        plan = Plan.from_file(project / "sqitch.plan")
+        assert [c.name for c in plan.changes] == ["base", "extra"]
+
+    def test_execute_from_file_with_change_name(self, command, project):
+        """Test a change name cannot be combined with --from-file."""
+        result = command.execute(["other", "--from-file", "changes.csv"])
+
+        assert result == 1
+
+
 class TestAddCommandIntegration:
     """Integration tests for AddCommand."""
 
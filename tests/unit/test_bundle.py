@@ -0,0 +1,308 @@
+"""
+Tests for bundle writing utilities.
+
+This module tests content digests, the checksum manifest, the incremental
+BundleDirectory writer and bundle archives used by 'sqlitch bundle'.
+"""
+
+import hashlib
+import os
+import sys
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sqlitch.core.exceptions import PlanError, SqlitchError
+from sqlitch.utils.bundle import (
+    MANIFEST_FILE,
+    ArchivePath,
+    BundleArchive,
+    BundleArchiveWriter,
+    BundleDirectory,
+    BundlePlan,
+    archive_format,
+    copy_file,
+    file_digest,
+    format_manifest,
+    read_manifest,
+)
+
+
+def _touch(path, seconds=10):
+    """Move a file's modification time forward without changing it."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+
+class TestFileHelpers:
+    """Test digest, copy and manifest helpers."""
+
+    def test_file_digest(self, tmp_path):
+        """Test SHA-256 digests of file content."""
+        path = tmp_path / "deploy.sql"
+        path.write_bytes(b"CREATE TABLE t (id INT);\n")
+
+        assert file_digest(path) == (
+            hashlib.sha256(b"CREATE TABLE t (id INT);\n").hexdigest()
+        )
+
+    def test_copy_file(self, tmp_path):
+        """Test content and modification time are copied."""
+        src = tmp_path / "src.sql"
+        src.write_text("SELECT 1;")
+        _touch(src, -100)
+        dest = tmp_path / "dest.sql"
+
+        copy_file(src, dest)
+
+        assert dest.read_text() == "SELECT 1;"
+        assert dest.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+    def test_copy_file_fallback(self, tmp_path):
+        """Test copying falls back when copy_file_range is unsupported."""
+        src = tmp_path / "src.sql"
+        src.write_text("SELECT 1;")
+        dest = tmp_path / "dest.sql"
+
+        with patch(
+            "os.copy_file_range", side_effect=OSError("unsupported"), create=True
+        ):
+            copy_file(src, dest)
+
+        assert dest.read_text() == "SELECT 1;"
+
+    def test_manifest_round_trip(self, tmp_path):
+        """Test manifests are written sorted and read back."""
+        entries = {"deploy/b.sql": "b" * 64, "deploy/a.sql": "a" * 64}
+        path = tmp_path / MANIFEST_FILE
+        path.write_text(format_manifest(entries) + "garbage line\n")
+
+        assert path.read_text().splitlines()[0] == f"{'a' * 64}  deploy/a.sql"
+        assert read_manifest(path) == entries
+
+    def test_read_missing_manifest(self, tmp_path):
+        """Test a missing manifest reads as empty."""
+        assert read_manifest(tmp_path / MANIFEST_FILE) == {}
+
+
+class TestBundleDirectory:
+    """Test incremental bundle directories."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create source scripts."""
+        src = tmp_path / "src"
+        src.mkdir()
+        for name in ("a", "b", "c"):
+            (src / f"{name}.sql").write_text(f"-- {name}\n")
+        return src
+
+    def _bundle(self, project, dest_dir):
+        writer = BundleDirectory(dest_dir, workers=4)
+        for name in ("a", "b", "c"):
+            writer.copy(project / f"{name}.sql", dest_dir / "deploy" / f"{name}.sql")
+        writer.write_text(dest_dir / "sqitch.plan", "%project=test\n")
+        writer.close()
+        return writer
+
+    def test_first_bundle_copies_everything(self, project, tmp_path):
+        """Test all files and the manifest are written."""
+        dest_dir = tmp_path / "bundle"
+
+        writer = self._bundle(project, dest_dir)
+
+        assert len(writer.copied) == 4
+        assert (dest_dir / "deploy" / "b.sql").read_text() == "-- b\n"
+        manifest = read_manifest(dest_dir / MANIFEST_FILE)
+        assert manifest["deploy/a.sql"] == file_digest(project / "a.sql")
+        assert set(manifest) == {
+            "deploy/a.sql",
+            "deploy/b.sql",
+            "deploy/c.sql",
+            "sqitch.plan",
+        }
+
+    def test_rebundle_ignores_modification_times(self, project, tmp_path):
+        """Test touched but unchanged files are not copied again."""
+        dest_dir = tmp_path / "bundle"
+        self._bundle(project, dest_dir)
+        for path in project.iterdir():
+            _touch(path)
+
+        writer = self._bundle(project, dest_dir)
+
+        assert writer.copied == []
+
+    def test_rebundle_copies_changed_files(self, project, tmp_path):
+        """Test only files whose content changed are copied."""
+        dest_dir = tmp_path / "bundle"
+        self._bundle(project, dest_dir)
+        (project / "b.sql").write_text("-- b changed\n")
+
+        writer = self._bundle(project, dest_dir)
+
+        assert writer.copied == [dest_dir / "deploy" / "b.sql"]
+        assert (dest_dir / "deploy" / "b.sql").read_text() == "-- b changed\n"
+
+    def test_existing_files_without_manifest(self, project, tmp_path):
+        """Test destination files are hashed when there is no manifest."""
+        dest_dir = tmp_path / "bundle"
+        self._bundle(project, dest_dir)
+        (dest_dir / MANIFEST_FILE).unlink()
+        (dest_dir / "deploy" / "c.sql").write_text("-- x\n")
+
+        writer = self._bundle(project, dest_dir)
+
+        assert writer.copied == [dest_dir / "deploy" / "c.sql"]
+
+    def test_interrupted_rebundle(self, project, tmp_path):
+        """Test a failed run leaves no manifest that disagrees with the files."""
+        dest_dir = tmp_path / "bundle"
+        self._bundle(project, dest_dir)
+        (project / "a.sql").write_text("-- x\n")
+        (project / "b.sql").write_text("-- y\n")
+
+        def failing_copy(src, dest):
+            if src.name == "b.sql":
+                raise OSError("disk full")
+            copy_file(src, dest)
+
+        with patch("sqlitch.utils.bundle.copy_file", side_effect=failing_copy):
+            with pytest.raises(SqlitchError, match="disk full"):
+                self._bundle(project, dest_dir)
+
+        assert not (dest_dir / MANIFEST_FILE).exists()
+
+        # Same-size content matching the old manifest must still be copied
+        (project / "a.sql").write_text("-- a\n")
+        self._bundle(project, dest_dir)
+
+        for name in ("a", "b", "c"):
+            copied = (dest_dir / "deploy" / f"{name}.sql").read_text()
+            assert copied == (project / f"{name}.sql").read_text()
+        manifest = read_manifest(dest_dir / MANIFEST_FILE)
+        assert manifest["deploy/b.sql"] == file_digest(project / "b.sql")
+        assert not (dest_dir / f".{MANIFEST_FILE}.tmp").exists()
+
+    def test_missing_source(self, tmp_path):
+        """Test queuing a missing file fails."""
+        writer = BundleDirectory(tmp_path / "bundle")
+
+        with pytest.raises(SqlitchError, match="does not exist"):
+            writer.copy(tmp_path / "missing.sql", tmp_path / "bundle" / "x.sql")
+
+
+class TestBundleArchive:
+    """Test writing and reading bundle archives."""
+
+    PLAN = (
+        "%syntax-version=1.0.0\n%project=test\n\n"
+        "users 2024-01-01T00:00:00Z Test User <test@example.com> # Users\n"
+    )
+
+    def _write(self, tmp_path, archive):
+        src = tmp_path / "users.sql"
+        src.write_text("CREATE TABLE users (id INT);\n")
+        writer = BundleArchiveWriter(archive)
+        writer.copy(src, Path("deploy/users.sql"))
+        writer.copy(src, Path("deploy/users.sql"))
+        writer.write_text(Path("./sqitch.plan"), self.PLAN)
+        writer.close()
+        return writer
+
+    @pytest.mark.parametrize("suffix", [".tar.gz", ".tgz", ".zip"])
+    def test_round_trip(self, tmp_path, suffix):
+        """Test files written to an archive are read back and verified."""
+        archive = tmp_path / f"bundle{suffix}"
+
+        writer = self._write(tmp_path, archive)
+
+        assert sorted(writer.digests) == [
+            MANIFEST_FILE,
+            "deploy/users.sql",
+            "sqitch.plan",
+        ]
+        assert not list(tmp_path.glob(".*.tmp"))
+
+        with BundleArchive(archive) as bundle:
+            assert bundle.exists("deploy/users.sql")
+            assert not bundle.exists("revert/users.sql")
+            assert (
+                bundle.manifest["deploy/users.sql"]
+                == writer.digests["deploy/users.sql"]
+            )
+            assert bundle.read_bytes("deploy/users.sql") == (
+                b"CREATE TABLE users (id INT);\n"
+            )
+
+    def test_load_plan(self, tmp_path):
+        """Test plans loaded from an archive read scripts from it."""
+        archive = tmp_path / "bundle.zip"
+        self._write(tmp_path, archive)
+
+        with BundleArchive(archive) as bundle:
+            plan = bundle.load_plan(Path("sqitch.plan"))
+            change = plan.changes[0]
+
+            deploy = plan.get_deploy_file(change)
+            assert isinstance(plan, BundlePlan)
+            assert isinstance(deploy, ArchivePath)
+            assert deploy.exists()
+            assert deploy.read_text(encoding="utf-8").startswith("CREATE TABLE")
+            assert not plan.get_revert_file(change).exists()
+            assert str(deploy) == f"{archive}:deploy/users.sql"
+
+    def test_load_missing_plan(self, tmp_path):
+        """Test a missing plan is reported."""
+        archive = tmp_path / "bundle.zip"
+        self._write(tmp_path, archive)
+
+        with BundleArchive(archive) as bundle:
+            with pytest.raises(PlanError, match="not found"):
+                bundle.load_plan(Path("other.plan"))
+
+    def test_checksum_mismatch(self, tmp_path):
+        """Test files that do not match the manifest are rejected."""
+        archive = tmp_path / "bundle.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("deploy/users.sql", "DROP TABLE users;")
+            zf.writestr(MANIFEST_FILE, f"{'0' * 64}  deploy/users.sql\n")
+
+        with BundleArchive(archive) as bundle:
+            with pytest.raises(SqlitchError, match="Checksum mismatch"):
+                bundle.read_bytes("deploy/users.sql")
+
+    def test_unsafe_member_name(self, tmp_path):
+        """Test paths outside the bundle cannot be written."""
+        writer = BundleArchiveWriter(tmp_path / "bundle.tar.gz")
+        try:
+            with pytest.raises(SqlitchError, match="Cannot store"):
+                writer.write_text(Path("../escape.sql"), "")
+        finally:
+            writer.abort()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unsupported_format(self, tmp_path):
+        """Test unknown archive suffixes are rejected."""
+        with pytest.raises(SqlitchError, match="Unsupported archive format"):
+            archive_format(tmp_path / "bundle.rar")
+
+    def test_zstd_requires_zstandard(self, tmp_path):
+        """Test .tar.zst archives need the optional zstandard package."""
+        with patch.dict(sys.modules, {"zstandard": None}):
+            with pytest.raises(SqlitchError, match="zstandard"):
+                BundleArchiveWriter(tmp_path / "bundle.tar.zst")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_zstd_round_trip(self, tmp_path):
+        """Test .tar.zst archives when zstandard is installed."""
+        pytest.importorskip("zstandard")
+        archive = tmp_path / "bundle.tar.zst"
+        self._write(tmp_path, archive)
+
+        with BundleArchive(archive) as bundle:
+            assert bundle.read_bytes("sqitch.plan").decode() == self.PLAN
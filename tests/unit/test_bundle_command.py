@@ -339,7 +339,7 @@ class TestBundleCommand:
         result = bundle_command._find_change_index(mock_plan, "nonexistent")
         assert result is None
 
-    @patch("shutil.copy2")
+    @patch("sqlitch.commands.bundle.copy_file")
     def test_copy_if_modified_new_file(
         self, mock_copy, bundle_command, temp_project_dir
     ):
@@ -365,6 +365,7 @@ class TestBundleCommand:
         with pytest.raises(SqlitchError, match="Cannot copy .* does not exist"):
             bundle_command._copy_if_modified(src, dest)
 
+    @patch("sqlitch.commands.bundle.BundleDirectory")
     @patch("sqlitch.commands.bundle.BundleCommand._bundle_config")
     @patch("sqlitch.commands.bundle.BundleCommand._bundle_plan")
     @patch("sqlitch.commands.bundle.BundleCommand._bundle_scripts")
@@ -375,6 +376,7 @@ class TestBundleCommand:
         mock_bundle_scripts,
         mock_bundle_plan,
         mock_bundle_config,
+        mock_bundle_directory,
         bundle_command,
         mock_target,
         mock_sqitch,
@@ -396,6 +398,7 @@ class TestBundleCommand:
             mock_target, Path("bundle"), None, None
         )
         mock_sqitch.info.assert_called_with("Bundling into bundle")
+        mock_bundle_directory.return_value.close.assert_called_once()
 
     def test_execute_not_initialized(self, bundle_command, mock_sqitch):
         """Test execute when not in initialized project."""
@@ -0,0 +1,84 @@
+"""
+Tests for file-backed caching utilities.
+
+This module tests file stamps and the FileStampCache used to cache parsed
+plans and configurations in long-running sqlitch processes.
+"""
+
+import os
+
+from sqlitch.utils.cache import FileStampCache, file_stamp, files_stamp
+
+
+class TestFileStamp:
+    """Test file stamp helpers."""
+
+    def test_missing_file(self, tmp_path):
+        """Test missing files have no stamp."""
+        assert file_stamp(tmp_path / "missing") is None
+
+    def test_stamp_changes_with_content(self, tmp_path):
+        """Test stamps change when a file is rewritten."""
+        path = tmp_path / "sqitch.plan"
+        path.write_text("a")
+        before = file_stamp(path)
+
+        path.write_text("abc")
+
+        assert file_stamp(path) != before
+
+    def test_files_stamp(self, tmp_path):
+        """Test combined stamps include missing files."""
+        path = tmp_path / "a"
+        path.write_text("x")
+
+        stamp = files_stamp([path, tmp_path / "b"])
+
+        assert stamp[0] == (str(path), file_stamp(path))
+        assert stamp[1] == (str(tmp_path / "b"), None)
+
+
+class TestFileStampCache:
+    """Test FileStampCache class."""
+
+    def test_value_cached_until_file_changes(self, tmp_path):
+        """Test values are reused until a source file changes."""
+        path = tmp_path / "sqitch.conf"
+        path.write_text("one")
+        cache = FileStampCache()
+        loads = []
+
+        def loader():
+            loads.append(path.read_text())
+            return path.read_text()
+
+        assert cache.get("config", [path], loader) == "one"
+        assert cache.get("config", [path], loader) == "one"
+
+        path.write_text("two")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.get("config", [path], loader) == "two"
+        assert loads == ["one", "two"]
+
+    def test_file_appearing_invalidates(self, tmp_path):
+        """Test creating a previously missing file invalidates the entry."""
+        path = tmp_path / "sqitch.conf"
+        cache = FileStampCache()
+
+        assert cache.get("config", [path], lambda: "defaults") == "defaults"
+        path.write_text("[core]")
+        assert cache.get("config", [path], lambda: "local") == "local"
+
+    def test_invalidate(self, tmp_path):
+        """Test explicit invalidation."""
+        cache = FileStampCache()
+        cache.get("a", [], lambda: 1)
+        cache.get("b", [], lambda: 2)
+
+        cache.invalidate("a")
+        assert len(cache) == 1
+
+        cache.invalidate()
+        assert len(cache) == 0
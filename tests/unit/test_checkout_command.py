@@ -16,6 +16,7 @@ from sqlitch.core.config import Config
 from sqlitch.core.exceptions import PlanError, SqlitchError
 from sqlitch.core.plan import Plan
 from sqlitch.core.sqitch import Sqitch
+from sqlitch.engines.base import snapshot_key
 from sqlitch.utils.git import VCSError
 
 
@@ -108,6 +109,7 @@ class TestCheckoutCommand:
         assert not options["verify"]
         assert not options["no_prompt"]
         assert options["prompt_accept"]
+        assert not options["snapshot"]
 
     def test_parse_args_with_options(self, checkout_command):
         """Test argument parsing with options."""
@@ -142,6 +144,13 @@ class TestCheckoutCommand:
         assert options["deploy_variables"] == {"foo": "bar", "deploy_var": "value"}
         assert options["revert_variables"] == {"foo": "bar", "revert_var": "other"}
 
+    def test_parse_args_snapshot(self, checkout_command):
+        """Test --snapshot and --no-snapshot options."""
+        assert checkout_command._parse_args(["--snapshot", "main"])["snapshot"]
+        assert not checkout_command._parse_args(
+            ["--snapshot", "--no-snapshot", "main"]
+        )["snapshot"]
+
     def test_parse_args_invalid_mode(self, checkout_command):
         """Test parsing with invalid mode."""
         args = ["--mode", "invalid", "main"]
@@ -263,38 +272,46 @@ class TestCheckoutCommand:
         """Test loading plan from branch."""
         target = Mock()
         target.plan_file = Path("sqitch.plan")
+        repository = Mock()
+        repository.read_file.return_value = (
+            b"%project=test\nusers 2023-01-01T00:00:00Z Test <test@example.com> # Test"
+        )
 
         with (
-            patch("subprocess.run") as mock_run,
+            patch.object(checkout_command, "_get_repository", return_value=repository),
             patch.object(Plan, "from_string") as mock_from_string,
         ):
-            mock_run.return_value.stdout = "%project=test\nusers 2023-01-01T00:00:00Z Test <test@example.com> # Test"
-            mock_run.return_value.returncode = 0
             mock_plan = Mock(spec=Plan)
             mock_from_string.return_value = mock_plan
 
             plan = checkout_command._load_branch_plan("feature", target)
 
             assert plan == mock_plan
-            git_exe = shutil.which("git")
-            mock_run.assert_called_once_with(
-                [git_exe, "show", "feature:sqitch.plan"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            repository.read_file.assert_called_once_with("feature", "sqitch.plan")
+            assert mock_from_string.call_args[0][0].startswith("%project=test")
 
     def test_load_branch_plan_error(self, checkout_command):
         """Test error loading plan from branch."""
         target = Mock()
         target.plan_file = Path("sqitch.plan")
+        repository = Mock()
+        repository.read_file.side_effect = VCSError("git cat-file exited")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-
+        with patch.object(checkout_command, "_get_repository", return_value=repository):
             with pytest.raises(VCSError, match="Failed to load plan from branch"):
                 checkout_command._load_branch_plan("feature", target)
 
+    def test_load_branch_plan_missing(self, checkout_command):
+        """Test a plan missing from the branch."""
+        target = Mock()
+        target.plan_file = Path("sqitch.plan")
+        repository = Mock()
+        repository.read_file.return_value = None
+
+        with patch.object(checkout_command, "_get_repository", return_value=repository):
+            with pytest.raises(VCSError, match="sqitch.plan not found"):
+                checkout_command._load_branch_plan("feature", target)
+
     def test_find_last_common_change(self, checkout_command):
         """Test finding last common change."""
         # Create changes
@@ -337,6 +354,53 @@ class TestCheckoutCommand:
 
         assert last_common == change2
 
+    def test_find_last_common_change_script_differs(self, checkout_command):
+        """Test changes whose deploy blobs differ on the branch are not common."""
+        change1 = Change(
+            name="change1",
+            note="",
+            timestamp=datetime.now(timezone.utc),
+            planner_name="Test",
+            planner_email="test@example.com",
+        )
+        change2 = Change(
+            name="change2",
+            note="",
+            timestamp=datetime.now(timezone.utc),
+            planner_name="Test",
+            planner_email="test@example.com",
+        )
+        plan = Plan(file=Path("sqitch.plan"), project="test_project")
+        plan.changes = [change1, change2]
+        plan._build_indexes()
+
+        def object_info(revision, path):
+            if revision == "feature" and path in (
+                "./deploy/change2.sql",
+                "./verify/change1.sql",
+                "./revert/change1.sql",
+            ):
+                return Mock(oid="b" * 40)
+            return Mock(oid="a" * 40)
+
+        repository = Mock()
+        repository.object_info.side_effect = object_info
+
+        with (
+            patch.object(checkout_command, "_get_repository", return_value=repository),
+            patch.object(checkout_command, "info") as mock_info,
+        ):
+            last_common = checkout_command._find_last_common_change(
+                plan, plan, "feature"
+            )
+
+        # Edited revert and verify scripts leave change1 in common
+        assert last_common == change1
+        repository.object_info.assert_any_call("feature", "./deploy/change1.sql")
+        mock_info.assert_called_once_with(
+            "Deploy script for change2 differs on branch feature"
+        )
+
     def test_find_last_common_change_none(self, checkout_command):
         """Test finding last common change when none exist."""
         change1 = Change(
@@ -424,14 +488,14 @@ class TestCheckoutCommand:
         mock_run.side_effect = [
             # Get current branch
             Mock(stdout="current\n", returncode=0),
-            # Load branch plan
-            Mock(
-                stdout="%project=test\nusers 2023-01-15T10:30:00Z John Doe <john@example.com> # Add users table",
-                returncode=0,
-            ),
             # Checkout branch
             Mock(returncode=0),
         ]
+        repository = Mock()
+        repository.read_file.return_value = (
+            b"%project=test\n"
+            b"users 2023-01-15T10:30:00Z John Doe <john@example.com> # Add users table"
+        )
 
         # Mock other dependencies
         with (
@@ -440,6 +504,7 @@ class TestCheckoutCommand:
             patch.object(checkout_command, "get_target") as mock_get_target,
             patch.object(checkout_command, "_load_plan", return_value=sample_plan),
             patch.object(checkout_command, "info"),
+            patch("sqlitch.commands.checkout.GitRepository", return_value=repository),
             patch(
                 "sqlitch.engines.base.EngineRegistry.create_engine"
             ) as mock_create_engine,
@@ -450,7 +515,7 @@ class TestCheckoutCommand:
             mock_target.plan_file = Path("sqitch.plan")
             mock_get_target.return_value = mock_target
 
-            mock_engine = Mock()
+            mock_engine = MagicMock()
             mock_create_engine.return_value = mock_engine
 
             # Mock plan parsing
@@ -461,6 +526,92 @@ class TestCheckoutCommand:
             mock_engine.ensure_registry.assert_called()
             mock_engine.revert.assert_called()
             mock_engine.deploy.assert_called()
+            repository.close.assert_called_once()
+
+
+class TestCheckoutSnapshots:
+    """Test the database snapshot fast path."""
+
+    @pytest.fixture
+    def run_checkout(self, checkout_command, sample_plan):
+        """Run a checkout with mocked git and engine, returning the engine."""
+
+        def run(has_snapshot):
+            engine = MagicMock()
+            engine.supports_snapshots = True
+            engine.has_snapshot.return_value = has_snapshot
+            engine.get_deployed_changes.return_value = ["id1"]
+            with (
+                patch.object(checkout_command, "require_initialized"),
+                patch.object(checkout_command, "validate_user_info"),
+                patch.object(checkout_command, "get_target"),
+                patch.object(
+                    checkout_command, "_get_current_branch", return_value="main"
+                ),
+                patch.object(checkout_command, "_load_plan", return_value=sample_plan),
+                patch.object(
+                    checkout_command, "_load_branch_plan", return_value=sample_plan
+                ),
+                patch.object(
+                    checkout_command,
+                    "_find_last_common_change",
+                    return_value=sample_plan.changes[0],
+                ),
+                patch.object(checkout_command, "_checkout_branch") as mock_checkout,
+                patch.object(checkout_command, "info"),
+                patch(
+                    "sqlitch.engines.base.EngineRegistry.create_engine",
+                    return_value=engine,
+                ),
+            ):
+                result = checkout_command.execute(["--snapshot", "feature"])
+            assert result == 0
+            mock_checkout.assert_called_once_with("feature")
+            return engine
+
+        return run
+
+    def test_restores_known_state(self, run_checkout, sample_plan):
+        """Test a snapshot of the branch's state replaces revert and deploy."""
+        engine = run_checkout(has_snapshot=True)
+
+        key = snapshot_key([sample_plan.changes[0].id])
+        engine.has_snapshot.assert_called_once_with(key)
+        engine.restore_snapshot.assert_called_once_with(key)
+        engine.save_snapshot.assert_called_once_with(snapshot_key(["id1"]))
+        engine.revert.assert_not_called()
+        engine.deploy.assert_not_called()
+
+        # The snapshot is saved and restored under the target's deploy lock
+        calls = [name for name, _, _ in engine.mock_calls]
+        assert calls.index("lock_destination().__enter__") < calls.index(
+            "save_snapshot"
+        )
+        assert calls.index("restore_snapshot") < calls.index(
+            "lock_destination().__exit__"
+        )
+
+    def test_saves_new_state(self, run_checkout):
+        """Test snapshots are saved before reverting and after deploying."""
+        engine = run_checkout(has_snapshot=False)
+
+        engine.revert.assert_called_once()
+        engine.deploy.assert_called_once()
+        engine.restore_snapshot.assert_not_called()
+        assert engine.save_snapshot.call_count == 2
+
+    def test_revert_and_deploy_hold_lock(self, run_checkout, sample_plan):
+        """Test the revert and deploy run under the target's deploy lock."""
+        engine = run_checkout(has_snapshot=False)
+
+        calls = [name for name, _, _ in engine.mock_calls]
+        assert calls.index("lock_destination().__enter__") < calls.index("revert")
+        assert calls.index("deploy") < calls.index("lock_destination().__exit__")
+        saves = [i for i, name in enumerate(calls) if name == "save_snapshot"]
+        assert calls.index("lock_destination().__enter__") < saves[0]
+        assert saves[-1] < calls.index("lock_destination().__exit__")
+        engine.lock_destination.assert_called_once()
+        assert engine.plan is sample_plan
 
 
 class TestCheckoutCommandIntegration:
@@ -1,5 +1,6 @@
 """Unit tests for the CLI module."""
 
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -10,6 +11,7 @@ from click.testing import CliRunner
 
 from sqlitch.cli import (
     CliContext,
+    LazyGroup,
     cli,
     create_command_wrapper,
     format_command_error,
@@ -24,6 +26,9 @@ from sqlitch.core.config import Config
 from sqlitch.core.exceptions import ConfigurationError, SqlitchError
 from sqlitch.core.sqitch import Sqitch
 
+# Budget for `import sqlitch.cli` as reported by `python -X importtime`
+IMPORT_TIME_BUDGET_MS = 250
+
 
 class TestCliContext:
     """Test the CliContext class."""
@@ -202,6 +207,29 @@ class TestCliCommand:
         assert result.exit_code == 0
         assert "sqlitch, version 1.0.0" in result.output
 
+    def test_cli_profile_file_option(self, tmp_path):
+        """Test --profile-file profiles the subcommand and writes stats."""
+        profile_file = tmp_path / "sqlitch.prof"
+
+        runner = CliRunner()
+
+        result = runner.invoke(
+            cli, ["--profile-file", str(profile_file), "config", "--help"]
+        )
+
+        assert result.exit_code == 0
+        assert profile_file.exists()
+
+    def test_cli_profile_without_subcommand(self):
+        """Test --profile is ignored when no subcommand is given."""
+        runner = CliRunner()
+
+        with patch("sqlitch.utils.profiling.CommandProfiler") as mock_profiler:
+            result = runner.invoke(cli, ["--profile"])
+
+        assert result.exit_code == 0
+        mock_profiler.assert_not_called()
+
     def test_cli_nonexistent_config_file(self, tmp_path):
         """Test CLI with nonexistent config file."""
         nonexistent = tmp_path / "nonexistent.conf"
@@ -465,15 +493,58 @@ class TestCommandRegistration:
 
     def test_cli_has_registered_commands(self):
         """Test that CLI has some registered commands."""
-        # Check that the CLI group has commands registered
-        assert len(cli.commands) > 0
+        ctx = click.Context(cli)
+
+        # Check that the CLI group lists commands
+        assert len(cli.list_commands(ctx)) > 0
 
         # Check for some expected commands (these should be available)
         expected_commands = ["init", "deploy", "revert", "status", "config"]
 
         for cmd_name in expected_commands:
-            if cmd_name in cli.commands:
-                assert isinstance(cli.commands[cmd_name], click.Command)
+            assert cmd_name in cli.list_commands(ctx)
+            assert isinstance(cli.get_command(ctx, cmd_name), click.Command)
+
+    def test_lazy_command_unavailable(self):
+        """Test that lazy commands whose module fails to import are skipped."""
+        group = LazyGroup(lazy_commands={"broken": ".commands.missing:command"})
+        ctx = click.Context(group)
+
+        assert "broken" in group.list_commands(ctx)
+        assert group.get_command(ctx, "broken") is None
+
+    def test_import_does_not_load_commands(self):
+        """Test that importing the CLI does not import commands or engines."""
+        code = (
+            "import sys, sqlitch.cli; "
+            "print(','.join(m for m in sys.modules if m.startswith("
+            "('sqlitch.commands.', 'sqlitch.engines.', 'jinja2'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == ""
+
+    @pytest.mark.benchmark
+    def test_import_time_budget(self):
+        """Test that importing the CLI stays within the startup budget."""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import sqlitch.cli"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Lines look like 'import time: self [us] | cumulative | imported package'
+        cumulative_us = None
+        for line in result.stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == "sqlitch.cli":
+                cumulative_us = int(fields[1])
+
+        assert cumulative_us is not None
+        assert cumulative_us / 1000 < IMPORT_TIME_BUDGET_MS
 
 
 class TestCliIntegration:
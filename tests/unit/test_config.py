@@ -350,6 +350,53 @@ verbosity = not_a_number
         assert "engine = mysql" in content
         assert "name = Test User" in content
 
+    def test_get_memoized_until_set(self, tmp_path):
+        """Test memoized lookups are invalidated by set()."""
+        config_file = tmp_path / "test.conf"
+        config_file.write_text("[core]\nengine = pg\n")
+        config = Config(config_files=[config_file])
+
+        assert config.get("core.engine") == "pg"
+        assert config.get("core.engine") == "pg"
+
+        config.set("core.engine", "sqlite", filename=tmp_path / "other.conf")
+
+        assert config.get("core.engine") == "sqlite"
+
+    def test_sources_loaded_lazily(self, tmp_path):
+        """Test configuration files are not read until a value is needed."""
+        config_file = tmp_path / "test.conf"
+        config_file.write_text("[core]\nengine = pg\n")
+
+        with patch.object(Config, "_load_config_file") as mock_load:
+            Config(config_files=[config_file])
+
+        mock_load.assert_not_called()
+
+    def test_invalid_file_reported_on_first_use(self, tmp_path):
+        """Test syntax errors surface when the configuration is first used."""
+        config_file = tmp_path / "test.conf"
+        config_file.write_text("[core\nengine = pg\n")
+        config = Config(config_files=[config_file])
+
+        with pytest.raises(ConfigurationError):
+            config.get("core.engine")
+
+    def test_parsed_files_shared_between_instances(self, tmp_path):
+        """Test parsed files are cached until they change on disk."""
+        config_file = tmp_path / "test.conf"
+        config_file.write_text("[core]\nengine = pg\n")
+
+        first = Config(config_files=[config_file])
+        second = Config(config_files=[config_file])
+        assert first._sources[0].parser is second._sources[0].parser
+
+        config_file.write_text("[core]\nengine = sqlite\n")
+        third = Config(config_files=[config_file])
+
+        assert third._sources[0].parser is not first._sources[0].parser
+        assert third.get("core.engine") == "sqlite"
+
     def test_set_invalid_key(self, tmp_path):
         """Test setting value with invalid key."""
         config_file = tmp_path / "sqitch.conf"
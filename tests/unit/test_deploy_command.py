@@ -20,6 +20,7 @@ from sqlitch.core.plan import Plan
 from sqlitch.core.sqitch import Sqitch
 from sqlitch.core.target import Target
 from sqlitch.core.types import URI, ChangeStatus
+from sqlitch.utils.bundle import BundleArchiveWriter
 
 
 @pytest.fixture
@@ -99,7 +100,7 @@ def sample_plan():
 @pytest.fixture
 def mock_engine():
     """Create mock database engine."""
-    engine = Mock()
+    engine = MagicMock()
     engine.ensure_registry = Mock()
     engine.get_deployed_changes = Mock(return_value=[])
     engine.deploy_change = Mock()
@@ -139,6 +140,12 @@ class TestDeployCommandArgumentParsing:
 
         assert options["plan_file"] == Path("custom.plan")
 
+    def test_parse_args_bundle(self, deploy_command):
+        """Test parsing bundle archive argument."""
+        options = deploy_command._parse_args(["--bundle", "release.tar.gz"])
+
+        assert options["bundle"] == Path("release.tar.gz")
+
     def test_parse_args_to_change(self, deploy_command):
         """Test parsing to-change argument."""
         options = deploy_command._parse_args(["--to-change", "users_table"])
@@ -259,6 +266,66 @@ class TestDeployCommandPlanLoading:
                 deploy_command._load_plan(Path("bad.plan"))
 
 
+class TestDeployCommandBundle:
+    """Test deploying from bundle archives."""
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        """Create a bundle archive with a plan and deploy script."""
+        src = tmp_path / "users.sql"
+        src.write_text("CREATE TABLE users (id INT);\n")
+        archive = tmp_path / "release.zip"
+        writer = BundleArchiveWriter(archive)
+        writer.write_text(
+            Path("sqitch.plan"),
+            "%syntax-version=1.0.0\n%project=test\n\n"
+            "users 2024-01-01T00:00:00Z Test User <test@example.com> # Users\n",
+        )
+        writer.copy(src, Path("deploy/users.sql"))
+        writer.close()
+        return archive
+
+    def test_load_bundle_plan(self, deploy_command, archive):
+        """Test the plan and its scripts are read from the archive."""
+        plan = deploy_command._load_bundle_plan(archive)
+
+        deploy_file = plan.get_deploy_file(plan.changes[0])
+        assert [c.name for c in plan.changes] == ["users"]
+        assert deploy_file.read_text(encoding="utf-8").startswith("CREATE TABLE")
+
+    def test_load_bundle_plan_missing_archive(self, deploy_command, tmp_path):
+        """Test a missing archive is reported."""
+        with pytest.raises(PlanError, match="Bundle archive not found"):
+            deploy_command._load_bundle_plan(tmp_path / "missing.zip")
+
+    def test_load_bundle_plan_missing_plan(self, deploy_command, archive):
+        """Test a plan file that is not in the archive is reported."""
+        with pytest.raises(PlanError, match="not found in"):
+            deploy_command._load_bundle_plan(archive, Path("other.plan"))
+
+    def test_execute_with_bundle_skips_project_check(
+        self, deploy_command, mock_sqitch, archive
+    ):
+        """Test deploying from a bundle does not need a local plan file."""
+        deploy_command.validate_preconditions = Mock()
+        engine = MagicMock()
+        engine.get_deployed_changes.return_value = []
+
+        with (
+            patch("sqlitch.engines.base.EngineRegistry.create_engine") as create,
+            patch.object(deploy_command, "_deploy_changes", return_value=0) as deploy,
+        ):
+            create.return_value = engine
+            result = deploy_command.execute(["--bundle", str(archive)])
+
+        assert result == 0
+        deploy_command.validate_preconditions.assert_not_called()
+        mock_sqitch.validate_user_info.assert_called_once()
+        plan = create.call_args[0][1]
+        assert plan.changes[0].name == "users"
+        assert deploy.call_args[0][1] == plan.changes
+
+
 class TestDeployCommandChangeSelection:
     """Test deploy command change selection logic."""
 
@@ -589,6 +656,69 @@ class TestDeployCommandIntegration:
         mock_sqitch.require_initialized.assert_called_once()
         mock_sqitch.validate_user_info.assert_called_once()
         mock_engine.ensure_registry.assert_called_once()
+        mock_engine.lock_destination.return_value.__enter__.assert_called_once()
+        mock_engine.set_lock_timeout.assert_not_called()
+
+    def test_execute_holds_lock_with_timeout(
+        self, deploy_command, mock_sqitch, sample_plan, mock_engine, mock_target
+    ):
+        """Test changes are deployed while holding the target's lock."""
+        mock_sqitch.get_target.return_value = mock_target
+        lock = mock_engine.lock_destination.return_value
+
+        def deploy_change(change):
+            lock.__enter__.assert_called_once()
+            lock.__exit__.assert_not_called()
+
+        mock_engine.deploy_change.side_effect = deploy_change
+
+        with (
+            patch.object(deploy_command, "_load_plan", return_value=sample_plan),
+            patch(
+                "sqlitch.engines.base.EngineRegistry.create_engine",
+                return_value=mock_engine,
+            ),
+        ):
+            result = deploy_command.execute(["--lock-timeout", "5"])
+
+        assert result == 0
+        mock_engine.set_lock_timeout.assert_called_once_with(5)
+        lock.__exit__.assert_called_once()
+
+    def test_execute_reports_slow_statements(
+        self, deploy_command, mock_sqitch, sample_plan, mock_engine, mock_target
+    ):
+        """Test slow statement threshold is applied and summarized."""
+        from sqlitch.engines.base import SlowStatement
+
+        mock_sqitch.get_target.return_value = mock_target
+        mock_sqitch.config.get.side_effect = lambda key, *args, **kwargs: (
+            250.0 if key == "core.slow_statement_ms" else None
+        )
+
+        def deploy_change(change):
+            mock_engine.slow_statements.append(
+                SlowStatement(Path("deploy/users.sql"), 4, "UPDATE users", 1200.0)
+            )
+
+        mock_engine.slow_statements = []
+        mock_engine.deploy_change.side_effect = deploy_change
+
+        with (
+            patch.object(deploy_command, "_load_plan", return_value=sample_plan),
+            patch(
+                "sqlitch.engines.base.EngineRegistry.create_engine",
+                return_value=mock_engine,
+            ),
+        ):
+            result = deploy_command.execute([])
+
+        assert result == 0
+        mock_engine.set_slow_statement_threshold.assert_called_once_with(250.0)
+        warnings = [c.args[0] for c in mock_sqitch.warn.call_args_list]
+        assert warnings[0] == "3 slow statements:"
+        assert "deploy/users.sql:4" in warnings[1]
+        assert warnings[1].strip().startswith("1200 ms")
 
     def test_execute_not_initialized(self, deploy_command, mock_sqitch):
         """Test execution when project not initialized."""
@@ -16,7 +16,14 @@ from sqlitch.core.exceptions import ConnectionError, DeploymentError, EngineErro
 from sqlitch.core.plan import Plan
 from sqlitch.core.target import Target
 from sqlitch.core.types import URI, EngineType
-from sqlitch.engines.base import Engine, EngineRegistry, RegistrySchema, register_engine
+from sqlitch.engines.base import (
+    ConnectionCache,
+    Engine,
+    EngineRegistry,
+    RegistrySchema,
+    register_engine,
+    set_connection_cache,
+)
 
 
 class MockConnection:
@@ -129,6 +136,56 @@ class TestEngineBase:
 
         assert conn.closed
 
+    def test_connection_reused_with_cache(self, test_engine):
+        """Test connections are kept open when a connection cache is set."""
+        cache = ConnectionCache()
+        set_connection_cache(cache)
+        try:
+            with test_engine.connection() as first:
+                pass
+            with test_engine.connection() as second:
+                pass
+        finally:
+            set_connection_cache(None)
+
+        assert second is first
+        assert first.rolled_back
+        assert not first.closed
+        assert len(cache) == 1
+
+        cache.close_all()
+        assert first.closed
+
+    def test_connection_not_cached_when_rollback_fails(self, test_engine):
+        """Test a connection that cannot be rolled back is closed, not cached."""
+        conn = MockConnection()
+        conn.rollback = Mock(side_effect=RuntimeError("connection lost"))
+        test_engine._create_connection = Mock(return_value=conn)
+        cache = ConnectionCache()
+        set_connection_cache(cache)
+        try:
+            with test_engine.connection():
+                pass
+        finally:
+            set_connection_cache(None)
+
+        assert conn.closed
+        assert len(cache) == 0
+
+    def test_connection_not_reused_after_error(self, test_engine):
+        """Test connections involved in a failure are closed, not cached."""
+        cache = ConnectionCache()
+        set_connection_cache(cache)
+        try:
+            with pytest.raises(ConnectionError):
+                with test_engine.connection() as conn:
+                    raise RuntimeError("query failed")
+        finally:
+            set_connection_cache(None)
+
+        assert conn.closed
+        assert len(cache) == 0
+
     def test_connection_error_handling(self, test_engine):
         """Test connection error handling."""
         # Mock _create_connection to raise exception
@@ -257,6 +314,124 @@ class TestEngineBase:
         assert mock_conn.committed
         assert len(mock_conn.executed_statements) > 0
 
+    def test_deploy_change_traced(self, test_engine, mock_plan, tmp_path):
+        """Test change deployment emits nested trace spans."""
+        import json
+
+        from sqlitch.utils.tracing import configure_tracing
+
+        change = Mock(spec=Change)
+        change.name = "test_change"
+        change.id = "abc123"
+        change.note = ""
+        change.planner_name = "Test User"
+        change.planner_email = "test@example.com"
+        change.timestamp = datetime.now(timezone.utc)
+        change.dependencies = []
+        change.tags = []
+
+        test_engine._create_connection = Mock(return_value=MockConnection())
+        test_engine._registry_exists = True
+        test_engine._calculate_script_hash = Mock(return_value="abc123hash")
+
+        trace_file = tmp_path / "trace.jsonl"
+        configure_tracing(trace_file)
+        try:
+            with patch("pathlib.Path.exists", return_value=True):
+                test_engine.deploy_change(change)
+        finally:
+            configure_tracing(None)
+
+        spans = {
+            span["name"]: span
+            for span in map(json.loads, trace_file.read_text().splitlines())
+        }
+        root = spans["engine.deploy_change"]
+        assert root["attributes"]["change"] == "test_change"
+        for name in ("engine.connect", "script.execute", "registry.write"):
+            assert spans[name]["parent_id"] == root["span_id"]
+
+    def test_execute_statement(self, test_engine):
+        """Test script statements are executed on the connection."""
+        mock_conn = MockConnection()
+
+        test_engine._execute_statement(mock_conn, "SELECT 1", Path("deploy/a.sql"))
+
+        assert mock_conn.executed_statements == [("SELECT 1", None)]
+
+    def test_slow_statement_recorded(self, test_engine):
+        """Test statements over the slow threshold are recorded."""
+        mock_conn = MockConnection()
+        test_engine.set_slow_statement_threshold(0)
+
+        test_engine._execute_statement(
+            mock_conn, "UPDATE   big\n   SET x = 1", Path("deploy/a.sql"), 3
+        )
+
+        assert len(test_engine.slow_statements) == 1
+        slow = test_engine.slow_statements[0]
+        assert slow.location == "deploy/a.sql:3"
+        assert slow.excerpt == "UPDATE big SET x = 1"
+        assert slow.elapsed_ms >= 0
+
+    def test_slow_statement_disabled_by_default(self, test_engine):
+        """Test no statements are recorded without a threshold."""
+        test_engine._execute_statement(MockConnection(), "SELECT 1")
+
+        assert test_engine.slow_statements == []
+
+    def test_slow_statement_recorded_on_failure(self, test_engine):
+        """Test failing statements are still timed."""
+        mock_conn = Mock()
+        mock_conn.execute.side_effect = RuntimeError("lock timeout")
+        test_engine.set_slow_statement_threshold(0)
+
+        with pytest.raises(RuntimeError):
+            test_engine._execute_statement(mock_conn, "LOCK TABLE t")
+
+        assert test_engine.slow_statements[0].location == "<unknown>"
+
+    def test_lock_destination_default(self, test_engine):
+        """Test engines take no deploy lock by default."""
+        test_engine.set_lock_timeout(5)
+
+        with patch.object(test_engine, "_create_connection") as create:
+            with test_engine.lock_destination():
+                pass
+
+        assert test_engine.lock_timeout == 5
+        create.assert_not_called()
+
+    def test_hold_session(self, test_engine):
+        """Test operations inside a held session share one connection."""
+        session = Mock()
+
+        with patch.object(
+            test_engine, "_create_connection", return_value=session
+        ) as create:
+            with test_engine._hold_session():
+                with test_engine.connection() as first:
+                    pass
+                with pytest.raises(ConnectionError):
+                    with test_engine.connection():
+                        raise RuntimeError("failed")
+                with test_engine.connection() as second:
+                    pass
+                session.close.assert_not_called()
+
+        create.assert_called_once()
+        assert first is second is session
+        session.rollback.assert_called_once()
+        session.close.assert_called_once()
+        assert test_engine._session is None
+
+    def test_registry_export_not_supported(self, test_engine, tmp_path):
+        """Test registry export and import are engine specific."""
+        with pytest.raises(EngineError, match="Registry export is not supported"):
+            test_engine.export_registry(tmp_path)
+        with pytest.raises(EngineError, match="Registry import is not supported"):
+            test_engine.import_registry(tmp_path)
+
     def test_revert_change(self, test_engine, mock_plan):
         """Test change revert."""
         # Create mock change
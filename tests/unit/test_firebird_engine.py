@@ -8,7 +8,7 @@ error handling specific to Firebird databases.
 
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -261,7 +261,7 @@ class TestFirebirdEngine:
 
         sql_file = Path("/tmp/test.sql")
 
-        with patch("builtins.open", mock_open(read_data=sql_content)):
+        with patch.object(Path, "read_text", return_value=sql_content):
             with patch.object(connection, "execute") as mock_execute:
                 engine._execute_sql_file(connection, sql_file)
 
@@ -286,7 +286,7 @@ class TestFirebirdEngine:
         sql_file = Path("/tmp/test.sql")
         variables = {"table_name": "users"}
 
-        with patch("builtins.open", mock_open(read_data=sql_content)):
+        with patch.object(Path, "read_text", return_value=sql_content):
             with patch.object(connection, "execute") as mock_execute:
                 engine._execute_sql_file(connection, sql_file, variables)
 
@@ -307,7 +307,9 @@ class TestFirebirdEngine:
         -- Another comment
         """
 
-        statements = engine._split_sql_statements(sql_content)
+        statements = [
+            statement for statement, _ in engine._split_statement_lines(sql_content)
+        ]
 
         expected = [
             "CREATE TABLE test (id INTEGER);",
@@ -409,11 +411,3 @@ class TestFirebirdEngine:
             exists = engine._registry_exists_in_db(connection)
 
         assert exists is False
-
-
-def mock_open(read_data=""):
-    """Create a mock for the open builtin."""
-    mock_file = MagicMock()
-    mock_file.read.return_value = read_data
-    mock_file.__enter__.return_value = mock_file
-    return MagicMock(return_value=mock_file)
@@ -146,16 +146,9 @@ class TestGitRepository:
         git_dir.mkdir()
 
         # Mock git commands
-        def side_effect(cmd, **kwargs):
-            if "rev-parse" in cmd and "--abbrev-ref" in cmd:
-                return Mock(returncode=0, stdout="main\n")
-            elif "rev-parse" in cmd and "HEAD" in cmd:
-                return Mock(returncode=0, stdout="abc123\n")
-            elif "status" in cmd and "--porcelain" in cmd:
-                return Mock(returncode=0, stdout="")
-            return Mock(returncode=1, stdout="", stderr="")
-
-        mock_run.side_effect = side_effect
+        mock_run.return_value = Mock(
+            returncode=0, stdout="# branch.oid abc123\n# branch.head main\n"
+        )
 
         repo = GitRepository(tmp_path)
         status = repo.get_status()
@@ -167,6 +160,21 @@ class TestGitRepository:
         assert not status.has_staged_changes
         assert not status.has_unstaged_changes
         assert status.untracked_files == []
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_get_status_detached_initial(self, mock_run, tmp_path):
+        """Test get_status on a detached HEAD or before the first commit."""
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        mock_run.return_value = Mock(
+            returncode=0, stdout="# branch.oid (initial)\n# branch.head (detached)\n"
+        )
+
+        status = GitRepository(tmp_path).get_status()
+
+        assert status.current_branch == "HEAD"
+        assert status.current_commit is None
 
     @patch("subprocess.run")
     def test_get_status_dirty_repository(self, mock_run, tmp_path):
@@ -175,19 +183,16 @@ class TestGitRepository:
         git_dir.mkdir()
 
         # Mock git commands
-        def side_effect(cmd, **kwargs):
-            if "rev-parse" in cmd and "--abbrev-ref" in cmd:
-                return Mock(returncode=0, stdout="feature\n")
-            elif "rev-parse" in cmd and "HEAD" in cmd:
-                return Mock(returncode=0, stdout="def456\n")
-            elif "status" in cmd and "--porcelain" in cmd:
-                return Mock(
-                    returncode=0,
-                    stdout="M  modified.txt\n A  staged.txt\n?? untracked.txt\n",
-                )
-            return Mock(returncode=1, stdout="", stderr="")
-
-        mock_run.side_effect = side_effect
+        mock_run.return_value = Mock(
+            returncode=0,
+            stdout=(
+                "# branch.oid def456\n"
+                "# branch.head feature\n"
+                "1 M. N... 100644 100644 100644 a1 b2 staged.txt\n"
+                "1 .M N... 100644 100644 100644 a1 a1 modified.txt\n"
+                "? untracked.txt\n"
+            ),
+        )
 
         repo = GitRepository(tmp_path)
         status = repo.get_status()
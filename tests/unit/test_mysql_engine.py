@@ -16,7 +16,12 @@ from sqlitch.core.exceptions import ConnectionError, DeploymentError, EngineErro
 from sqlitch.core.plan import Plan
 from sqlitch.core.target import Target
 from sqlitch.core.types import URI
-from sqlitch.engines.mysql import MySQLConnection, MySQLEngine, MySQLRegistrySchema
+from sqlitch.engines.mysql import (
+    SESSION_INIT_COMMAND,
+    MySQLConnection,
+    MySQLEngine,
+    MySQLRegistrySchema,
+)
 
 
 class TestMySQLRegistrySchema:
@@ -91,6 +96,28 @@ class TestMySQLConnection:
         assert "SQL execution failed" in str(exc_info.value)
         assert exc_info.value.engine_name == "mysql"
 
+    def test_execute_batch(self, mysql_connection, mock_pymysql_conn):
+        """Test batches are sent as one query and all results drained."""
+        cursor = mock_pymysql_conn.cursor.return_value
+        cursor.nextset.side_effect = [True, None]
+
+        mysql_connection.execute_batch(["SELECT 1", "SELECT 2"])
+
+        cursor.execute.assert_called_once_with("SELECT 1;\nSELECT 2")
+        assert cursor.nextset.call_count == 2
+
+    def test_execute_batch_error_index(self, mysql_connection, mock_pymysql_conn):
+        """Test the failing statement's position in the batch is reported."""
+        from sqlitch.engines.mysql import MySQLError
+
+        cursor = mock_pymysql_conn.cursor.return_value
+        cursor.nextset.side_effect = [True, MySQLError(1064, "syntax error")]
+
+        with pytest.raises(DeploymentError) as exc_info:
+            mysql_connection.execute_batch(["SELECT 1", "SELECT 2", "SELEC 3"])
+
+        assert exc_info.value.context["statement_index"] == 2
+
     def test_fetchone(self, mysql_connection, mock_pymysql_conn):
         """Test fetching one row."""
         result = mysql_connection.fetchone()
@@ -246,15 +273,7 @@ class TestMySQLEngine:
     def test_create_connection_success(self, mock_connect, mysql_engine):
         """Test successful connection creation."""
         mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_cursor.fetchone.return_value = {"VERSION()": "8.0.25"}
-
-        # Mock cursor context manager
-        cursor_context = Mock()
-        cursor_context.__enter__ = Mock(return_value=mock_cursor)
-        cursor_context.__exit__ = Mock(return_value=None)
-        mock_conn.cursor.return_value = cursor_context
-
+        mock_conn.get_server_info.return_value = "8.0.25"
         mock_connect.return_value = mock_conn
 
         connection = mysql_engine._create_connection()
@@ -262,45 +281,46 @@ class TestMySQLEngine:
         assert isinstance(connection, MySQLConnection)
         mock_connect.assert_called_once()
 
-        # Verify session setup calls
-        cursor_calls = mock_cursor.execute.call_args_list
-        assert any("character_set_client" in str(call) for call in cursor_calls)
-        assert any("time_zone" in str(call) for call in cursor_calls)
-        assert any("sql_mode" in str(call) for call in cursor_calls)
+        # Session settings are sent with the connection, not as extra queries
+        init_command = mock_connect.call_args.kwargs["init_command"]
+        assert init_command == SESSION_INIT_COMMAND
+        assert "character_set_client" in init_command
+        assert "time_zone" in init_command
+        assert "sql_mode" in init_command
+        mock_conn.cursor.assert_not_called()
 
     @patch("sqlitch.engines.mysql.pymysql.connect")
-    def test_create_connection_version_check_mysql(self, mock_connect, mysql_engine):
-        """Test MySQL version compatibility check."""
+    def test_create_connection_caches_version(self, mock_connect, mysql_engine):
+        """Test the server version is only checked on the first connection."""
         mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_cursor.fetchone.return_value = {"VERSION()": "5.0.95"}  # Too old
+        mock_conn.get_server_info.return_value = "10.6.12-MariaDB"
+        mock_connect.return_value = mock_conn
+
+        mysql_engine._create_connection()
+        mysql_engine._create_connection()
 
-        # Mock cursor context manager
-        cursor_context = Mock()
-        cursor_context.__enter__ = Mock(return_value=mock_cursor)
-        cursor_context.__exit__ = Mock(return_value=None)
-        mock_conn.cursor.return_value = cursor_context
+        assert mysql_engine._server_version == "10.6.12-MariaDB"
+        mock_conn.get_server_info.assert_called_once()
 
+    @patch("sqlitch.engines.mysql.pymysql.connect")
+    def test_create_connection_version_check_mysql(self, mock_connect, mysql_engine):
+        """Test MySQL version compatibility check."""
+        mock_conn = Mock()
+        mock_conn.get_server_info.return_value = "5.0.95"  # Too old
         mock_connect.return_value = mock_conn
 
         with pytest.raises(EngineError) as exc_info:
             mysql_engine._create_connection()
 
         assert "MySQL 5.1.0 or higher" in str(exc_info.value)
+        mock_conn.close.assert_called_once()
+        assert mysql_engine._server_version is None
 
     @patch("sqlitch.engines.mysql.pymysql.connect")
     def test_create_connection_version_check_mariadb(self, mock_connect, mysql_engine):
         """Test MariaDB version compatibility check."""
         mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_cursor.fetchone.return_value = {"VERSION()": "5.2.14-MariaDB"}  # Too old
-
-        # Mock cursor context manager
-        cursor_context = Mock()
-        cursor_context.__enter__ = Mock(return_value=mock_cursor)
-        cursor_context.__exit__ = Mock(return_value=None)
-        mock_conn.cursor.return_value = cursor_context
-
+        mock_conn.get_server_info.return_value = "5.2.14-MariaDB"  # Too old
         mock_connect.return_value = mock_conn
 
         with pytest.raises(EngineError) as exc_info:
@@ -329,7 +349,9 @@ class TestMySQLEngine:
         SELECT * FROM test;
         """
 
-        statements = mysql_engine._split_sql_statements(sql)
+        statements = [
+            statement for statement, _ in mysql_engine._split_statement_lines(sql)
+        ]
 
         assert len(statements) == 3
         assert "CREATE TABLE test" in statements[0]
@@ -348,7 +370,9 @@ class TestMySQLEngine:
         SELECT test();
         """
 
-        statements = mysql_engine._split_sql_statements(sql)
+        statements = [
+            statement for statement, _ in mysql_engine._split_statement_lines(sql)
+        ]
 
         assert len(statements) == 2
         assert "CREATE FUNCTION test()" in statements[0]
@@ -363,7 +387,9 @@ class TestMySQLEngine:
         INSERT INTO test VALUES (1);
         """
 
-        statements = mysql_engine._split_sql_statements(sql)
+        statements = [
+            statement for statement, _ in mysql_engine._split_statement_lines(sql)
+        ]
 
         assert len(statements) == 2
         assert "CREATE TABLE test" in statements[0]
@@ -378,8 +404,79 @@ class TestMySQLEngine:
 
         mysql_engine._execute_sql_file(mock_connection, sql_file)
 
-        # Should execute both statements
+        # Should send both statements in one round trip
+        mock_connection.execute_batch.assert_called_once_with(
+            ["CREATE TABLE test (id INT)", "INSERT INTO test VALUES (1)"]
+        )
+        mock_connection.execute.assert_not_called()
+
+    def test_execute_sql_file_timed_statements(self, mysql_engine, tmp_path):
+        """Test statements run one at a time when slow statements are logged."""
+        sql_file = tmp_path / "test.sql"
+        sql_file.write_text("CREATE TABLE test (id INT);\nINSERT INTO test VALUES (1);")
+        mysql_engine.set_slow_statement_threshold(1000)
+
+        mock_connection = Mock()
+
+        mysql_engine._execute_sql_file(mock_connection, sql_file)
+
         assert mock_connection.execute.call_count == 2
+        mock_connection.execute_batch.assert_not_called()
+
+    def test_execute_sql_file_batch_error_location(self, mysql_engine, tmp_path):
+        """Test a failing statement in a batch is reported by line."""
+        sql_file = tmp_path / "test.sql"
+        sql_file.write_text("SELECT 1;\nSELECT 2;\n\nSELEC 3;\nSELECT 4;\n")
+
+        mock_connection = Mock()
+        mock_connection.execute_batch.side_effect = DeploymentError(
+            "SQL execution failed: syntax error",
+            engine_name="mysql",
+            statement_index=2,
+        )
+
+        with pytest.raises(DeploymentError) as exc_info:
+            mysql_engine._execute_sql_file(mock_connection, sql_file)
+
+        assert str(exc_info.value) == (
+            f"SQL execution failed: syntax error (statement at {sql_file}:4)"
+        )
+
+    def test_execute_sql_file_batch_error_indented(self, mysql_engine, tmp_path):
+        """Test an indented multi-line statement is reported by its first line."""
+        sql_file = tmp_path / "test.sql"
+        sql_file.write_text("SELECT 1;\n\nCREATE TABLE t (\n    id INT\n);\n")
+
+        mock_connection = Mock()
+        mock_connection.execute_batch.side_effect = DeploymentError(
+            "SQL execution failed: syntax error",
+            engine_name="mysql",
+            statement_index=1,
+        )
+
+        with pytest.raises(DeploymentError) as exc_info:
+            mysql_engine._execute_sql_file(mock_connection, sql_file)
+
+        assert str(exc_info.value).endswith(f"(statement at {sql_file}:3)")
+
+    def test_batch_statements(self, mysql_engine):
+        """Test batches are split by size and around CALL statements."""
+        statements = [
+            ("SELECT 1", 1),
+            ("CALL refresh()", 2),
+            ("SELECT 2", 3),
+            ("x" * 600_000, 4),
+            ("y" * 600_000, 5),
+        ]
+
+        batches = list(mysql_engine._batch_statements(statements))
+
+        assert [[line for _, line in batch] for batch in batches] == [
+            [1],
+            [2],
+            [3, 4],
+            [5],
+        ]
 
     def test_execute_sql_file_with_variables(self, mysql_engine, tmp_path):
         """Test SQL file execution with variable substitution."""
@@ -637,11 +734,10 @@ class TestMySQLEngine:
                 assert conn == mock_connection
                 conn.execute("SELECT 1")
 
-        # Should lock tables, start transaction, and commit
+        # Should start a transaction and commit, without locking tables
         execute_calls = [call[0][0] for call in mock_connection.execute.call_args_list]
-        assert any("LOCK TABLES" in call for call in execute_calls)
         assert any("START TRANSACTION" in call for call in execute_calls)
-        assert any("UNLOCK TABLES" in call for call in execute_calls)
+        assert not any("LOCK TABLES" in call for call in execute_calls)
         mock_connection.commit.assert_called_once()
 
     def test_transaction_context_manager_failure(self, mysql_engine):
@@ -658,9 +754,41 @@ class TestMySQLEngine:
 
             with pytest.raises(DeploymentError):
                 with mysql_engine.transaction() as conn:
-                    conn.execute("USE database")
-                    conn.execute("LOCK TABLES")
                     conn.execute("INVALID SQL")  # This will fail
 
         # Should attempt rollback
         mock_connection.rollback.assert_called_once()
+
+    def test_lock_destination(self, mysql_engine):
+        """Test the advisory lock is held for the whole block."""
+        mock_connection = Mock()
+        mock_connection.fetchone.return_value = {"locked": 1}
+        mysql_engine.set_lock_timeout(5)
+
+        with patch.object(
+            mysql_engine, "_create_connection", return_value=mock_connection
+        ):
+            with mysql_engine.lock_destination():
+                mock_connection.execute.assert_called_once_with(
+                    "SELECT GET_LOCK(%(name)s, %(timeout)s) AS locked",
+                    {"name": "sqitch:test_project@sqitch_registry", "timeout": 5},
+                )
+
+        assert "RELEASE_LOCK" in mock_connection.execute.call_args[0][0]
+        mock_connection.close.assert_called_once()
+
+    def test_lock_destination_timeout(self, mysql_engine):
+        """Test waiting too long for another process's lock fails."""
+        mock_connection = Mock()
+        mock_connection.fetchone.return_value = {"locked": 0}
+        body = Mock()
+
+        with patch.object(
+            mysql_engine, "_create_connection", return_value=mock_connection
+        ):
+            with pytest.raises(EngineError, match="Timed out waiting 60 seconds"):
+                with mysql_engine.lock_destination():
+                    body()
+
+        body.assert_not_called()
+        mock_connection.close.assert_called_once()
@@ -51,6 +51,7 @@ class MockCxOracleCursor:
     def __init__(self):
         self.executed_statements = []
         self.executed_params = []
+        self.executemany_calls = []
         self.fetchone_results = []
         self.fetchall_results = []
         self.description = []
@@ -62,6 +63,9 @@ class MockCxOracleCursor:
         self.executed_params.append(params)
         return self
 
+    def executemany(self, sql, rows):
+        self.executemany_calls.append((sql, rows))
+
     def fetchone(self):
         if self.fetchone_results:
             result = self.fetchone_results.pop(0)
@@ -312,6 +316,7 @@ class TestOracleEngine:
         assert call_kwargs["user"] == "testuser"
         assert call_kwargs["password"] == "testpass"
         assert call_kwargs["encoding"] == "UTF-8"
+        assert mock_cx_oracle.connect.return_value.stmtcachesize == 50
 
     def test_create_connection_failure(self, mock_cx_oracle, target, plan):
         """Test connection creation failure."""
@@ -351,11 +356,13 @@ class TestOracleEngine:
             # Check statements executed after the initial setup
             new_statements = cursor.executed_statements[initial_count:]
 
-        # Verify statements were executed
-        # Should have executed 2 statements (CREATE and INSERT)
-        assert len(new_statements) >= 2
-        assert any("CREATE TABLE test" in stmt for stmt in new_statements)
-        assert any("INSERT INTO test" in stmt for stmt in new_statements)
+        # Verify both statements were sent in one anonymous block
+        assert new_statements == [
+            "BEGIN\n"
+            "  EXECUTE IMMEDIATE 'CREATE TABLE test (id NUMBER)';\n"
+            "  EXECUTE IMMEDIATE 'INSERT INTO test VALUES (1)';\n"
+            "END;"
+        ]
 
     def test_execute_sql_file_with_variables(
         self, mock_cx_oracle, target, plan, tmp_path
@@ -396,9 +403,10 @@ class TestOracleEngine:
         statements = engine._split_oracle_statements(sql_content)
 
         assert len(statements) == 2
-        assert "CREATE TABLE test" in statements[0]
-        assert "INSERT INTO test VALUES (1)" in statements[1]
-        assert "INSERT INTO test VALUES (2)" in statements[1]
+        assert "CREATE TABLE test" in statements[0][0]
+        assert "INSERT INTO test VALUES (1)" in statements[1][0]
+        assert "INSERT INTO test VALUES (2)" in statements[1][0]
+        assert [line for _, line in statements] == [1, 5]
 
     def test_registry_exists_in_db(self, mock_cx_oracle, target, plan):
         """Test checking if registry exists."""
@@ -557,3 +565,208 @@ class TestOracleEngine:
 
         assert len(select_statements) == 1
         assert len(insert_statements) == 0  # No INSERT should happen
+
+
+class TestOracleScriptExecution:
+    """Test running scripts in as few round trips as possible."""
+
+    def _run(self, engine, tmp_path, content):
+        sql_file = tmp_path / "deploy.sql"
+        sql_file.write_text(content)
+        conn = OracleConnection(MockCxOracleConnection())
+        engine._execute_sql_file(conn, sql_file)
+        return conn._cursor.executed_statements
+
+    def test_single_statement(self, mock_cx_oracle, target, plan, tmp_path):
+        """Test a lone statement is sent without its semicolon."""
+        engine = OracleEngine(target, plan)
+
+        statements = self._run(engine, tmp_path, "CREATE TABLE t (id NUMBER);\n")
+
+        assert statements == ["CREATE TABLE t (id NUMBER)"]
+
+    def test_plsql_unit_sent_whole(self, mock_cx_oracle, target, plan, tmp_path):
+        """Test PL/SQL units keep their semicolons and run on their own."""
+        engine = OracleEngine(target, plan)
+        procedure = "CREATE OR REPLACE PROCEDURE p AS\nBEGIN\n  NULL;\nEND;"
+
+        statements = self._run(
+            engine, tmp_path, f"CREATE TABLE t (id NUMBER);\n\n{procedure}\n/\n"
+        )
+
+        assert statements == ["CREATE TABLE t (id NUMBER)", procedure]
+
+    def test_quotes_escaped(self, mock_cx_oracle, target, plan, tmp_path):
+        """Test literals survive EXECUTE IMMEDIATE, with semicolons in them."""
+        engine = OracleEngine(target, plan)
+
+        statements = self._run(
+            engine,
+            tmp_path,
+            "INSERT INTO t VALUES ('a;b');\nINSERT INTO t VALUES ('it''s');\n",
+        )
+
+        assert statements == [
+            "BEGIN\n"
+            "  EXECUTE IMMEDIATE 'INSERT INTO t VALUES (''a;b'')';\n"
+            "  EXECUTE IMMEDIATE 'INSERT INTO t VALUES (''it''''s'')';\n"
+            "END;"
+        ]
+
+    def test_comment_before_plsql_unit(self, mock_cx_oracle, target, plan, tmp_path):
+        """Test a comment between statements does not hide a PL/SQL unit."""
+        engine = OracleEngine(target, plan)
+        procedure = "CREATE OR REPLACE PROCEDURE p AS\nBEGIN\n  NULL;\nEND;"
+
+        statements = self._run(
+            engine,
+            tmp_path,
+            f"CREATE TABLE t (x NUMBER); -- the table\n{procedure}\n/\n",
+        )
+
+        assert statements == ["CREATE TABLE t (x NUMBER)", procedure]
+
+    def test_trailing_comment_dropped(self, mock_cx_oracle, target, plan, tmp_path):
+        """Test comments after the last statement are not sent."""
+        engine = OracleEngine(target, plan)
+
+        statements = self._run(
+            engine,
+            tmp_path,
+            "CREATE TABLE t (x NUMBER);\nCREATE INDEX t_x ON t (x); -- end\n"
+            "/* done */\n",
+        )
+
+        assert statements == [
+            "BEGIN\n"
+            "  EXECUTE IMMEDIATE 'CREATE TABLE t (x NUMBER)';\n"
+            "  EXECUTE IMMEDIATE 'CREATE INDEX t_x ON t (x)';\n"
+            "END;"
+        ]
+
+    def test_queries_unbatched(self, mock_cx_oracle, target, plan, tmp_path):
+        """Test queries are not hidden inside EXECUTE IMMEDIATE."""
+        engine = OracleEngine(target, plan)
+
+        statements = self._run(
+            engine,
+            tmp_path,
+            "SELECT id FROM t WHERE 0 = 1;\nSELECT 1/COUNT(*) FROM t;\n",
+        )
+
+        assert statements == [
+            "SELECT id FROM t WHERE 0 = 1",
+            "SELECT 1/COUNT(*) FROM t",
+        ]
+
+    def test_slow_threshold_unbatched(self, mock_cx_oracle, target, plan, tmp_path):
+        """Test statements run one at a time when they are being timed."""
+        engine = OracleEngine(target, plan)
+        engine.set_slow_statement_threshold(1000)
+
+        statements = self._run(
+            engine, tmp_path, "CREATE TABLE t (id NUMBER);\nDROP TABLE u;\n"
+        )
+
+        assert statements == ["CREATE TABLE t (id NUMBER)", "DROP TABLE u"]
+
+    def test_split_statement_lines(self, mock_cx_oracle, target, plan):
+        """Test statements keep their line across comments and indentation."""
+        engine = OracleEngine(target, plan)
+        procedure = "CREATE OR REPLACE PROCEDURE p AS\nBEGIN\n  NULL;\nEND;"
+
+        statements = engine._split_statement_lines(
+            "-- tables\nCREATE TABLE t (\n    id NUMBER\n);\n\n  -- index\n"
+            f"  CREATE INDEX t_id ON t (id);\n/\n{procedure}\n/\n"
+        )
+
+        assert statements == [
+            ("CREATE TABLE t (\n    id NUMBER\n)", 2),
+            ("CREATE INDEX t_id ON t (id)", 7),
+            (procedure, 9),
+        ]
+
+    def test_block_error_names_statement(self, mock_cx_oracle, target, plan, tmp_path):
+        """Test a failing statement in a block is reported with its line."""
+        engine = OracleEngine(target, plan)
+        sql_file = tmp_path / "deploy.sql"
+        sql_file.write_text(
+            "CREATE TABLE t (id NUMBER);\nINSERT INTO\n  u VALUES (1);\n"
+            "DROP TABLE v;\n"
+        )
+        conn = OracleConnection(MockCxOracleConnection())
+        conn._cursor.execute = Mock(
+            side_effect=Exception(
+                "ORA-00942: table or view does not exist\nORA-06512: at line 3"
+            )
+        )
+
+        with pytest.raises(DeploymentError) as exc_info:
+            engine._execute_sql_file(conn, sql_file)
+
+        assert f"{sql_file}:2" in str(exc_info.value)
+        assert "Statement: INSERT INTO" in str(exc_info.value)
+
+
+class TestOracleRegistryWrites:
+    """Test registry writes for deployed and reverted changes."""
+
+    @pytest.fixture
+    def change(self):
+        """Create a change to record."""
+        return Change(
+            name="test_change",
+            note="Test change note",
+            timestamp=datetime.now(),
+            planner_name="Test Planner",
+            planner_email="planner@example.com",
+        )
+
+    def test_record_change_deployment(self, mock_cx_oracle, target, plan, change):
+        """Test change and event share a block and dependencies are arrays."""
+        engine = OracleEngine(target, plan)
+        change.dependencies = [
+            Dependency(type="require", change="users"),
+            Dependency(type="require", change="roles"),
+        ]
+        change.tags = ["v1.0"]
+        conn = OracleConnection(MockCxOracleConnection())
+
+        with patch.object(engine, "_calculate_script_hash", return_value="abc"):
+            engine._record_change_deployment(conn, change)
+
+        cursor = conn._cursor
+        assert cursor.executed_statements == []
+        (block, [params]), (dependencies, rows) = cursor.executemany_calls
+        assert "INSERT INTO testuser.changes" in block
+        assert "testuser.sqitch_array(:requires_0, :requires_1)" in block
+        assert "testuser.sqitch_array()" in block
+        assert params["script_hash"] == "abc"
+        assert params["requires_1"] == "roles"
+        assert params["tags_0"] == "v1.0"
+        assert "INSERT INTO testuser.dependencies" in dependencies
+        assert [row["dependency"] for row in rows] == ["users", "roles"]
+
+    def test_record_change_deployment_without_dependencies(
+        self, mock_cx_oracle, target, plan, change
+    ):
+        """Test a change without dependencies costs one round trip."""
+        engine = OracleEngine(target, plan)
+        conn = OracleConnection(MockCxOracleConnection())
+
+        with patch.object(engine, "_calculate_script_hash", return_value="abc"):
+            engine._record_change_deployment(conn, change)
+
+        assert len(conn._cursor.executemany_calls) == 1
+
+    def test_record_change_revert(self, mock_cx_oracle, target, plan, change):
+        """Test the delete and revert event share one block."""
+        engine = OracleEngine(target, plan)
+        conn = OracleConnection(MockCxOracleConnection())
+
+        engine._record_change_revert(conn, change)
+
+        [(block, [params])] = conn._cursor.executemany_calls
+        assert "DELETE FROM testuser.changes" in block
+        assert "VALUES ('revert', :change_id" in block
+        assert params["change_id"] == change.id
@@ -364,8 +364,38 @@ class TestPostgreSQLEngine:
 
             pg_engine._execute_sql_file(mock_conn, sql_file)
 
-            # Should execute non-comment statements
-            assert mock_conn.execute.call_count >= 2
+            # Should send the whole script in one round trip
+            mock_conn.execute.assert_called_once_with(sql_content)
+
+    def test_execute_sql_file_timed_statements(self, pg_engine):
+        """Test scripts are split when slow statements are logged."""
+        mock_conn = Mock(spec=PostgreSQLConnection)
+        sql_file = Path("/fake/test.sql")
+        sql_content = "CREATE TABLE test (id INTEGER);\nINSERT INTO test VALUES (1);\n"
+        pg_engine.set_slow_statement_threshold(1000)
+
+        with (
+            patch("pathlib.Path.exists", return_value=True),
+            patch("pathlib.Path.read_text", return_value=sql_content),
+        ):
+            pg_engine._execute_sql_file(mock_conn, sql_file)
+
+        assert mock_conn.execute.call_args_list == [
+            call("CREATE TABLE test (id INTEGER);"),
+            call("INSERT INTO test VALUES (1);"),
+        ]
+
+    def test_execute_sql_file_comments_only(self, pg_engine):
+        """Test blank scripts are not sent."""
+        mock_conn = Mock(spec=PostgreSQLConnection)
+
+        with (
+            patch("pathlib.Path.exists", return_value=True),
+            patch("pathlib.Path.read_text", return_value="\n\n"),
+        ):
+            pg_engine._execute_sql_file(mock_conn, Path("/fake/empty.sql"))
+
+        mock_conn.execute.assert_not_called()
 
     def test_execute_sql_file_with_variables(self, pg_engine):
         """Test SQL file execution with variable substitution."""
@@ -412,7 +442,9 @@ class TestPostgreSQLEngine:
         SELECT * FROM test;
         """
 
-        statements = pg_engine._split_sql_statements(sql_content)
+        statements = [
+            statement for statement, _ in pg_engine._split_statement_lines(sql_content)
+        ]
 
         # Should have 4 statements (excluding comments and empty lines)
         assert len(statements) == 4
@@ -421,6 +453,48 @@ class TestPostgreSQLEngine:
         assert "INSERT INTO test VALUES (2);" in statements
         assert "SELECT * FROM test;" in statements
 
+    def test_split_sql_statements_dollar_quotes(self, pg_engine):
+        """Test function bodies are not split on their semicolons."""
+        sql_content = """
+        CREATE FUNCTION f() RETURNS void AS $body$
+        BEGIN
+            INSERT INTO test VALUES ('$$');
+            UPDATE test SET id = 2;
+        END;
+        $body$ LANGUAGE plpgsql;
+        SELECT f();
+        """
+
+        statements = [
+            statement for statement, _ in pg_engine._split_statement_lines(sql_content)
+        ]
+
+        assert len(statements) == 2
+        assert statements[0].startswith("CREATE FUNCTION")
+        assert statements[0].endswith("$body$ LANGUAGE plpgsql;")
+        assert statements[1] == "SELECT f();"
+
+    def test_split_statement_lines_indented(self, pg_engine):
+        """Test indented multi-line statements keep their starting line."""
+        sql_content = (
+            "-- Deploy users\n"
+            "BEGIN;\n"
+            "\n"
+            "CREATE TABLE users (\n"
+            "    id SERIAL PRIMARY KEY,\n"
+            "    name TEXT NOT NULL\n"
+            ");\n"
+            "\n"
+            "CREATE INDEX users_name ON users (name);\n"
+            "\n"
+            "COMMIT;\n"
+        )
+
+        statements = pg_engine._split_statement_lines(sql_content)
+
+        assert [line for _, line in statements] == [2, 4, 9, 11]
+        assert statements[1][0].startswith("CREATE TABLE users (")
+
     def test_get_registry_version_success(self, pg_engine):
         """Test getting registry version."""
         mock_conn = Mock(spec=PostgreSQLConnection)
@@ -627,6 +701,295 @@ class TestPostgreSQLEngine:
         assert "events" in insert_call[0][0]
 
 
+class TestPostgreSQLSnapshots:
+    """Test database snapshots via template databases."""
+
+    @pytest.fixture
+    def maintenance(self, mock_psycopg2):
+        """Capture the connection used for database maintenance."""
+        conn = MockPsycopg2Connection()
+        mock_psycopg2.connect.return_value = conn
+        return conn
+
+    def _statements(self, conn):
+        return [
+            repr(sql)
+            for cursor in conn.cursors
+            for sql, _ in cursor.executed_statements
+        ]
+
+    def test_save_snapshot(self, pg_engine, mock_psycopg2, maintenance):
+        """Test snapshots clone the database as a template."""
+        pg_engine.save_snapshot("a" * 40)
+
+        assert mock_psycopg2.connect.call_args[1]["database"] == "postgres"
+        assert maintenance.autocommit is True
+        assert maintenance.closed
+        statements = self._statements(maintenance)
+        assert "DROP DATABASE IF EXISTS" in statements[0]
+        assert "CREATE DATABASE" in statements[1]
+        assert f"Identifier('testdb_snapshot_{'a' * 20}')" in statements[1]
+        assert "TEMPLATE" in statements[1]
+        assert "Identifier('testdb')" in statements[1]
+
+    def test_has_snapshot(self, pg_engine, maintenance):
+        """Test snapshot lookup in pg_database."""
+        assert not pg_engine.has_snapshot("a" * 40)
+
+        sql, params = maintenance.cursors[0].executed_statements[0]
+        assert "pg_database" in sql
+        assert params == (f"testdb_snapshot_{'a' * 20}",)
+
+    def test_restore_snapshot(self, pg_engine, maintenance):
+        """Test restores clone the snapshot before swapping databases."""
+        with patch.object(pg_engine, "has_snapshot", return_value=True):
+            pg_engine.restore_snapshot("a" * 40)
+
+        statements = self._statements(maintenance)
+        assert len(statements) == 6
+        assert "Identifier('testdb_restoring')" in statements[1]
+        assert "DROP DATABASE IF EXISTS" in statements[2]
+        assert "testdb_replaced" in statements[2]
+        assert "RENAME TO" in statements[3] and "testdb_replaced" in statements[3]
+        assert "RENAME TO" in statements[4]
+        assert "DROP DATABASE" in statements[5]
+
+    def _failing_maintenance(self, pg_engine, failing):
+        """Record maintenance statements, failing those matching a pattern."""
+        statements = []
+
+        def run(*batch, fetch=False):
+            for statement in batch:
+                statements.append(repr(statement))
+                if failing in repr(statement):
+                    raise EngineError("database is being accessed by other users")
+
+        return patch.object(pg_engine, "_run_maintenance", side_effect=run), statements
+
+    def test_restore_snapshot_renames_back(self, pg_engine):
+        """Test the original database is renamed back if the swap fails."""
+        failing = (
+            "Identifier('testdb_restoring'), SQL(' RENAME TO '), Identifier('testdb')"
+        )
+        maintenance, statements = self._failing_maintenance(pg_engine, failing)
+
+        with patch.object(pg_engine, "has_snapshot", return_value=True), maintenance:
+            with pytest.raises(EngineError, match="other users"):
+                pg_engine.restore_snapshot("a" * 40)
+
+        assert statements[-1] == (
+            "Composed([SQL('ALTER DATABASE '), Identifier('testdb_replaced'), "
+            "SQL(' RENAME TO '), Identifier('testdb')])"
+        )
+
+    def test_restore_snapshot_drop_failure_warns(self, pg_engine):
+        """Test a replaced database that cannot be dropped only warns."""
+        maintenance, statements = self._failing_maintenance(
+            pg_engine, "SQL('DROP DATABASE ')"
+        )
+
+        with (
+            patch.object(pg_engine, "has_snapshot", return_value=True),
+            maintenance,
+            patch.object(pg_engine.logger, "warning") as warning,
+        ):
+            pg_engine.restore_snapshot("a" * 40)
+
+        assert "RENAME TO" in statements[-2]
+        assert "testdb_replaced" in warning.call_args[0][0]
+
+    def test_restore_missing_snapshot(self, pg_engine, maintenance):
+        """Test restoring an unknown snapshot fails."""
+        with pytest.raises(EngineError, match="Snapshot not found"):
+            pg_engine.restore_snapshot("b" * 40)
+
+    def test_maintenance_database_not_supported(self, mock_psycopg2, mock_plan):
+        """Test the maintenance database itself cannot be snapshotted."""
+        target = Target(name="pg", uri=URI("db:pg://localhost/postgres"))
+        engine = PostgreSQLEngine(target, mock_plan)
+
+        assert not engine.supports_snapshots
+        with pytest.raises(EngineError, match="not supported"):
+            engine.save_snapshot("a" * 40)
+
+
+class TestPostgreSQLDeployLock:
+    """Test the advisory lock held during deploys and reverts."""
+
+    @pytest.fixture
+    def lock_conn(self, pg_engine):
+        """Patch the dedicated lock connection."""
+        conn = Mock(spec=PostgreSQLConnection)
+        with patch.object(pg_engine, "_create_lock_connection", return_value=conn):
+            yield conn
+
+    def test_lock_free(self, pg_engine, lock_conn):
+        """Test the lock is taken, held and released."""
+        lock_conn.fetchone.return_value = {"locked": True}
+
+        with pg_engine.lock_destination():
+            lock_conn.execute.assert_called_once_with(
+                "SELECT pg_try_advisory_lock(%(key)s) AS locked",
+                {"key": pg_engine._lock_key},
+            )
+
+        assert "pg_advisory_unlock" in lock_conn.execute.call_args[0][0]
+        lock_conn.close.assert_called_once()
+
+    def test_lock_key(self, pg_engine, mock_psycopg2, pg_target, mock_plan):
+        """Test lock keys are stable 64-bit integers per project."""
+        other_plan = Mock(spec=Plan)
+        other_plan.project_name = "other_project"
+
+        assert pg_engine._lock_key == PostgreSQLEngine(pg_target, mock_plan)._lock_key
+        assert pg_engine._lock_key != PostgreSQLEngine(pg_target, other_plan)._lock_key
+        assert -(2**63) <= pg_engine._lock_key < 2**63
+
+        other_target = Target(name="pg", uri=URI("db:pg://localhost/otherdb"))
+        other_engine = PostgreSQLEngine(other_target, mock_plan)
+        assert pg_engine._lock_key != other_engine._lock_key
+
+    def test_lock_held_outside_database(self, pg_engine, mock_psycopg2):
+        """Test the lock session does not connect to the locked database."""
+        with patch.object(pg_engine, "_try_lock", return_value=True):
+            with pg_engine.lock_destination():
+                pass
+
+        assert mock_psycopg2.connect.call_args[1]["database"] == "postgres"
+
+    def test_waits_for_lock(self, pg_engine, lock_conn, caplog):
+        """Test waiting is reported until the lock is released."""
+        lock_conn.fetchone.side_effect = [
+            {"locked": False},
+            {"locked": False},
+            {"locked": True},
+        ]
+
+        with (
+            patch("sqlitch.engines.pg.time.sleep") as sleep,
+            patch("sqlitch.engines.pg.time.monotonic", side_effect=[0, 15]),
+        ):
+            with pg_engine.lock_destination():
+                pass
+
+        assert sleep.call_count == 1
+        assert "Waiting for another instance of Sqitch" in caplog.text
+        assert "Still waiting for the deploy lock on testdb (15s of 60s)" in (
+            caplog.text
+        )
+
+    def test_lock_timeout(self, pg_engine, lock_conn):
+        """Test giving up after the lock timeout."""
+        lock_conn.fetchone.return_value = {"locked": False}
+        pg_engine.set_lock_timeout(5)
+        body = Mock()
+
+        with (
+            patch("sqlitch.engines.pg.time.sleep"),
+            patch("sqlitch.engines.pg.time.monotonic", side_effect=[0, 6]),
+        ):
+            with pytest.raises(EngineError, match="Timed out waiting 5 seconds"):
+                with pg_engine.lock_destination():
+                    body()
+
+        body.assert_not_called()
+        lock_conn.close.assert_called_once()
+
+
+class TestPostgreSQLRegistryCopy:
+    """Test registry export and import with COPY."""
+
+    TABLES = ["releases", "projects", "changes", "tags", "dependencies", "events"]
+
+    @pytest.fixture
+    def copy_conn(self, pg_engine):
+        """Patch connections with one recording COPY statements."""
+        conn = Mock(spec=PostgreSQLConnection)
+        conn.copy_expert.return_value = 3
+        context = MagicMock()
+        context.__enter__.return_value = conn
+        with (
+            patch.object(pg_engine, "connection", return_value=context),
+            patch.object(pg_engine, "transaction", return_value=context),
+            patch.object(pg_engine, "_ensure_registry"),
+        ):
+            yield conn
+
+    def _copies(self, conn):
+        return [repr(c.args[0]) for c in conn.copy_expert.call_args_list]
+
+    def test_export_csv(self, pg_engine, copy_conn, tmp_path):
+        """Test each table is copied to its own CSV file."""
+        counts = pg_engine.export_registry(tmp_path / "out")
+
+        assert list(counts) == self.TABLES
+        assert set(counts.values()) == {3}
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == sorted(
+            f"{table}.csv" for table in self.TABLES
+        )
+        copies = self._copies(copy_conn)
+        assert "Identifier('sqitch'), SQL('.'), Identifier('releases')" in copies[0]
+        assert "TO STDOUT" in copies[0] and "FORMAT csv, HEADER true" in copies[0]
+        assert "REPEATABLE READ" in copy_conn.execute.call_args[0][0]
+
+    def test_export_unknown_format(self, pg_engine, tmp_path):
+        """Test unknown formats are rejected."""
+        with pytest.raises(EngineError, match="Unknown registry format: xml"):
+            pg_engine.export_registry(tmp_path, "xml")
+
+    def _write_files(self, directory, suffix, content):
+        for table in self.TABLES:
+            (directory / f"{table}{suffix}").write_bytes(content)
+
+    def test_import_csv(self, pg_engine, copy_conn, tmp_path):
+        """Test CSV files are loaded by their header columns."""
+        self._write_files(tmp_path, ".csv", b"change_id,change\r\nabc,users\r\n")
+        copy_conn.fetchone.return_value = {"used": False}
+
+        counts = pg_engine.import_registry(tmp_path)
+
+        assert list(counts) == self.TABLES
+        statements = [repr(c.args[0]) for c in copy_conn.execute.call_args_list]
+        assert "LOCK TABLE" in statements[0]
+        assert "TRUNCATE" in statements[2]
+        copies = self._copies(copy_conn)
+        assert "Identifier('change_id'), SQL(', '), Identifier('change')" in copies[0]
+        assert "FROM STDIN" in copies[0]
+
+    def test_import_binary(self, pg_engine, copy_conn, tmp_path):
+        """Test binary files are loaded without column lists."""
+        self._write_files(tmp_path, ".pgcopy", b"PGCOPY\n")
+        copy_conn.fetchone.return_value = {"used": False}
+
+        pg_engine.import_registry(tmp_path, "binary")
+
+        assert "FORMAT binary" in self._copies(copy_conn)[-1]
+
+    def test_import_into_used_registry(self, pg_engine, copy_conn, tmp_path):
+        """Test registries with deploy history are not overwritten."""
+        self._write_files(tmp_path, ".csv", b"id\n")
+        copy_conn.fetchone.return_value = {"used": True}
+
+        with pytest.raises(EngineError, match="already records deployments"):
+            pg_engine.import_registry(tmp_path)
+
+        copy_conn.copy_expert.assert_not_called()
+
+    def test_import_missing_file(self, pg_engine, tmp_path):
+        """Test all table files are required."""
+        (tmp_path / "releases.csv").write_text("version\n")
+
+        with pytest.raises(EngineError, match="projects.csv"):
+            pg_engine.import_registry(tmp_path)
+
+    def test_import_csv_without_header(self, pg_engine, tmp_path):
+        """Test CSV files must name their columns."""
+        self._write_files(tmp_path, ".csv", b"")
+
+        with pytest.raises(EngineError, match="no header row"):
+            pg_engine.import_registry(tmp_path)
+
+
 class TestPostgreSQLEngineIntegration:
     """Integration tests for PostgreSQL engine."""
 
@@ -1,6 +1,6 @@
 """Unit tests for plan file parsing and management."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -8,7 +8,8 @@ import pytest
 
 from sqlitch.core.change import Change, Dependency, Tag
 from sqlitch.core.exceptions import PlanError
-from sqlitch.core.plan import Plan
+from sqlitch.core.plan import Plan, set_plan_cache
+from sqlitch.utils.cache import FileStampCache
 
 
 class TestDependency:
@@ -149,6 +150,29 @@ class TestChange:
 class TestPlan:
     """Test Plan class."""
 
+    def test_from_file_uses_plan_cache(self, tmp_path):
+        """Test cached plans are reused until the plan file changes."""
+        plan_file = tmp_path / "sqitch.plan"
+        plan_file.write_text(
+            "%project=myproject\n\n"
+            "users 2023-01-15T10:30:00Z John Doe <john@example.com> # Users\n"
+        )
+        set_plan_cache(FileStampCache())
+        try:
+            first = Plan.from_file(plan_file)
+            assert Plan.from_file(plan_file) is first
+
+            with open(plan_file, "a") as f:
+                f.write(
+                    "posts 2023-01-16T10:30:00Z John Doe <john@example.com> # Posts\n"
+                )
+            second = Plan.from_file(plan_file)
+        finally:
+            set_plan_cache(None)
+
+        assert second is not first
+        assert [c.name for c in second.changes] == ["users", "posts"]
+
     @pytest.mark.compatibility
     def test_parse_minimal_plan(self, tmp_path):
         """Test parsing minimal valid plan."""
@@ -535,6 +559,141 @@ users 2023-01-15T10:30:00Z John Doe <john@example.com> # Add users table
         assert reloaded_plan.changes[0].name == "users"
         assert reloaded_plan.tags[0].name == "v1.0"
 
+    def _write_commented_plan(self, plan_file):
+        """Write a plan with comments and blank lines."""
+        content = """%syntax-version=1.0.0
+%project=myproject
+
+# Schema changes
+users 2023-01-15T10:30:00Z John Doe <john@example.com> # Add users
+
+@v1.0 2023-01-16T10:30:00Z John Doe <john@example.com> # Release
+posts 2023-01-17T10:30:00Z John Doe <john@example.com> # Add posts
+"""
+        plan_file.write_text(content)
+        return content
+
+    def _new_change(self, name, day):
+        """Create a change planned on the given day of January 2023."""
+        return Change(
+            name=name,
+            note=f"Add {name}",
+            timestamp=datetime(2023, 1, day, 10, 30, 0, tzinfo=timezone.utc),
+            planner_name="John Doe",
+            planner_email="john@example.com",
+        )
+
+    def test_save_appends_new_change(self, tmp_path):
+        """Test adding a change appends a line and keeps the existing layout."""
+        plan_file = tmp_path / "sqitch.plan"
+        original = self._write_commented_plan(plan_file)
+
+        plan = Plan.from_file(plan_file)
+        change = self._new_change("comments", 18)
+        plan.add_change(change)
+        plan.save()
+
+        assert plan_file.read_text() == original + str(change) + "\n"
+        assert [c.name for c in Plan.from_file(plan_file).changes] == [
+            "users",
+            "posts",
+            "comments",
+        ]
+
+    def test_save_appends_tag_on_last_change(self, tmp_path):
+        """Test tagging the last change appends the tag line."""
+        plan_file = tmp_path / "sqitch.plan"
+        original = self._write_commented_plan(plan_file)
+
+        plan = Plan.from_file(plan_file)
+        tag = plan.create_tag(
+            "v2.0", note="Next", planner_name="J", planner_email="j@x"
+        )
+        plan.save()
+
+        assert plan_file.read_text() == original + str(tag) + "\n"
+        assert Plan.from_file(plan_file).get_tag("v2.0").change.name == "posts"
+
+    def test_save_appends_after_missing_newline(self, tmp_path):
+        """Test appending to a file without a trailing newline."""
+        plan_file = tmp_path / "sqitch.plan"
+        original = self._write_commented_plan(plan_file).rstrip("\n")
+        plan_file.write_text(original)
+
+        plan = Plan.from_file(plan_file)
+        plan.add_change(self._new_change("comments", 18))
+        plan.save()
+
+        assert len(Plan.from_file(plan_file).changes) == 3
+
+    def test_save_rewrites_tag_on_earlier_change(self, tmp_path):
+        """Test tagging an earlier change falls back to a full rewrite."""
+        plan_file = tmp_path / "sqitch.plan"
+        self._write_commented_plan(plan_file)
+
+        plan = Plan.from_file(plan_file)
+        plan.create_tag("users-only", change_name="users")
+        plan.save()
+
+        content = plan_file.read_text()
+        assert "# Schema changes" not in content
+        assert "@users-only" in content
+
+    def test_save_rewrites_when_file_changed(self, tmp_path):
+        """Test external modifications force a full rewrite."""
+        plan_file = tmp_path / "sqitch.plan"
+        self._write_commented_plan(plan_file)
+
+        plan = Plan.from_file(plan_file)
+        with open(plan_file, "a") as f:
+            f.write("# edited elsewhere\n")
+        plan.add_change(self._new_change("comments", 18))
+        plan.save()
+
+        content = plan_file.read_text()
+        assert "# edited elsewhere" not in content
+        assert [c.name for c in Plan.from_file(plan_file).changes] == [
+            "users",
+            "posts",
+            "comments",
+        ]
+
+    def test_save_without_changes_leaves_file(self, tmp_path):
+        """Test saving an unmodified plan doesn't touch the file."""
+        plan_file = tmp_path / "sqitch.plan"
+        original = self._write_commented_plan(plan_file)
+
+        Plan.from_file(plan_file).save()
+
+        assert plan_file.read_text() == original
+
+    def test_save_rewrites_edited_change(self, tmp_path):
+        """Test in-place edits to loaded changes are written."""
+        plan_file = tmp_path / "sqitch.plan"
+        self._write_commented_plan(plan_file)
+
+        plan = Plan.from_file(plan_file)
+        plan.changes[0].note = "Add user accounts"
+        plan.save()
+
+        assert Plan.from_file(plan_file).changes[0].note == "Add user accounts"
+
+    def test_save_rewrites_renamed_change_with_new_change(self, tmp_path):
+        """Test an edit is not lost when a change is also added."""
+        plan_file = tmp_path / "sqitch.plan"
+        self._write_commented_plan(plan_file)
+
+        plan = Plan.from_file(plan_file)
+        plan.changes[1].name = "articles"
+        plan.add_change(self._new_change("comments", 18))
+        plan.save()
+
+        assert [c.name for c in Plan.from_file(plan_file).changes] == [
+            "users",
+            "articles",
+            "comments",
+        ]
+
     def test_parse_plan_complex_dependencies(self, tmp_path):
         """Test parsing plan with complex dependency formats."""
         plan_file = tmp_path / "sqitch.plan"
@@ -0,0 +1,76 @@
+"""
+Tests for command profiling utilities.
+
+This module tests the cProfile-based command profiler used by the
+global --profile option.
+"""
+
+import pstats
+from io import StringIO
+
+from sqlitch.utils.profiling import CommandProfiler
+
+
+def _busy_work() -> int:
+    """Do a little work so the profiler has something to record."""
+    return sum(i * i for i in range(1000))
+
+
+class TestCommandProfiler:
+    """Test CommandProfiler class."""
+
+    def test_initial_state(self):
+        """Test profiler is inactive until started."""
+        profiler = CommandProfiler(file=StringIO())
+
+        assert not profiler.active
+        assert profiler.output is None
+        assert profiler.summary() == ""
+
+    def test_summary_written_on_stop(self):
+        """Test summary of top functions is written to the output stream."""
+        output = StringIO()
+        profiler = CommandProfiler(file=output, limit=5)
+
+        profiler.start()
+        assert profiler.active
+        _busy_work()
+        profiler.stop()
+
+        assert not profiler.active
+        report = output.getvalue()
+        assert "cumulative" in report
+        assert "_busy_work" in report
+
+    def test_writes_pstats_file(self, tmp_path):
+        """Test profile data is dumped to the requested file."""
+        output_file = tmp_path / "profiles" / "deploy.prof"
+        output = StringIO()
+
+        with CommandProfiler(output=output_file, file=output):
+            _busy_work()
+
+        assert output_file.exists()
+        stats = pstats.Stats(str(output_file))
+        assert stats.total_calls > 0
+        assert f"Profile data written to {output_file}" in output.getvalue()
+
+    def test_stop_without_start_is_noop(self):
+        """Test stopping an inactive profiler does nothing."""
+        output = StringIO()
+        profiler = CommandProfiler(file=output)
+
+        profiler.stop()
+
+        assert output.getvalue() == ""
+
+    def test_start_twice_keeps_single_profile(self):
+        """Test starting an active profiler is a no-op."""
+        profiler = CommandProfiler(file=StringIO())
+
+        profiler.start()
+        first = profiler._profile
+        profiler.start()
+
+        assert profiler._profile is first
+        profiler.stop()
@@ -334,7 +334,7 @@ change1 2023-01-01T10:00:00Z Test User <test@example.com> # First change
     def test_execute_success(self, rebase_command, sample_plan, tmp_path):
         """Test successful rebase execution."""
         # Setup mocks
-        mock_engine = Mock()
+        mock_engine = MagicMock()
         mock_engine.planned_deployed_common_ancestor_id = Mock(return_value="change1")
         mock_engine.revert = Mock()
         mock_engine.deploy = Mock()
@@ -363,10 +363,15 @@ change1 2023-01-01T10:00:00Z Test User <test@example.com> # First change
         mock_engine.revert.assert_called_once()
         mock_engine.deploy.assert_called_once()
 
+        # Revert and deploy run under the target's deploy lock
+        calls = [name for name, _, _ in mock_engine.mock_calls]
+        assert calls.index("lock_destination().__enter__") < calls.index("revert")
+        assert calls.index("deploy") < calls.index("lock_destination().__exit__")
+
     def test_execute_revert_error(self, rebase_command, sample_plan):
         """Test rebase execution with revert error."""
         # Setup mocks
-        mock_engine = Mock()
+        mock_engine = MagicMock()
         mock_engine.revert = Mock(side_effect=SqlitchError("Revert failed", exitval=2))
         rebase_command.get_engine = Mock(return_value=mock_engine)
 
@@ -465,7 +470,7 @@ posts [users] 2023-01-04T10:00:00Z Test User <test@example.com> # Add posts tabl
             command = RebaseCommand(sqitch)
 
             # Mock the engine creation and operations
-            mock_engine = Mock()
+            mock_engine = MagicMock()
             mock_engine.planned_deployed_common_ancestor_id = Mock(
                 return_value="initial"
             )
@@ -0,0 +1,122 @@
+"""
+Unit tests for the registry command.
+
+Tests argument parsing for 'sqlitch registry export|import' and that the
+command hands off to the engine's registry export and import.
+"""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sqlitch.commands.registry import RegistryCommand
+from sqlitch.core.config import Config
+from sqlitch.core.exceptions import EngineError, SqlitchError
+from sqlitch.core.sqitch import Sqitch
+
+
+@pytest.fixture
+def mock_sqitch():
+    """Create a mock Sqitch instance."""
+    sqitch = Mock(spec=Sqitch)
+    sqitch.config = Mock(spec=Config)
+    sqitch.config.get.side_effect = lambda key, default=None: default
+    sqitch.logger = Mock()
+    sqitch.verbosity = 0
+    return sqitch
+
+
+@pytest.fixture
+def registry_command(mock_sqitch):
+    """Create a RegistryCommand with target and plan loading mocked."""
+    command = RegistryCommand(mock_sqitch)
+    command.info = Mock()
+    command.error = Mock()
+    command.require_initialized = Mock()
+    command.get_target = Mock()
+    command.get_target.return_value.uri = "db:pg://localhost/app"
+    command._load_plan = Mock()
+    return command
+
+
+class TestParseArgs:
+    """Test registry argument parsing."""
+
+    def test_export(self, registry_command):
+        """Test action, directory and options."""
+        options = registry_command._parse_args(
+            ["export", "backup", "--target", "prod", "--format", "binary"]
+        )
+
+        assert options["action"] == "export"
+        assert options["directory"] == Path("backup")
+        assert options["target"] == "prod"
+        assert options["format"] == "binary"
+
+    def test_default_format(self, registry_command):
+        """Test CSV is the default format."""
+        assert registry_command._parse_args(["import", "backup"])["format"] == "csv"
+
+    @pytest.mark.parametrize(
+        "args, message",
+        [
+            ([], "must be export or import"),
+            (["copy", "backup"], "not copy"),
+            (["export"], "requires a directory"),
+            (["export", "backup", "--format", "xml"], "Unknown registry format"),
+            (["export", "a", "b"], "Unexpected argument"),
+        ],
+    )
+    def test_invalid(self, registry_command, args, message):
+        """Test invalid arguments are rejected."""
+        with pytest.raises(SqlitchError, match=message):
+            registry_command._parse_args(args)
+
+
+class TestExecute:
+    """Test running registry export and import."""
+
+    def _run(self, registry_command, args, engine):
+        with patch(
+            "sqlitch.engines.base.EngineRegistry.create_engine", return_value=engine
+        ):
+            return registry_command.execute(args)
+
+    def test_export(self, registry_command):
+        """Test exporting reports rows per table."""
+        engine = Mock()
+        engine.export_registry.return_value = {"changes": 2, "tags": 1}
+
+        result = self._run(registry_command, ["export", "backup"], engine)
+
+        assert result == 0
+        engine.export_registry.assert_called_once_with(Path("backup"), "csv")
+        registry_command.info.assert_any_call("Exported 2 rows of changes")
+        registry_command.info.assert_any_call("Exported 1 row of tags")
+
+    def test_import(self, registry_command):
+        """Test importing hands off to the engine."""
+        engine = Mock()
+        engine.import_registry.return_value = {"changes": 2}
+
+        result = self._run(
+            registry_command, ["import", "backup", "--format", "binary"], engine
+        )
+
+        assert result == 0
+        engine.import_registry.assert_called_once_with(Path("backup"), "binary")
+        registry_command.info.assert_any_call(
+            "Imported registry of db:pg://localhost/app from backup"
+        )
+
+    def test_unsupported_engine(self, registry_command):
+        """Test engines without registry export report an error."""
+        engine = Mock()
+        engine.export_registry.side_effect = EngineError(
+            "Registry export is not supported for this mysql target"
+        )
+
+        result = self._run(registry_command, ["export", "backup"], engine)
+
+        assert result != 0
@@ -554,7 +554,7 @@ class TestRevertCommandIntegration:
         # Mock all dependencies
         mock_sqitch.get_plan_file.return_value = Path("sqitch.plan")
 
-        mock_engine = Mock()
+        mock_engine = MagicMock()
         mock_engine.get_deployed_changes.return_value = [
             change.id for change in sample_changes
         ]
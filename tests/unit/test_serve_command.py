@@ -0,0 +1,242 @@
+"""
+Unit tests for serve command.
+
+Tests the JSON-RPC service used by 'sqlitch serve', including request
+validation, in-process command execution with captured output, and the
+UNIX socket server.
+"""
+
+import json
+import socket
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sqlitch.commands.serve import (
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    ServeCommand,
+    SqlitchServer,
+    SqlitchService,
+)
+from sqlitch.core import plan as plan_module
+from sqlitch.core.exceptions import SqlitchError
+from sqlitch.core.plan import Plan
+from sqlitch.core.sqitch import Sqitch
+from sqlitch.core.target import Target
+from sqlitch.core.types import URI
+from sqlitch.engines import base as engine_base
+from sqlitch.engines.sqlite import SQLiteEngine
+
+
+def _mock_sqitch():
+    """Create mock Sqitch instance."""
+    sqitch = Mock(spec=Sqitch)
+    sqitch.config = Mock()
+    sqitch.logger = Mock()
+    sqitch.verbosity = 0
+    return sqitch
+
+
+@pytest.fixture
+def service():
+    """Create a service with a mocked Sqitch instance."""
+    service = SqlitchService()
+    service.get_sqitch = Mock(return_value=_mock_sqitch())
+    yield service
+    service.stop()
+
+
+def _fake_status(self, args):
+    """Stand-in for StatusCommand.execute."""
+    print(f"status {' '.join(args)}")
+    print("warning", file=sys.stderr)
+    return 0
+
+
+class TestSqlitchService:
+    """Test JSON-RPC request handling."""
+
+    def test_ping(self, service):
+        """Test ping method."""
+        response = service.handle({"jsonrpc": "2.0", "id": 1, "method": "ping"})
+
+        assert response == {"jsonrpc": "2.0", "id": 1, "result": "pong"}
+
+    def test_invalid_request(self, service):
+        """Test requests without jsonrpc version are rejected."""
+        response = service.handle({"id": 1, "method": "ping"})
+
+        assert response["error"]["code"] == INVALID_REQUEST
+
+    def test_unknown_method(self, service):
+        """Test unknown methods are rejected."""
+        response = service.handle({"jsonrpc": "2.0", "id": 1, "method": "revert"})
+
+        assert response["error"]["code"] == METHOD_NOT_FOUND
+
+    def test_invalid_params(self, service):
+        """Test non-string arguments are rejected."""
+        response = service.handle(
+            {"jsonrpc": "2.0", "id": 1, "method": "status", "params": {"args": [1]}}
+        )
+
+        assert response["error"]["code"] == INVALID_PARAMS
+
+    def test_notification_has_no_response(self, service):
+        """Test requests without an id get no response."""
+        assert service.handle({"jsonrpc": "2.0", "method": "ping"}) is None
+
+    def test_run_command_captures_output(self, service):
+        """Test commands run in-process with captured output."""
+        with patch("sqlitch.commands.status.StatusCommand.execute", _fake_status):
+            response = service.handle(
+                {
+                    "jsonrpc": "2.0",
+                    "id": 7,
+                    "method": "status",
+                    "params": {"args": ["--target", "prod"]},
+                }
+            )
+
+        assert response["result"] == {
+            "exit_code": 0,
+            "stdout": "status --target prod\n",
+            "stderr": "warning\n",
+        }
+
+    def test_run_command_error(self, service):
+        """Test sqlitch errors become a non-zero exit code."""
+        with patch(
+            "sqlitch.commands.deploy.DeployCommand.execute",
+            side_effect=SqlitchError("boom"),
+        ):
+            result = service.call("deploy", None)
+
+        assert result["exit_code"] == 1
+        assert "boom" in result["stderr"]
+
+    def test_start_enables_caches(self):
+        """Test starting the service enables plan and connection caching."""
+        service = SqlitchService()
+        service.start()
+        try:
+            assert plan_module._plan_cache is service.plan_cache
+            assert engine_base._connection_cache is service.connection_cache
+        finally:
+            service.stop()
+
+        assert plan_module._plan_cache is None
+        assert engine_base._connection_cache is None
+
+    def test_cached_connection_rolled_back_between_requests(self, service, tmp_path):
+        """Test a cached connection holds no transaction between requests."""
+        engine = SQLiteEngine(
+            Target(name="test", uri=URI(f"db:sqlite:{tmp_path / 'test.db'}")),
+            Plan(file=tmp_path / "sqitch.plan", project="test"),
+        )
+        connection = Mock()
+        rollbacks = []
+
+        def query_status(command, args):
+            with engine.connection() as conn:
+                conn.execute("SELECT 1")
+            rollbacks.append(connection.rollback.call_count)
+            return 0
+
+        service.start()
+        with (
+            patch.object(engine, "_create_connection", return_value=connection),
+            patch("sqlitch.commands.status.StatusCommand.execute", query_status),
+        ):
+            service.call("status", None)
+            service.call("status", None)
+
+        assert rollbacks == [1, 2]
+        assert connection.execute.call_count == 2
+        connection.close.assert_not_called()
+
+    def test_sqitch_reloaded_when_config_changes(self, tmp_path, monkeypatch):
+        """Test the Sqitch instance is rebuilt when sqitch.conf changes."""
+        monkeypatch.chdir(tmp_path)
+        config_file = tmp_path / "sqitch.conf"
+        config_file.write_text("[core]\n\tengine = pg\n")
+        service = SqlitchService(config_files=[config_file])
+        service.start()
+        try:
+            first = service.get_sqitch()
+            assert service.get_sqitch() is first
+
+            config_file.write_text("[core]\n\tengine = sqlite\n")
+
+            second = service.get_sqitch()
+            assert second is not first
+            assert second.config.get("core.engine") == "sqlite"
+        finally:
+            service.stop()
+
+
+@pytest.mark.skipif(SqlitchServer is None, reason="requires UNIX sockets")
+class TestSqlitchServer:
+    """Test the UNIX socket server."""
+
+    def test_round_trip_and_shutdown(self, tmp_path, service):
+        """Test newline-delimited requests over the socket."""
+        socket_path = tmp_path / "s.sock"
+        server = SqlitchServer(socket_path, service)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(str(socket_path))
+            stream = client.makefile("rwb")
+
+            stream.write(b'{"jsonrpc": "2.0", "id": 1, "method": "ping"}\n')
+            stream.write(b"not json\n")
+            stream.write(b'{"jsonrpc": "2.0", "id": 2, "method": "shutdown"}\n')
+            stream.flush()
+
+            responses = [json.loads(stream.readline()) for _ in range(3)]
+            client.close()
+            thread.join(timeout=5)
+        finally:
+            server.server_close()
+
+        assert responses[0]["result"] == "pong"
+        assert responses[1]["error"]["code"] == -32700
+        assert responses[2]["result"] is True
+        assert not thread.is_alive()
+
+
+class TestServeCommand:
+    """Test ServeCommand argument handling."""
+
+    def test_parse_args_socket(self):
+        """Test --socket option."""
+        command = ServeCommand(_mock_sqitch())
+
+        assert command._parse_args(["--socket", "/tmp/x.sock"]) == {
+            "socket": "/tmp/x.sock"
+        }
+
+    def test_parse_args_unknown(self):
+        """Test unknown options are rejected."""
+        command = ServeCommand(_mock_sqitch())
+
+        with pytest.raises(SqlitchError):
+            command._parse_args(["--port", "80"])
+
+    def test_refuses_to_remove_regular_file(self, tmp_path):
+        """Test an existing non-socket file is not removed."""
+        command = ServeCommand(_mock_sqitch())
+        path = tmp_path / "sqlitch.sock"
+        path.write_text("data")
+
+        with pytest.raises(SqlitchError):
+            command._remove_stale_socket(Path(path))
+        assert path.exists()
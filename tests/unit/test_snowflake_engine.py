@@ -13,7 +13,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 
-from sqlitch.core.change import Change
+from sqlitch.core.change import Change, Dependency
 from sqlitch.core.exceptions import ConnectionError, DeploymentError, EngineError
 from sqlitch.core.plan import Plan
 from sqlitch.core.target import Target
@@ -100,6 +100,44 @@ class TestSnowflakeConnection:
         expected_params = [1, "test"]
         mock_cursor.execute.assert_called_once_with(expected_sql, expected_params)
 
+    def test_execute_batch(self, mock_snowflake_connection):
+        """Test statements are sent as one multi-statement request."""
+        mock_conn, mock_cursor = mock_snowflake_connection
+        mock_cursor.nextset.side_effect = [mock_cursor, None]
+        conn = SnowflakeConnection(mock_conn)
+
+        conn.execute_batch(["CREATE TABLE a (id INT)", "CREATE TABLE b (id INT)"])
+
+        mock_cursor.execute.assert_called_once_with(
+            "CREATE TABLE a (id INT);\nCREATE TABLE b (id INT)", num_statements=2
+        )
+        assert mock_cursor.nextset.call_count == 2
+
+    def test_execute_batch_with_params(self, mock_snowflake_connection):
+        """Test batch parameters are passed for client-side binding."""
+        mock_conn, mock_cursor = mock_snowflake_connection
+        mock_cursor.nextset.return_value = None
+        conn = SnowflakeConnection(mock_conn)
+
+        conn.execute_batch(["DELETE FROM a WHERE id = %(id)s", "SELECT 1"], {"id": 1})
+
+        mock_cursor.execute.assert_called_once_with(
+            "DELETE FROM a WHERE id = %(id)s;\nSELECT 1", {"id": 1}, num_statements=2
+        )
+
+    def test_execute_batch_failure(self, mock_snowflake_connection):
+        """Test a failing child statement reports its batch position."""
+        from sqlitch.engines.snowflake import SnowflakeError
+
+        mock_conn, mock_cursor = mock_snowflake_connection
+        mock_cursor.nextset.side_effect = [mock_cursor, SnowflakeError("boom")]
+        conn = SnowflakeConnection(mock_conn)
+
+        with pytest.raises(DeploymentError) as exc_info:
+            conn.execute_batch(["SELECT 1", "SELECT 2", "SELECT x"])
+
+        assert exc_info.value.context["statement_index"] == 2
+
     def test_fetchone(self, mock_snowflake_connection):
         """Test fetching one row."""
         mock_conn, mock_cursor = mock_snowflake_connection
@@ -244,6 +282,84 @@ class TestSnowflakeEngine:
         ]
         mock_cursor.execute.assert_has_calls(expected_calls)
 
+    @patch("sqlitch.engines.snowflake.snowflake")
+    def test_create_connection_keep_alive(self, mock_snowflake, engine):
+        """Test sessions are kept alive by the connector's heartbeat."""
+        mock_snowflake.connector.connect.return_value = Mock()
+
+        engine._create_connection()
+
+        kwargs = mock_snowflake.connector.connect.call_args.kwargs
+        assert kwargs["client_session_keep_alive"] is True
+
+    @patch("sqlitch.engines.snowflake.snowflake")
+    def test_create_connection_resume_not_allowed(self, mock_snowflake, engine):
+        """Test session settings are applied when the warehouse cannot resume."""
+        from sqlitch.engines.snowflake import SnowflakeError
+
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_cursor.execute.side_effect = [
+            SnowflakeError("no OPERATE"),
+            None,
+            None,
+            None,
+            None,
+        ]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_snowflake.connector.connect.return_value = mock_conn
+
+        engine._create_connection()
+
+        mock_cursor.execute.assert_any_call("ALTER SESSION SET TIMEZONE='UTC'")
+        mock_cursor.execute.assert_any_call("USE SCHEMA IDENTIFIER('sqitch')")
+
+    def test_lock_destination_reuses_session(self, engine):
+        """Test a run logs in once and shares the session."""
+        session = Mock()
+
+        with patch.object(
+            engine, "_create_connection", return_value=session
+        ) as mock_create:
+            with engine.lock_destination():
+                with engine.transaction() as first:
+                    pass
+                with engine.connection() as second:
+                    pass
+
+            mock_create.assert_called_once()
+        assert first is session
+        assert second is session
+        assert session.commit.call_count == 1
+        session.close.assert_called_once()
+        assert engine._session is None
+
+    def test_lock_destination_keeps_session_after_failure(self, engine):
+        """Test a failed change rolls back without dropping the session."""
+        session = Mock()
+
+        with patch.object(engine, "_create_connection", return_value=session):
+            with engine.lock_destination():
+                with pytest.raises(ConnectionError, match="boom"):
+                    with engine.transaction():
+                        raise RuntimeError("boom")
+
+                assert engine._session is session
+                session.rollback.assert_called()
+                session.close.assert_not_called()
+
+        session.close.assert_called_once()
+
+    def test_connection_outside_run(self, engine):
+        """Test connections outside a run are opened and closed per use."""
+        conn = Mock()
+
+        with patch.object(engine, "_create_connection", return_value=conn):
+            with engine.connection() as opened:
+                assert opened is conn
+
+        conn.close.assert_called_once()
+
     @patch("sqlitch.engines.snowflake.snowflake")
     def test_create_connection_failure(self, mock_snowflake, engine):
         """Test connection creation failure."""
@@ -274,10 +390,11 @@ class TestSnowflakeEngine:
 
             engine._execute_sql_file(mock_connection, sql_file)
 
-            # Verify SQL statements were executed
-            assert mock_connection.execute.call_count == 2
-            mock_connection.execute.assert_any_call("CREATE TABLE test (id INT);")
-            mock_connection.execute.assert_any_call("INSERT INTO test VALUES (1);")
+            # Verify SQL statements were sent in one request
+            mock_connection.execute.assert_not_called()
+            mock_connection.execute_batch.assert_called_once_with(
+                ["CREATE TABLE test (id INT)", "INSERT INTO test VALUES (1)"]
+            )
 
     def test_execute_sql_file_with_variables(self, engine):
         """Test executing SQL file with variable substitution."""
@@ -291,8 +408,118 @@ class TestSnowflakeEngine:
             engine._execute_sql_file(mock_connection, sql_file, variables)
 
             # Verify variable substitution occurred (statements are split by semicolon)
-            mock_connection.execute.assert_any_call("CREATE SCHEMA sqitch;")
-            mock_connection.execute.assert_any_call("USE WAREHOUSE testwh;")
+            mock_connection.execute_batch.assert_called_once_with(
+                ["CREATE SCHEMA sqitch", "USE WAREHOUSE testwh"]
+            )
+
+    def test_execute_sql_file_single_statement(self, engine):
+        """Test a lone statement is executed without a batch."""
+        with patch("pathlib.Path.read_text", return_value="DROP TABLE test;"):
+            mock_connection = Mock()
+
+            engine._execute_sql_file(mock_connection, Path("test.sql"))
+
+            mock_connection.execute.assert_called_once_with("DROP TABLE test;")
+            mock_connection.execute_batch.assert_not_called()
+
+    def test_execute_sql_file_put_unbatched(self, engine):
+        """Test file transfer statements are sent on their own."""
+        sql_content = (
+            "CREATE STAGE s;\nPUT file:///tmp/data.csv @s;\n"
+            "COPY INTO t FROM @s;\nDROP STAGE s;\n"
+        )
+
+        with patch("pathlib.Path.read_text", return_value=sql_content):
+            mock_connection = Mock()
+
+            engine._execute_sql_file(mock_connection, Path("test.sql"))
+
+            mock_connection.execute.assert_has_calls(
+                [call("CREATE STAGE s;"), call("PUT file:///tmp/data.csv @s;")]
+            )
+            mock_connection.execute_batch.assert_called_once_with(
+                ["COPY INTO t FROM @s", "DROP STAGE s"]
+            )
+
+    def test_execute_sql_file_with_slow_threshold(self, engine):
+        """Test statements run one at a time when they are being timed."""
+        engine.set_slow_statement_threshold(1000)
+
+        with patch("pathlib.Path.read_text", return_value="SELECT 1;\nSELECT 2;\n"):
+            mock_connection = Mock()
+
+            engine._execute_sql_file(mock_connection, Path("test.sql"))
+
+            assert mock_connection.execute.call_count == 2
+            mock_connection.execute_batch.assert_not_called()
+
+    def test_execute_sql_file_batch_failure(self, engine):
+        """Test a failing statement in a batch is reported with its line."""
+        sql_content = "SELECT 1;\nSELECT 2;\nSELECT x;\n"
+
+        with patch("pathlib.Path.read_text", return_value=sql_content):
+            mock_connection = Mock()
+            mock_connection.execute_batch.side_effect = DeploymentError(
+                "SQL execution failed: invalid identifier 'X'", statement_index=2
+            )
+
+            with pytest.raises(DeploymentError, match=r"statement at test.sql:3"):
+                engine._execute_sql_file(mock_connection, Path("test.sql"))
+
+    def test_execute_sql_file_batch_failure_indented(self, engine):
+        """Test an indented multi-line statement is reported by its first line."""
+        sql_content = "SELECT 1;\n  CREATE TABLE t (\n    id INT\n  );\n"
+
+        with patch("pathlib.Path.read_text", return_value=sql_content):
+            mock_connection = Mock()
+            mock_connection.execute_batch.side_effect = DeploymentError(
+                "SQL execution failed: syntax error", statement_index=1
+            )
+
+            with pytest.raises(DeploymentError, match=r"statement at test.sql:2"):
+                engine._execute_sql_file(mock_connection, Path("test.sql"))
+
+    def test_record_change_deployment_single_request(self, engine):
+        """Test the change, dependencies and event are written together."""
+        change = Change(
+            name="users",
+            note="Add users",
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            planner_name="Test User",
+            planner_email="test@example.com",
+            dependencies=[Dependency("require", "roles")],
+        )
+        mock_connection = Mock()
+
+        with patch.object(engine, "_calculate_script_hash", return_value="abc"):
+            engine._record_change_deployment(mock_connection, change)
+
+        mock_connection.execute.assert_not_called()
+        statements, params = mock_connection.execute_batch.call_args[0]
+        assert len(statements) == 3
+        assert "INSERT INTO changes" in statements[0]
+        assert "%(dependency_0)s" in statements[1]
+        assert "INSERT INTO events" in statements[2]
+        assert params["script_hash"] == "abc"
+        assert params["dependency_0"] == "roles"
+        assert params["event"] == "deploy"
+        assert params["requires"] == "roles"
+
+    def test_record_change_revert_single_request(self, engine, sample_change):
+        """Test the change is removed and the event written together."""
+        mock_connection = Mock()
+
+        engine._record_change_revert(mock_connection, sample_change)
+
+        mock_connection.execute.assert_not_called()
+        statements, params = mock_connection.execute_batch.call_args[0]
+        assert [statement.split()[0] for statement in statements] == [
+            "DELETE",
+            "DELETE",
+            "INSERT",
+        ]
+        assert params["event"] == "revert"
+        assert params["change_id"] == sample_change.id
 
     def test_split_sql_statements(self, engine):
         """Test splitting SQL content into statements."""
@@ -307,7 +534,9 @@ class TestSnowflakeEngine:
         DROP TABLE test;
         """
 
-        statements = engine._split_sql_statements(sql_content)
+        statements = [
+            statement for statement, _ in engine._split_statement_lines(sql_content)
+        ]
 
         expected = [
             "CREATE TABLE test (id INT);",
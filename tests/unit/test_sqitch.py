@@ -189,6 +189,26 @@ class TestSqitch:
         finally:
             config_file.unlink()
 
+    def test_tracing_from_config(self, tmp_path):
+        """Test core.trace_file enables tracing and records config loading."""
+        import json
+
+        from sqlitch.utils.tracing import configure_tracing, get_tracer
+
+        trace_file = tmp_path / "trace.jsonl"
+        config_file = tmp_path / "sqitch.conf"
+        config_file.write_text(f"[core]\ntrace_file = {trace_file}\n")
+
+        try:
+            Sqitch(config=Config([config_file]))
+
+            assert get_tracer().enabled
+            (span,) = [json.loads(line) for line in trace_file.read_text().splitlines()]
+            assert span["name"] == "config.load"
+            assert span["attributes"] == {"sources": 1}
+        finally:
+            configure_tracing(None)
+
     def test_engine_for_target_pg(self):
         """Test engine creation for PostgreSQL target."""
         config = Config()
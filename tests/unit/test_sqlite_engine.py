@@ -536,3 +536,43 @@ class TestSQLiteEngineIntegration:
         with real_engine.connection() as conn:
             version = real_engine._get_registry_version(conn)
             assert version == "1.1"
+
+    def test_snapshot_round_trip(self, real_engine, temp_db_path):
+        """Test snapshots are saved next to the database and restored."""
+        real_engine.ensure_registry()
+        with real_engine.transaction() as conn:
+            conn.execute("CREATE TABLE users (id INTEGER)")
+
+        real_engine.save_snapshot("a" * 40)
+        with real_engine.transaction() as conn:
+            conn.execute("DROP TABLE users")
+
+        snapshot = Path(f"{temp_db_path}.snapshots") / f"{'a' * 40}.db"
+        try:
+            assert real_engine.supports_snapshots
+            assert real_engine.has_snapshot("a" * 40)
+            assert not real_engine.has_snapshot("b" * 40)
+            assert snapshot.exists()
+
+            real_engine.restore_snapshot("a" * 40)
+
+            with real_engine.connection() as conn:
+                conn.execute("SELECT name FROM sqlite_master WHERE name = 'users'")
+                assert conn.fetchone() is not None
+        finally:
+            snapshot.unlink(missing_ok=True)
+            snapshot.parent.rmdir()
+
+    def test_restore_missing_snapshot(self, real_engine):
+        """Test restoring an unknown snapshot fails."""
+        with pytest.raises(EngineError, match="Snapshot not found"):
+            real_engine.restore_snapshot("b" * 40)
+
+    def test_memory_database_snapshots_unsupported(self, real_plan):
+        """Test in-memory databases cannot be snapshotted."""
+        engine = SQLiteEngine(Target(name="mem", uri="sqlite::memory:"), real_plan)
+
+        assert not engine.supports_snapshots
+        assert not engine.has_snapshot("a" * 40)
+        with pytest.raises(EngineError, match="not supported"):
+            engine.save_snapshot("a" * 40)
@@ -14,6 +14,7 @@ from sqlitch.core.config import Config
 from sqlitch.core.exceptions import EngineError, PlanError, SqlitchError
 from sqlitch.core.plan import Plan
 from sqlitch.core.sqitch import Sqitch
+from sqlitch.engines.base import RegistryStatus
 
 
 @pytest.fixture
@@ -41,7 +42,7 @@ def status_command(mock_sqitch):
     command.require_initialized = Mock()
     command.get_target = Mock()
     command._load_plan = Mock()
-    command._get_current_state = Mock()
+    command._get_status = Mock()
     return command
 
 
@@ -69,9 +70,17 @@ def mock_plan():
     change3.tags = []
 
     plan.changes = [change1, change2, change3]
+    plan.get_change.side_effect = lambda identifier: {
+        change.id: change for change in plan.changes
+    }.get(identifier)
     return plan
 
 
+def _status(state, pending=()):
+    """Create a registry status."""
+    return RegistryStatus(state=state, changes=[], tags=[], pending=list(pending))
+
+
 @pytest.fixture
 def mock_engine():
     """Create a mock engine."""
@@ -219,63 +228,36 @@ class TestStatusCommand:
                 with pytest.raises(PlanError, match="Failed to load plan file"):
                     command._load_plan()
 
-    def test_get_current_state_success(self, mock_sqitch, mock_engine):
-        """Test getting current state successfully."""
-        # Create command without mocked _get_current_state
+    def test_get_status_success(self, mock_sqitch, mock_engine):
+        """Test getting status successfully."""
+        # Create command without mocked _get_status
         command = StatusCommand(mock_sqitch)
-        command.info = Mock()
-        command.warn = Mock()
-        command.error = Mock()
-        command.debug = Mock()
-
-        expected_state = {
-            "change_id": "test_id",
-            "change": "test_change",
-            "project": "test_project",
-        }
-        mock_engine.get_current_state.return_value = expected_state
 
-        state = command._get_current_state(mock_engine)
+        expected = _status({"change_id": "test_id", "change": "test_change"})
+        mock_engine.get_status.return_value = expected
 
-        assert state == expected_state
-        mock_engine.get_current_state.assert_called_once_with(None)
+        assert command._get_status(mock_engine) is expected
+        mock_engine.get_status.assert_called_once_with(None)
 
-    def test_get_current_state_with_project(self, mock_sqitch, mock_engine):
-        """Test getting current state with specific project."""
-        # Create command without mocked _get_current_state
+    def test_get_status_with_project(self, mock_sqitch, mock_engine):
+        """Test getting status with specific project."""
         command = StatusCommand(mock_sqitch)
-        command.info = Mock()
-        command.warn = Mock()
-        command.error = Mock()
-        command.debug = Mock()
+        mock_engine.get_status.return_value = _status(None)
 
-        expected_state = {
-            "change_id": "test_id",
-            "change": "test_change",
-            "project": "custom_project",
-        }
-        mock_engine.get_current_state.return_value = expected_state
+        command._get_status(mock_engine, "custom_project")
 
-        state = command._get_current_state(mock_engine, "custom_project")
+        mock_engine.get_status.assert_called_once_with("custom_project")
 
-        assert state == expected_state
-        mock_engine.get_current_state.assert_called_once_with("custom_project")
-
-    def test_get_current_state_not_initialized(self, mock_sqitch, mock_engine):
-        """Test getting current state when database not initialized."""
-        # Create command without mocked _get_current_state
+    def test_get_status_not_initialized(self, mock_sqitch, mock_engine):
+        """Test getting status when database not initialized."""
         command = StatusCommand(mock_sqitch)
-        command.info = Mock()
-        command.warn = Mock()
-        command.error = Mock()
-        command.debug = Mock()
 
-        mock_engine.get_current_state.side_effect = Exception("Not initialized")
+        mock_engine.get_status.side_effect = Exception("Not initialized")
         mock_engine._registry_exists_in_db.return_value = False
         mock_engine._create_connection.return_value = Mock()
 
         with pytest.raises(SqlitchError, match="Database has not been initialized"):
-            command._get_current_state(mock_engine)
+            command._get_status(mock_engine)
 
     def test_emit_state_basic(self, status_command):
         """Test emitting basic state information."""
@@ -355,16 +337,14 @@ class TestStatusCommand:
 
         status_command.info.assert_any_call("Deployed: Sun, 15 Jan 2023 10:30:00 +0000")
 
-    def test_emit_changes_none(self, status_command, mock_engine):
+    def test_emit_changes_none(self, status_command):
         """Test emitting changes when none exist."""
-        mock_engine.get_current_changes.return_value = iter([])
-
-        status_command._emit_changes(mock_engine, None, {})
+        status_command._emit_changes([], {})
 
         status_command.info.assert_any_call("")
         status_command.info.assert_any_call("Changes: None.")
 
-    def test_emit_changes_single(self, status_command, mock_engine):
+    def test_emit_changes_single(self, status_command):
         """Test emitting single change."""
         changes = [
             {
@@ -374,16 +354,14 @@ class TestStatusCommand:
                 "committer_email": "john@example.com",
             }
         ]
-        mock_engine.get_current_changes.return_value = iter(changes)
-
-        status_command._emit_changes(mock_engine, None, {"date_format": "iso"})
+        status_command._emit_changes(changes, {"date_format": "iso"})
 
         status_command.info.assert_any_call("Change:")
         status_command.info.assert_any_call(
             "  test_change - 2023-01-15T10:30:00+00:00 - John Doe <john@example.com>"
         )
 
-    def test_emit_changes_multiple(self, status_command, mock_engine):
+    def test_emit_changes_multiple(self, status_command):
         """Test emitting multiple changes."""
         changes = [
             {
@@ -399,9 +377,7 @@ class TestStatusCommand:
                 "committer_email": "jane@example.com",
             },
         ]
-        mock_engine.get_current_changes.return_value = iter(changes)
-
-        status_command._emit_changes(mock_engine, None, {"date_format": "iso"})
+        status_command._emit_changes(changes, {"date_format": "iso"})
 
         status_command.info.assert_any_call("Changes:")
         # Check alignment padding
@@ -412,16 +388,14 @@ class TestStatusCommand:
             "  longer_change_name - 2023-01-16T11:30:00+00:00 - Jane Smith <jane@example.com>"
         )
 
-    def test_emit_tags_none(self, status_command, mock_engine):
+    def test_emit_tags_none(self, status_command):
         """Test emitting tags when none exist."""
-        mock_engine.get_current_tags.return_value = iter([])
-
-        status_command._emit_tags(mock_engine, None, {})
+        status_command._emit_tags([], {})
 
         status_command.info.assert_any_call("")
         status_command.info.assert_any_call("Tags: None.")
 
-    def test_emit_tags_single(self, status_command, mock_engine):
+    def test_emit_tags_single(self, status_command):
         """Test emitting single tag."""
         tags = [
             {
@@ -431,9 +405,7 @@ class TestStatusCommand:
                 "committer_email": "john@example.com",
             }
         ]
-        mock_engine.get_current_tags.return_value = iter(tags)
-
-        status_command._emit_tags(mock_engine, None, {"date_format": "iso"})
+        status_command._emit_tags(tags, {"date_format": "iso"})
 
         status_command.info.assert_any_call("Tag:")
         status_command.info.assert_any_call(
@@ -444,7 +416,7 @@ class TestStatusCommand:
         """Test emitting status when up to date."""
         state = {"change_id": "change3_id"}  # Last change in plan
 
-        status_command._emit_status(state, mock_plan, {})
+        status_command._emit_status(_status(state), mock_plan, {})
 
         status_command.info.assert_any_call("")
         status_command.info.assert_any_call("Nothing to deploy (up-to-date)")
@@ -453,7 +425,9 @@ class TestStatusCommand:
         """Test emitting status with undeployed changes."""
         state = {"change_id": "change1_id"}  # First change in plan
 
-        status_command._emit_status(state, mock_plan, {})
+        status_command._emit_status(
+            _status(state, mock_plan.changes[1:]), mock_plan, {}
+        )
 
         status_command.info.assert_any_call("")
         status_command.info.assert_any_call("Undeployed changes:")
@@ -464,7 +438,9 @@ class TestStatusCommand:
         """Test emitting status with single undeployed change."""
         state = {"change_id": "change2_id"}  # Second change in plan
 
-        status_command._emit_status(state, mock_plan, {})
+        status_command._emit_status(
+            _status(state, mock_plan.changes[2:]), mock_plan, {}
+        )
 
         status_command.info.assert_any_call("Undeployed change:")
         status_command.info.assert_any_call("  * change3")
@@ -473,7 +449,7 @@ class TestStatusCommand:
         """Test emitting status when current change not found in plan."""
         state = {"change_id": "unknown_change_id"}
 
-        status_command._emit_status(state, mock_plan, {})
+        status_command._emit_status(_status(state), mock_plan, {})
 
         status_command.warn.assert_called_once_with(
             f"Cannot find this change in {mock_plan.file}"
@@ -519,7 +495,7 @@ class TestStatusCommand:
                 "committer_name": "John Doe",
                 "committer_email": "john@example.com",
             }
-            status_command._get_current_state.return_value = current_state
+            status_command._get_status.return_value = _status(current_state)
 
             # Mock other methods
             status_command._emit_state = Mock()
@@ -531,7 +507,7 @@ class TestStatusCommand:
 
             assert result == 0
             status_command.require_initialized.assert_called_once()
-            mock_engine.ensure_registry.assert_called_once()
+            status_command._get_status.assert_called_once_with(mock_engine, None)
             status_command._emit_state.assert_called_once()
             status_command._emit_status.assert_called_once()
 
@@ -543,7 +519,7 @@ class TestStatusCommand:
             # Setup mocks
             status_command.get_target.return_value = mock_target
             status_command._load_plan.return_value = mock_plan
-            status_command._get_current_state.return_value = None
+            status_command._get_status.return_value = _status(None)
             mock_registry.create_engine.return_value = mock_engine
 
             result = status_command.execute([])
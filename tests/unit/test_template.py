@@ -2,6 +2,7 @@
 Tests for template processing functionality.
 """
 
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
@@ -15,7 +16,9 @@ from sqlitch.utils.template import (
     TemplateContext,
     TemplateEngine,
     TemplateError,
+    clear_template_cache,
     create_template_engine,
+    get_template_cache_dir,
     render_change_template,
 )
 
@@ -171,6 +174,19 @@ class TestBuiltinTemplateLoader:
         with pytest.raises(TemplateError, match="Template not found"):
             loader.get_source(None, "nonexistent.tmpl")
 
+    def test_get_source_converts_once(self):
+        """Test built-in templates are converted lazily and only once."""
+        loader = BuiltinTemplateLoader()
+
+        with patch.object(
+            loader, "_convert_tt_to_jinja2", wraps=loader._convert_tt_to_jinja2
+        ) as mock_convert:
+            first, _, _ = loader.get_source(None, "deploy/pg.tmpl")
+            second, _, _ = loader.get_source(None, "deploy/pg.tmpl")
+
+        assert first is second
+        mock_convert.assert_called_once()
+
     def test_convert_tt_to_jinja2_variables(self):
         """Test Template Toolkit to Jinja2 variable conversion."""
         loader = BuiltinTemplateLoader()
@@ -367,6 +383,77 @@ class TestTemplateEngine:
             assert "deploy/pg.tmpl" in templates  # Built-in still available
 
 
+class TestTemplateCache:
+    """Test sharing and caching of compiled templates."""
+
+    def test_environment_shared(self, tmp_path):
+        """Test engines with the same settings share one environment."""
+        clear_template_cache()
+
+        first = TemplateEngine(cache_dir=tmp_path)
+        second = TemplateEngine(cache_dir=tmp_path)
+
+        assert first.env is second.env
+
+    def test_environment_per_template_dirs(self, tmp_path):
+        """Test custom template directories get their own environment."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+
+        builtin = TemplateEngine(cache_dir=tmp_path / "cache")
+        custom = TemplateEngine([template_dir], cache_dir=tmp_path / "cache")
+
+        assert builtin.env is not custom.env
+
+    def test_bytecode_cached_on_disk(self, tmp_path):
+        """Test compiled templates are written to the cache directory."""
+        clear_template_cache()
+        cache_dir = tmp_path / "cache"
+        context = TemplateContext(project="myproject", change="add_users", engine="pg")
+
+        TemplateEngine(cache_dir=cache_dir).render_template("deploy/pg.tmpl", context)
+
+        assert list(cache_dir.iterdir())
+
+    def test_unwritable_cache_dir(self, tmp_path):
+        """Test templates still render without a usable cache directory."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        context = TemplateContext(project="myproject", change="add_users", engine="pg")
+
+        engine = TemplateEngine(cache_dir=blocker / "cache")
+
+        assert engine.env.bytecode_cache is None
+        assert "Deploy myproject:add_users" in engine.render_template(
+            "deploy/pg.tmpl", context
+        )
+
+    def test_custom_template_reloaded(self, tmp_path):
+        """Test edits to custom templates are picked up by shared environments."""
+        template_dir = tmp_path / "templates"
+        (template_dir / "deploy").mkdir(parents=True)
+        template = template_dir / "deploy" / "custom.tmpl"
+        template.write_text("one {{ change }}")
+        context = TemplateContext(project="p", change="c", engine="custom")
+
+        engine = TemplateEngine([template_dir], cache_dir=tmp_path / "cache")
+        assert engine.render_template("deploy/custom.tmpl", context) == "one c"
+
+        template.write_text("two {{ change }}!")
+        stat = template.stat()
+        os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        engine = TemplateEngine([template_dir], cache_dir=tmp_path / "cache")
+        assert engine.render_template("deploy/custom.tmpl", context) == "two c!"
+
+    def test_cache_dir_from_xdg(self, tmp_path, monkeypatch):
+        """Test the default cache directory honours XDG_CACHE_HOME."""
+        monkeypatch.setattr("sys.platform", "linux")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert get_template_cache_dir() == tmp_path / "sqlitch" / "templates"
+
+
 class TestTemplateFunctions:
     """Test module-level template functions."""
 
@@ -0,0 +1,133 @@
+"""
+Tests for tracing utilities.
+
+This module tests span nesting, JSON lines export and the global tracer
+configuration used to trace sqlitch runs.
+"""
+
+import json
+
+import pytest
+
+from sqlitch.utils.tracing import (
+    JsonLinesExporter,
+    Span,
+    Tracer,
+    configure_tracing,
+    get_tracer,
+)
+
+
+def _read_spans(path):
+    """Read exported spans from a JSON lines file."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture(autouse=True)
+def reset_tracer():
+    """Disable global tracing after each test."""
+    yield
+    configure_tracing(None)
+
+
+class TestSpan:
+    """Test Span dataclass."""
+
+    def test_duration_open_span(self):
+        """Test duration is None until the span ends."""
+        span = Span(name="test", trace_id="t", span_id="s", start_time=1.0)
+
+        assert span.duration_ms is None
+
+    def test_duration_and_dict(self):
+        """Test duration calculation and serialization."""
+        span = Span(
+            name="test", trace_id="t", span_id="s", start_time=1.0, end_time=1.5
+        )
+        span.set_attribute("change", "users")
+
+        data = span.to_dict()
+
+        assert span.duration_ms == 500.0
+        assert data["duration_ms"] == 500.0
+        assert data["attributes"] == {"change": "users"}
+        assert data["start_time"].startswith("1970-01-01T00:00:01")
+
+
+class TestTracer:
+    """Test Tracer class."""
+
+    def test_disabled_tracer_yields_none(self):
+        """Test disabled tracer records nothing."""
+        tracer = Tracer()
+
+        with tracer.span("noop") as span:
+            assert span is None
+
+        assert not tracer.enabled
+        assert tracer.current_span is None
+
+    def test_nested_spans_exported(self, tmp_path):
+        """Test nested spans record parent relationships."""
+        trace_file = tmp_path / "trace.jsonl"
+        tracer = Tracer(JsonLinesExporter(trace_file))
+
+        with tracer.span("outer", phase="deploy") as outer:
+            with tracer.span("inner") as inner:
+                assert tracer.current_span is inner
+            assert tracer.current_span is outer
+
+        spans = _read_spans(trace_file)
+        assert [s["name"] for s in spans] == ["inner", "outer"]
+        assert spans[0]["parent_id"] == spans[1]["span_id"]
+        assert spans[1]["parent_id"] is None
+        assert spans[1]["attributes"] == {"phase": "deploy"}
+        assert spans[0]["trace_id"] == spans[1]["trace_id"] == tracer.trace_id
+
+    def test_span_records_error(self, tmp_path):
+        """Test exceptions mark the span as failed and propagate."""
+        trace_file = tmp_path / "trace.jsonl"
+        tracer = Tracer(JsonLinesExporter(trace_file))
+
+        with pytest.raises(ValueError):
+            with tracer.span("failing"):
+                raise ValueError("boom")
+
+        (span,) = _read_spans(trace_file)
+        assert span["status"] == "error"
+        assert span["error"] == "boom"
+        assert tracer.current_span is None
+
+    def test_record_finished_span(self, tmp_path):
+        """Test recording a span with explicit timestamps."""
+        trace_file = tmp_path / "trace.jsonl"
+        tracer = Tracer(JsonLinesExporter(trace_file))
+
+        tracer.record("config.load", 10.0, 10.25, sources=2)
+
+        (span,) = _read_spans(trace_file)
+        assert span["name"] == "config.load"
+        assert span["duration_ms"] == 250.0
+        assert span["attributes"] == {"sources": 2}
+
+    def test_export_errors_are_ignored(self, tmp_path):
+        """Test unwritable trace files never break the traced code."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        tracer = Tracer(JsonLinesExporter(blocker / "trace.jsonl"))
+
+        with tracer.span("work"):
+            pass
+
+
+class TestGlobalTracer:
+    """Test global tracer configuration."""
+
+    def test_configure_tracing(self, tmp_path):
+        """Test configuring and disabling the global tracer."""
+        tracer = configure_tracing(tmp_path / "trace.jsonl")
+
+        assert get_tracer() is tracer
+        assert tracer.enabled
+
+        assert not configure_tracing(None).enabled
@@ -590,7 +590,9 @@ class TestVerticaEngine:
         UPDATE table SET col = 'value';
         """
 
-        statements = engine._split_sql_statements(sql_content)
+        statements = [
+            statement for statement, _ in engine._split_statement_lines(sql_content)
+        ]
 
         assert len(statements) == 3
         assert "SELECT 1;" in statements[0]
@@ -638,3 +640,53 @@ class TestVerticaEngine:
         assert "CAST(? AS VARCHAR)" in result
         assert "CAST(? AS TIMESTAMPTZ)" in result
         assert "clock_timestamp()" in result
+
+    @patch("sqlitch.engines.vertica.vertica_python")
+    def test_lock_destination(self, mock_vertica_python, mock_target, mock_plan):
+        """Test a lock session holds the registry lock and changes share a session."""
+        engine = VerticaEngine(mock_target, mock_plan)
+        engine.set_lock_timeout(30)
+        lock_conn = Mock()
+        session = Mock()
+
+        with patch.object(
+            engine, "_create_connection", side_effect=[lock_conn, session]
+        ):
+            with engine.lock_destination():
+                with engine.transaction() as first:
+                    pass
+                with engine.transaction() as second:
+                    pass
+
+                lock_conn.rollback.assert_not_called()
+
+        lock_conn.execute.assert_any_call("ALTER SESSION SET LockTimeout = 30")
+        lock_conn.execute.assert_any_call(
+            "LOCK TABLE sqitch.projects IN EXCLUSIVE MODE"
+        )
+        lock_conn.rollback.assert_called_once()
+        lock_conn.close.assert_called_once()
+        assert first is session
+        assert second is session
+        assert session.commit.call_count == 2
+        session.close.assert_called_once()
+
+    @patch("sqlitch.engines.vertica.vertica_python")
+    def test_lock_destination_timeout(
+        self, mock_vertica_python, mock_target, mock_plan
+    ):
+        """Test a lock held by another process times out."""
+        engine = VerticaEngine(mock_target, mock_plan)
+        lock_conn = Mock()
+        lock_conn.execute.side_effect = [
+            None,
+            DeploymentError("SQL execution failed: timed out", sql_state="55V03"),
+        ]
+
+        with patch.object(engine, "_create_connection", return_value=lock_conn):
+            with pytest.raises(EngineError, match="Timed out waiting 60 seconds"):
+                with engine.lock_destination():
+                    pass
+
+        lock_conn.close.assert_called_once()
+        assert engine._session is None